@@ -89,7 +89,7 @@ def install(ctx, profiles, yes, verbose):
     
     # Detect system
     system_profiler = SystemProfiler()
-    system = system_profiler.profile()
+    system = system_profiler.profile(use_cache=True)
     
     console.print(f"   ✓ {system.os_name} {system.os_version} ({system.arch})")
     console.print(f"   ✓ {system.ram_total_gb} GB RAM ({system.ram_available_gb} GB available)")
@@ -399,7 +399,7 @@ def info(profile, json):
     else:
         # Show system info
         system_profiler = SystemProfiler()
-        system = system_profiler.profile()
+        system = system_profiler.profile(use_cache=True)
         
         if json:
             import json
@@ -0,0 +1,182 @@
+"""
+Shared low-level probes for he2plus system detection.
+
+Both ``system`` and ``system_profiler`` build on these helpers so the host
+is only ever inspected through one implementation.
+"""
+
+import glob
+import os
+import platform
+import re
+import shutil
+from typing import Optional, Tuple
+
+# The host OS and machine never change for the lifetime of the process, so
+# resolve them once instead of going through uname() on every probe.
+_SYSTEM = platform.system().lower()
+_MACHINE = platform.machine().lower()
+
+
+def _read_small(path: str, size: int = 4096) -> bytes:
+    """Read up to ``size`` bytes of a small procfs/sysfs/etc file unbuffered."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _find_field(data: bytes, key: bytes, sep: bytes) -> Optional[str]:
+    """Return the value of the first ``key<sep>value`` line in ``data``."""
+    idx = data.find(key)
+    if idx == -1:
+        return None
+    end = data.find(b"\n", idx)
+    line = data[idx:end] if end != -1 else data[idx:]
+    _, found, value = line.partition(sep)
+    if not found:
+        return None
+    return value.strip().decode("utf-8", "replace")
+
+
+def _linux_meminfo() -> Optional[Tuple[int, int]]:
+    """Return (total, available) bytes from /proc/meminfo, or None."""
+    # MemTotal and MemAvailable are the first and third lines, so the head
+    # of the file is enough.
+    try:
+        data = _read_small("/proc/meminfo", 256)
+    except OSError:
+        return None
+    
+    total = _find_field(data, b"MemTotal", b":")
+    available = _find_field(data, b"MemAvailable", b":")
+    if not total or not available:
+        return None
+    try:
+        return int(total.split()[0]) * 1024, int(available.split()[0]) * 1024
+    except (ValueError, IndexError):
+        return None
+
+
+def _disk_usage(path: str) -> Tuple[int, int]:
+    """Return (total, free) bytes for the filesystem holding ``path``."""
+    if hasattr(os, "statvfs"):
+        st = os.statvfs(path)
+        return st.f_blocks * st.f_frsize, st.f_bavail * st.f_frsize
+    # Windows - shutil goes straight to GetDiskFreeSpaceExW
+    usage = shutil.disk_usage(path)
+    return usage.total, usage.free
+
+
+# PCI vendor ids as exposed in /sys/class/drm/card*/device/vendor
+_PCI_GPU_VENDORS = {
+    "0x10de": "NVIDIA",
+    "0x1002": "AMD",
+    "0x8086": "Intel",
+}
+
+
+# GPU vendor keywords, matched in a single pass over a GPU name
+_GPU_VENDOR_RE = re.compile(r"NVIDIA|AMD|Radeon|Intel|Apple|\bM[1-9]\b", re.IGNORECASE)
+_GPU_VENDOR_MAP = {
+    "NVIDIA": "NVIDIA",
+    "AMD": "AMD",
+    "RADEON": "AMD",
+    "INTEL": "Intel",
+    "APPLE": "Apple",
+}
+
+
+def _match_gpu_vendor(text: str) -> Optional[str]:
+    """Return NVIDIA, AMD, Intel or Apple for the first vendor keyword in text."""
+    match = _GPU_VENDOR_RE.search(text)
+    if match is None:
+        return None
+    # Anything not in the map is an Apple Silicon chip name (M1, M2, ...)
+    return _GPU_VENDOR_MAP.get(match.group(0).upper(), "Apple")
+
+
+def _linux_gpu_vendor() -> Optional[str]:
+    """Return the GPU vendor from sysfs without forking lspci."""
+    for path in sorted(glob.glob("/sys/class/drm/card[0-9]*/device/vendor")):
+        try:
+            vendor_id = _read_small(path, 16).strip().decode("ascii", "replace").lower()
+        except OSError:
+            continue
+        if vendor_id in _PCI_GPU_VENDORS:
+            return _PCI_GPU_VENDORS[vendor_id]
+    return None
+
+
+def _nvml_gpu_name() -> Optional[str]:
+    """Return the first NVIDIA GPU name through NVML without forking nvidia-smi."""
+    try:
+        import pynvml
+    except ImportError:
+        return None
+    
+    try:
+        pynvml.nvmlInit()
+        try:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            name = pynvml.nvmlDeviceGetName(handle)
+        finally:
+            pynvml.nvmlShutdown()
+    except Exception:
+        return None
+    
+    # Older bindings return bytes, newer ones str
+    if isinstance(name, bytes):
+        name = name.decode("utf-8", "replace")
+    return name.strip() or None
+
+
+def _windows_gpu_name() -> Optional[str]:
+    """Return the primary display adapter name via EnumDisplayDevicesW."""
+    import ctypes
+    from ctypes import wintypes
+
+    class DISPLAY_DEVICEW(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("DeviceName", wintypes.WCHAR * 32),
+            ("DeviceString", wintypes.WCHAR * 128),
+            ("StateFlags", wintypes.DWORD),
+            ("DeviceID", wintypes.WCHAR * 128),
+            ("DeviceKey", wintypes.WCHAR * 128),
+        ]
+
+    DISPLAY_DEVICE_PRIMARY_DEVICE = 0x4
+    enum_display_devices = ctypes.windll.user32.EnumDisplayDevicesW
+
+    first_name = None
+    index = 0
+    device = DISPLAY_DEVICEW()
+    device.cb = ctypes.sizeof(device)
+    while enum_display_devices(None, index, ctypes.byref(device), 0):
+        if device.DeviceString:
+            if device.StateFlags & DISPLAY_DEVICE_PRIMARY_DEVICE:
+                return device.DeviceString
+            first_name = first_name or device.DeviceString
+        index += 1
+    return first_name
+
+
+def _sysctl_string(name: str) -> Optional[str]:
+    """Read a string sysctl on macOS through libc instead of forking sysctl."""
+    try:
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"))
+        size = ctypes.c_size_t(0)
+        key = name.encode()
+        if libc.sysctlbyname(key, None, ctypes.byref(size), None, 0) != 0 or not size.value:
+            return None
+        buf = ctypes.create_string_buffer(size.value)
+        if libc.sysctlbyname(key, buf, ctypes.byref(size), None, 0) != 0:
+            return None
+        return buf.value.decode("utf-8", "replace").strip() or None
+    except (OSError, AttributeError, TypeError):
+        return None
@@ -5,51 +5,160 @@ This module provides comprehensive system information gathering across
 macOS, Windows, and Linux platforms.
 """
 
+import json
+import os
 import platform
 import subprocess
 import shutil
+import time
 import psutil
-from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import structlog
 
+from ._system_impl import (
+    _MACHINE,
+    _SYSTEM,
+    _disk_usage,
+    _find_field,
+    _linux_gpu_vendor,
+    _linux_meminfo,
+    _match_gpu_vendor,
+    _nvml_gpu_name,
+    _read_small,
+    _sysctl_string,
+    _windows_gpu_name,
+)
+
 logger = structlog.get_logger(__name__)
 
+# Hardware facts survive across CLI invocations for this long; memory and
+# disk usage are always re-probed.
+_PROFILE_CACHE_TTL = 3600  # seconds
+_PROFILE_CACHE_KEYS = (
+    "created_at", "os_name", "os_version", "arch", "platform", "cpu_name", "cpu_cores",
+)
+
+# Normalized names for the machine strings reported by platform.machine()
+_ARCH_MAP = {
+    "x86_64": "x86_64",
+    "amd64": "x86_64",
+    "arm64": "arm64",
+    "aarch64": "arm64",
+    "arm": "arm",
+    "armv7l": "arm",
+}
+
+
+def _profile_cache_path() -> Path:
+    """Location of the on-disk profile cache."""
+    return Path.home() / ".he2plus" / "cache" / "sysinfo.json"
+
 
-@dataclass
 class SystemInfo:
-    """Comprehensive system information."""
-    
-    # Basic system info
-    os_name: str
-    os_version: str
-    arch: str
-    platform: str
-    
-    # Hardware info
-    cpu_name: str
-    cpu_cores: int
-    ram_total_gb: float
-    ram_available_gb: float
-    disk_total_gb: float
-    disk_free_gb: float
-    
-    # GPU info
-    gpu_name: Optional[str] = None
-    gpu_vendor: Optional[str] = None
-    cuda_available: bool = False
-    metal_available: bool = False
-    
-    # Installed tools
-    package_managers: List[str] = None
-    languages: Dict[str, str] = None
-    
-    def __post_init__(self):
-        if self.package_managers is None:
-            self.package_managers = []
-        if self.languages is None:
-            self.languages = {}
+    """
+    Comprehensive system information.
+    
+    GPU details and installed tools are the expensive fields to collect.
+    When a profiler is attached they are left out of the constructor and
+    probed on first access, so callers that never read them never pay for
+    the subprocesses behind them.
+    """
+    
+    # Fields in declaration order, used for repr/equality
+    _FIELDS = (
+        "os_name", "os_version", "arch", "platform",
+        "cpu_name", "cpu_cores", "ram_total_gb", "ram_available_gb",
+        "disk_total_gb", "disk_free_gb",
+        "gpu_name", "gpu_vendor", "cuda_available", "metal_available",
+        "package_managers", "languages",
+    )
+    
+    def __init__(
+        self,
+        os_name: str,
+        os_version: str,
+        arch: str,
+        platform: str,
+        cpu_name: str,
+        cpu_cores: int,
+        ram_total_gb: float,
+        ram_available_gb: float,
+        disk_total_gb: float,
+        disk_free_gb: float,
+        gpu_name: Optional[str] = None,
+        gpu_vendor: Optional[str] = None,
+        cuda_available: bool = False,
+        metal_available: bool = False,
+        package_managers: Optional[List[str]] = None,
+        languages: Optional[Dict[str, str]] = None,
+        profiler: Optional["SystemProfiler"] = None,
+    ):
+        # Basic system info
+        self.os_name = os_name
+        self.os_version = os_version
+        self.arch = arch
+        self.platform = platform
+        
+        # Hardware info
+        self.cpu_name = cpu_name
+        self.cpu_cores = cpu_cores
+        self.ram_total_gb = ram_total_gb
+        self.ram_available_gb = ram_available_gb
+        self.disk_total_gb = disk_total_gb
+        self.disk_free_gb = disk_free_gb
+        
+        # With a profiler the lazy fields below are resolved on first access;
+        # assigning them here would shadow the cached properties.
+        self._profiler = profiler
+        if profiler is None:
+            # GPU info
+            self.gpu_name = gpu_name
+            self.gpu_vendor = gpu_vendor
+            self.cuda_available = cuda_available
+            self.metal_available = metal_available
+            
+            # Installed tools
+            self.package_managers = package_managers if package_managers is not None else []
+            self.languages = languages if languages is not None else {}
+    
+    @cached_property
+    def _gpu_info(self) -> Tuple[Optional[str], Optional[str], bool, bool]:
+        return self._profiler._resolve_gpu_info()
+    
+    @cached_property
+    def gpu_name(self) -> Optional[str]:
+        return self._gpu_info[0]
+    
+    @cached_property
+    def gpu_vendor(self) -> Optional[str]:
+        return self._gpu_info[1]
+    
+    @cached_property
+    def cuda_available(self) -> bool:
+        return self._gpu_info[2]
+    
+    @cached_property
+    def metal_available(self) -> bool:
+        return self._gpu_info[3]
+    
+    @cached_property
+    def package_managers(self) -> List[str]:
+        return self._profiler._detect_package_managers()
+    
+    @cached_property
+    def languages(self) -> Dict[str, str]:
+        return self._profiler._detect_languages()
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"{type(self).__name__}({fields})"
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._FIELDS)
 
 
 class SystemProfiler:
@@ -57,232 +166,263 @@ class SystemProfiler:
     
     def __init__(self):
         self.logger = logger.bind(component="system_profiler")
+        # Stable facts shared across CLI invocations, set by profile(use_cache=True)
+        self._profile_cache: Optional[Dict[str, Any]] = None
     
-    def profile(self) -> SystemInfo:
-        """Get comprehensive system information."""
+    def profile(self, use_cache: bool = False) -> SystemInfo:
+        """
+        Get comprehensive system information.
+        
+        Args:
+            use_cache: Reuse OS, CPU and GPU facts from the on-disk profile
+                cache when younger than an hour. Memory and disk usage are
+                always probed fresh.
+        """
         self.logger.info("Starting system profiling")
         
-        # Basic system info
-        os_name, os_version, arch = self._get_basic_info()
+        stable = self._load_profile_cache() if use_cache else None
+        if stable is None:
+            # Basic system info
+            os_name, os_version, arch = self._get_basic_info()
+            
+            # CPU info
+            cpu_name, cpu_cores = self._get_cpu_info()
+            
+            stable = {
+                "created_at": time.time(),
+                "os_name": os_name,
+                "os_version": os_version,
+                "arch": arch,
+                # Compose from what we already know rather than letting
+                # platform.platform() re-resolve the OS from scratch
+                "platform": f"{os_name}-{os_version}-{arch}",
+                "cpu_name": cpu_name,
+                "cpu_cores": cpu_cores,
+            }
+            if use_cache:
+                self._save_profile_cache(stable)
+        self._profile_cache = stable if use_cache else None
         
-        # Hardware info
-        cpu_name, cpu_cores = self._get_cpu_info()
+        # Memory and disk usage
         ram_total, ram_available = self._get_memory_info()
         disk_total, disk_free = self._get_disk_info()
         
-        # GPU info
-        gpu_name, gpu_vendor, cuda_available, metal_available = self._get_gpu_info()
-        
-        # Installed tools
-        package_managers = self._detect_package_managers()
-        languages = self._detect_languages()
-        
+        # GPU info and installed tools are probed lazily by SystemInfo
         system_info = SystemInfo(
-            os_name=os_name,
-            os_version=os_version,
-            arch=arch,
-            platform=platform.platform(),
-            cpu_name=cpu_name,
-            cpu_cores=cpu_cores,
+            os_name=stable["os_name"],
+            os_version=stable["os_version"],
+            arch=stable["arch"],
+            platform=stable["platform"],
+            cpu_name=stable["cpu_name"],
+            cpu_cores=stable["cpu_cores"],
             ram_total_gb=ram_total,
             ram_available_gb=ram_available,
             disk_total_gb=disk_total,
             disk_free_gb=disk_free,
-            gpu_name=gpu_name,
-            gpu_vendor=gpu_vendor,
-            cuda_available=cuda_available,
-            metal_available=metal_available,
-            package_managers=package_managers,
-            languages=languages
+            profiler=self
         )
         
         self.logger.info("System profiling completed", 
-                        os=os_name, arch=arch, ram_gb=ram_total, 
+                        os=system_info.os_name, arch=system_info.arch, ram_gb=ram_total, 
                         disk_free_gb=disk_free)
         
         return system_info
     
+    def _load_profile_cache(self) -> Optional[Dict[str, Any]]:
+        """Load the on-disk profile cache, or None if missing, stale or corrupt."""
+        try:
+            with open(_profile_cache_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(data, dict) or any(key not in data for key in _PROFILE_CACHE_KEYS):
+            return None
+        if not 0 <= time.time() - data["created_at"] < _PROFILE_CACHE_TTL:
+            return None
+        return data
+    
+    def _save_profile_cache(self, data: Dict[str, Any]) -> None:
+        """Atomically write the on-disk profile cache, ignoring failures."""
+        path = _profile_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug("Could not write profile cache", error=str(e))
+    
+    def _resolve_gpu_info(self) -> Tuple[Optional[str], Optional[str], bool, bool]:
+        """GPU info for SystemInfo, served from and saved to the profile cache."""
+        cache = self._profile_cache
+        if cache is not None and "gpu" in cache:
+            gpu_name, gpu_vendor, cuda_available, metal_available = cache["gpu"]
+            return gpu_name, gpu_vendor, cuda_available, metal_available
+        
+        gpu_info = self._get_gpu_info()
+        if cache is not None:
+            cache["gpu"] = list(gpu_info)
+            self._save_profile_cache(cache)
+        return gpu_info
+    
     def _get_basic_info(self) -> Tuple[str, str, str]:
         """Get basic OS information."""
-        system = platform.system().lower()
-        
-        if system == "darwin":
-            os_name = "macOS"
-            try:
-                # Get macOS version
-                result = subprocess.run(
-                    ["sw_vers", "-productVersion"], 
-                    capture_output=True, text=True, check=True
-                )
-                os_version = result.stdout.strip()
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                os_version = platform.mac_ver()[0]
-        elif system == "windows":
-            os_name = "Windows"
-            os_version = platform.win32_ver()[0]
-        elif system == "linux":
-            os_name = "Linux"
-            try:
-                # Try to get distribution info
-                with open("/etc/os-release", "r") as f:
-                    for line in f:
-                        if line.startswith("PRETTY_NAME="):
-                            os_version = line.split("=", 1)[1].strip().strip('"')
-                            break
-                    else:
-                        os_version = platform.release()
-            except (FileNotFoundError, OSError):
-                os_version = platform.release()
+        backend = self._BASIC_INFO_BACKENDS.get(_SYSTEM)
+        if backend is not None:
+            os_name, os_version = backend(self)
         else:
-            os_name = system.title()
+            os_name = _SYSTEM.title()
             os_version = platform.release()
         
         # Get architecture
-        arch = platform.machine().lower()
-        if arch in ["x86_64", "amd64"]:
-            arch = "x86_64"
-        elif arch in ["arm64", "aarch64"]:
-            arch = "arm64"
-        elif arch in ["arm", "armv7l"]:
-            arch = "arm"
+        arch = _ARCH_MAP.get(_MACHINE, _MACHINE)
         
         return os_name, os_version, arch
     
+    def _basic_info_macos(self) -> Tuple[str, str]:
+        try:
+            # Get macOS version
+            result = subprocess.run(
+                ["sw_vers", "-productVersion"], 
+                capture_output=True, text=True, check=True, timeout=3
+            )
+            return "macOS", result.stdout.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            return "macOS", platform.mac_ver()[0]
+    
+    def _basic_info_windows(self) -> Tuple[str, str]:
+        return "Windows", platform.win32_ver()[0]
+    
+    def _basic_info_linux(self) -> Tuple[str, str]:
+        try:
+            # Try to get distribution info
+            pretty_name = _find_field(_read_small("/etc/os-release"), b"PRETTY_NAME", b"=")
+            return "Linux", pretty_name.strip('"') if pretty_name else platform.release()
+        except (FileNotFoundError, OSError):
+            return "Linux", platform.release()
+    
     def _get_cpu_info(self) -> Tuple[str, int]:
         """Get CPU information."""
         try:
             cpu_name = platform.processor()
             if not cpu_name or cpu_name == "unknown":
                 # Try alternative methods
-                if platform.system() == "Darwin":
-                    try:
-                        result = subprocess.run(
-                            ["sysctl", "-n", "machdep.cpu.brand_string"],
-                            capture_output=True, text=True, check=True
-                        )
-                        cpu_name = result.stdout.strip()
-                    except (subprocess.CalledProcessError, FileNotFoundError):
-                        cpu_name = "Unknown CPU"
-                elif platform.system() == "Linux":
-                    try:
-                        with open("/proc/cpuinfo", "r") as f:
-                            for line in f:
-                                if line.startswith("model name"):
-                                    cpu_name = line.split(":", 1)[1].strip()
-                                    break
-                    except (FileNotFoundError, OSError):
-                        cpu_name = "Unknown CPU"
-                else:
-                    cpu_name = "Unknown CPU"
+                backend = self._CPU_NAME_BACKENDS.get(_SYSTEM)
+                cpu_name = backend(self, cpu_name) if backend is not None else "Unknown CPU"
         except Exception:
             cpu_name = "Unknown CPU"
         
         cpu_cores = psutil.cpu_count(logical=True)
         return cpu_name, cpu_cores
     
+    def _cpu_name_macos(self, fallback: str) -> str:
+        try:
+            result = subprocess.run(
+                ["sysctl", "-n", "machdep.cpu.brand_string"],
+                capture_output=True, text=True, check=True, timeout=3
+            )
+            return result.stdout.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            return "Unknown CPU"
+    
+    def _cpu_name_linux(self, fallback: str) -> str:
+        try:
+            # "model name" is in the first CPU block, so there is no need to
+            # read the whole file on many-core hosts.
+            data = _read_small("/proc/cpuinfo")
+            return _find_field(data, b"model name", b":") or fallback
+        except (FileNotFoundError, OSError):
+            return "Unknown CPU"
+    
     def _get_memory_info(self) -> Tuple[float, float]:
         """Get memory information in GB."""
-        memory = psutil.virtual_memory()
-        total_gb = memory.total / (1024**3)
-        available_gb = memory.available / (1024**3)
-        return round(total_gb, 1), round(available_gb, 1)
+        # On Linux read just the two fields we need instead of having psutil
+        # parse all of /proc/meminfo
+        meminfo = _linux_meminfo() if _SYSTEM == "linux" else None
+        if meminfo is not None:
+            total, available = meminfo
+        else:
+            memory = psutil.virtual_memory()
+            total, available = memory.total, memory.available
+        return round(total / (1024**3), 1), round(available / (1024**3), 1)
     
     def _get_disk_info(self) -> Tuple[float, float]:
         """Get disk information in GB."""
         try:
-            # Get disk usage for the current directory
-            disk_usage = psutil.disk_usage(".")
-            total_gb = disk_usage.total / (1024**3)
-            free_gb = disk_usage.free / (1024**3)
-            return round(total_gb, 1), round(free_gb, 1)
-        except Exception:
-            # Fallback to home directory
-            try:
-                disk_usage = psutil.disk_usage(str(Path.home()))
-                total_gb = disk_usage.total / (1024**3)
-                free_gb = disk_usage.free / (1024**3)
-                return round(total_gb, 1), round(free_gb, 1)
-            except Exception:
-                return 0.0, 0.0
+            total, free = _disk_usage(str(Path.home()))
+        except OSError:
+            return 0.0, 0.0
+        return round(total / (1024**3), 1), round(free / (1024**3), 1)
     
     def _get_gpu_info(self) -> Tuple[Optional[str], Optional[str], bool, bool]:
         """Get GPU information and capabilities."""
-        gpu_name = None
-        gpu_vendor = None
-        cuda_available = False
-        metal_available = False
-        
-        system = platform.system().lower()
-        
-        if system == "darwin":
-            # macOS - check for Apple Silicon or Intel
-            try:
-                result = subprocess.run(
-                    ["system_profiler", "SPDisplaysDataType", "-json"],
-                    capture_output=True, text=True, check=True
-                )
-                import json
-                data = json.loads(result.stdout)
-                
-                if "SPDisplaysDataType" in data and data["SPDisplaysDataType"]:
-                    display = data["SPDisplaysDataType"][0]
-                    gpu_name = display.get("_name", "Unknown GPU")
-                    gpu_vendor = display.get("sppci_model", "Unknown")
-                    
-                    # Check for Apple Silicon (Metal support)
-                    if "Apple" in gpu_name or "M1" in gpu_name or "M2" in gpu_name:
-                        metal_available = True
-            except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError):
-                pass
-        
-        elif system == "linux":
-            # Linux - check for NVIDIA, AMD, Intel
-            try:
-                # Check for NVIDIA
-                result = subprocess.run(
-                    ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader,nounits"],
-                    capture_output=True, text=True
-                )
-                if result.returncode == 0:
-                    gpu_name = result.stdout.strip()
-                    gpu_vendor = "NVIDIA"
-                    cuda_available = True
-                else:
-                    # Check for AMD
-                    result = subprocess.run(
-                        ["lspci", "-nn"], capture_output=True, text=True
-                    )
-                    if "VGA" in result.stdout:
-                        if "AMD" in result.stdout:
-                            gpu_vendor = "AMD"
-                        elif "Intel" in result.stdout:
-                            gpu_vendor = "Intel"
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
-        
-        elif system == "windows":
-            # Windows - check for GPU
-            try:
-                result = subprocess.run(
-                    ["wmic", "path", "win32_VideoController", "get", "name"],
-                    capture_output=True, text=True, check=True
-                )
-                lines = result.stdout.strip().split('\n')
-                for line in lines[1:]:  # Skip header
-                    if line.strip() and "Name" not in line:
-                        gpu_name = line.strip()
-                        if "NVIDIA" in gpu_name:
-                            gpu_vendor = "NVIDIA"
-                            cuda_available = True
-                        elif "AMD" in gpu_name:
-                            gpu_vendor = "AMD"
-                        elif "Intel" in gpu_name:
-                            gpu_vendor = "Intel"
-                        break
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
-        
-        return gpu_name, gpu_vendor, cuda_available, metal_available
+        backend = self._GPU_BACKENDS.get(_SYSTEM)
+        if backend is None:
+            return None, None, False, False
+        return backend(self)
+    
+    def _gpu_info_macos(self) -> Tuple[Optional[str], Optional[str], bool, bool]:
+        # Apple Silicon always has an integrated Apple GPU with Metal; the
+        # chip name comes straight from sysctl without forking system_profiler.
+        if _MACHINE == "arm64":
+            chip_name = _sysctl_string("machdep.cpu.brand_string")
+            if chip_name:
+                return chip_name, "Apple", False, True
+        
+        # Intel Macs - fall back to system_profiler
+        try:
+            result = subprocess.run(
+                ["system_profiler", "SPDisplaysDataType", "-json"],
+                capture_output=True, text=True, check=True, timeout=10
+            )
+            data = json.loads(result.stdout)
+        except (subprocess.CalledProcessError, FileNotFoundError,
+                subprocess.TimeoutExpired, json.JSONDecodeError):
+            return None, None, False, False
+        
+        if not data.get("SPDisplaysDataType"):
+            return None, None, False, False
+        
+        display = data["SPDisplaysDataType"][0]
+        gpu_name = display.get("_name", "Unknown GPU")
+        gpu_vendor = display.get("sppci_model", "Unknown")
+        
+        # Check for Apple Silicon (Metal support)
+        metal_available = _match_gpu_vendor(gpu_name) == "Apple"
+        return gpu_name, gpu_vendor, False, metal_available
+    
+    def _gpu_info_linux(self) -> Tuple[Optional[str], Optional[str], bool, bool]:
+        # Ask the NVIDIA driver in-process first, nvidia-smi otherwise
+        gpu_name = _nvml_gpu_name()
+        if gpu_name:
+            return gpu_name, "NVIDIA", True, False
+        
+        try:
+            result = subprocess.run(
+                ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader,nounits"],
+                capture_output=True, text=True, timeout=3
+            )
+            if result.returncode == 0:
+                return result.stdout.strip(), "NVIDIA", True, False
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            pass
+        
+        # AMD/Intel - read the PCI vendor id from sysfs instead of forking lspci
+        return None, _linux_gpu_vendor(), False, False
+    
+    def _gpu_info_windows(self) -> Tuple[Optional[str], Optional[str], bool, bool]:
+        # Query the display adapters directly instead of wmic
+        try:
+            gpu_name = _windows_gpu_name()
+        except (OSError, AttributeError, ValueError):
+            gpu_name = None
+        
+        if not gpu_name:
+            return gpu_name, None, False, False
+        gpu_vendor = _match_gpu_vendor(gpu_name)
+        return gpu_name, gpu_vendor, gpu_vendor == "NVIDIA", False
     
     def _detect_package_managers(self) -> List[str]:
         """Detect available package managers."""
@@ -298,6 +438,8 @@ class SystemProfiler:
             "choco": "choco",
             "winget": "winget",
             "snap": "snap",
+            "flatpak": "flatpak",
+            "macports": "port",
             "pip": "pip",
             "npm": "npm",
             "yarn": "yarn",
@@ -321,64 +463,64 @@ class SystemProfiler:
         # Python
         try:
             result = subprocess.run(
-                ["python3", "--version"], capture_output=True, text=True
+                ["python3", "--version"], capture_output=True, text=True, timeout=3
             )
             if result.returncode == 0 and result.stdout.strip():
                 parts = result.stdout.strip().split()
                 if len(parts) >= 2:
                     version = parts[1]
                     languages["python"] = version
-        except (subprocess.CalledProcessError, FileNotFoundError, IndexError):
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired, IndexError):
             pass
         
         # Node.js
         try:
             result = subprocess.run(
-                ["node", "--version"], capture_output=True, text=True
+                ["node", "--version"], capture_output=True, text=True, timeout=3
             )
             if result.returncode == 0:
                 version = result.stdout.strip()
                 languages["node"] = version
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
             pass
         
         # Rust
         try:
             result = subprocess.run(
-                ["rustc", "--version"], capture_output=True, text=True
+                ["rustc", "--version"], capture_output=True, text=True, timeout=3
             )
             if result.returncode == 0 and result.stdout.strip():
                 parts = result.stdout.strip().split()
                 if len(parts) >= 2:
                     version = parts[1]
                     languages["rust"] = version
-        except (subprocess.CalledProcessError, FileNotFoundError, IndexError):
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired, IndexError):
             pass
         
         # Go
         try:
             result = subprocess.run(
-                ["go", "version"], capture_output=True, text=True
+                ["go", "version"], capture_output=True, text=True, timeout=3
             )
             if result.returncode == 0 and result.stdout.strip():
                 parts = result.stdout.strip().split()
                 if len(parts) >= 3:
                     version = parts[2]
                     languages["go"] = version
-        except (subprocess.CalledProcessError, FileNotFoundError, IndexError):
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired, IndexError):
             pass
         
         # Java
         try:
             result = subprocess.run(
-                ["java", "-version"], capture_output=True, text=True
+                ["java", "-version"], capture_output=True, text=True, timeout=3
             )
             if result.returncode == 0 and result.stderr.strip():
                 lines = result.stderr.strip().split('\n')
                 if lines and len(lines[0].split()) >= 3:
                     version = lines[0].split()[2].strip('"')
                     languages["java"] = version
-        except (subprocess.CalledProcessError, FileNotFoundError, IndexError):
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired, IndexError):
             pass
         
         return languages
@@ -391,28 +533,60 @@ class SystemProfiler:
             "containers": []
         }
         
-        system = platform.system().lower()
-        
-        if system == "darwin":
-            methods["system"] = ["brew", "macports"]
-            if "brew" in self._detect_package_managers():
-                methods["system"].insert(0, "brew")
-        elif system == "linux":
-            methods["system"] = ["apt", "yum", "dnf", "pacman", "snap"]
-            # Prioritize based on what's available
-            available = self._detect_package_managers()
-            methods["system"] = [m for m in methods["system"] if m in available]
-        elif system == "windows":
-            methods["system"] = ["choco", "winget", "scoop"]
-            available = self._detect_package_managers()
-            methods["system"] = [m for m in methods["system"] if m in available]
+        # Prioritize based on what's available
+        available = frozenset(self._detect_package_managers())
+        methods["system"] = [
+            m for m in self._SYSTEM_PACKAGE_MANAGERS.get(_SYSTEM, ()) if m in available
+        ]
         
         # Language-specific package managers
-        available = self._detect_package_managers()
-        methods["language_specific"] = [m for m in ["pip", "npm", "yarn", "pnpm", "cargo", "go", "conda", "poetry"] if m in available]
+        methods["language_specific"] = [
+            m for m in self._LANGUAGE_PACKAGE_MANAGERS if m in available
+        ]
         
-        # Container options
-        if "docker" in self._detect_package_managers():
+        # Container options - docker is a runtime, not a package manager, so
+        # _detect_package_managers() never reports it
+        if shutil.which("docker"):
             methods["containers"] = ["docker"]
         
         return methods
+    
+    # OS-specific probes, keyed by _SYSTEM. The OS never changes at runtime,
+    # so each probe is a single dict lookup instead of an if/elif chain.
+    _BASIC_INFO_BACKENDS = {
+        "darwin": _basic_info_macos,
+        "windows": _basic_info_windows,
+        "linux": _basic_info_linux,
+    }
+    _CPU_NAME_BACKENDS = {
+        "darwin": _cpu_name_macos,
+        "linux": _cpu_name_linux,
+    }
+    _GPU_BACKENDS = {
+        "darwin": _gpu_info_macos,
+        "linux": _gpu_info_linux,
+        "windows": _gpu_info_windows,
+    }
+    # System package managers in order of preference
+    _SYSTEM_PACKAGE_MANAGERS = {
+        "darwin": ("brew", "macports"),
+        "linux": ("apt", "yum", "dnf", "pacman", "snap"),
+        "windows": ("choco", "winget", "scoop"),
+    }
+    _LANGUAGE_PACKAGE_MANAGERS = ("pip", "npm", "yarn", "pnpm", "cargo", "go", "conda", "poetry")
+
+
+@lru_cache(maxsize=None)
+def _shared_profiler() -> SystemProfiler:
+    """One SystemProfiler per process, so its lazily probed details are shared."""
+    return SystemProfiler()
+
+
+@lru_cache(maxsize=None)
+def _shared_profile() -> SystemInfo:
+    """Profile the host once per process for callers that only need a snapshot.
+    
+    Memory and disk usage are as of the first call; callers that need them
+    current re-read them through _shared_profiler().
+    """
+    return _shared_profiler().profile()
@@ -9,8 +9,10 @@ import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import psutil
+from typing import List, Optional
+
+from ._system_impl import _MACHINE, _SYSTEM, _match_gpu_vendor
+from .system import _shared_profile, _shared_profiler
 
 
 @dataclass
@@ -38,66 +40,90 @@ class SystemInfo:
     node_versions: List[str]
     package_managers: List[str]
     
-    # System paths
-    home_dir: str
-    temp_dir: str
-
-
-def get_system_info() -> SystemInfo:
+    # System paths, resolved on access
+    @property
+    def home_dir(self) -> str:
+        return str(Path.home())
+    
+    @property
+    def temp_dir(self) -> str:
+        return str(Path.home() / ".he2plus" / "temp")
+
+
+# Display names for the package managers reported by SystemProfiler
+_PACKAGE_MANAGER_NAMES = {
+    "brew": "Homebrew",
+    "apt": "APT",
+    "yum": "YUM",
+    "dnf": "DNF",
+    "pacman": "Pacman",
+    "choco": "Chocolatey",
+    "winget": "Winget",
+    "snap": "Snap",
+    "flatpak": "Flatpak",
+    "macports": "MacPorts",
+}
+
+def get_system_info(include_languages: bool = True, include_gpu: bool = True,
+                    include_package_managers: bool = True) -> SystemInfo:
     """
     Get comprehensive system information
     
+    OS, CPU, GPU and package manager details come from the shared
+    SystemProfiler snapshot, so the host is only probed for them once per
+    process. Memory and disk usage are read fresh on every call.
+    
+    Args:
+        include_languages: Scan for installed Python and Node.js versions.
+            Callers that don't read python_versions/node_versions can pass
+            False to skip the PATH and version-manager scans.
+        include_gpu: Detect the GPU. Callers that don't read gpu_name or
+            gpu_type can pass False to skip the GPU probes.
+        include_package_managers: Detect package managers. Callers that
+            don't read package_managers can pass False to skip the probes.
+    
     Returns:
         SystemInfo: Complete system information
     """
     try:
-        # Basic system info
-        os_name = platform.system().lower()
-        os_version = platform.release()
-        architecture = platform.machine().lower()
-        
-        # Hardware resources
-        ram_info = _get_ram_info()
-        disk_info = _get_disk_info()
-        cpu_info = _get_cpu_info()
-        
-        # GPU information
-        gpu_info = _get_gpu_info()
+        profile = _shared_profile()
+        profiler = _shared_profiler()
+        ram_total_gb, ram_available_gb = profiler._get_memory_info()
+        disk_total_gb, disk_free_gb = profiler._get_disk_info()
         
         # Installed software
-        python_versions = _find_python_versions()
-        node_versions = _find_node_versions()
-        package_managers = _find_package_managers()
-        
-        # System paths
-        home_dir = str(Path.home())
-        temp_dir = str(Path.home() / ".he2plus" / "temp")
+        python_versions = _find_python_versions() if include_languages else []
+        node_versions = _find_node_versions() if include_languages else []
+        package_managers = [
+            _PACKAGE_MANAGER_NAMES[manager]
+            for manager in profile.package_managers
+            if manager in _PACKAGE_MANAGER_NAMES
+        ] if include_package_managers else []
+        gpu_name = profile.gpu_name if include_gpu else None
         
         return SystemInfo(
-            os_name=os_name,
-            os_version=os_version,
-            architecture=architecture,
-            ram_total_gb=ram_info[0],
-            ram_available_gb=ram_info[1],
-            disk_total_gb=disk_info[0],
-            disk_free_gb=disk_info[1],
-            cpu_cores=cpu_info[0],
-            cpu_name=cpu_info[1],
-            gpu_name=gpu_info[0],
-            gpu_type=gpu_info[1],
+            os_name=_SYSTEM,
+            os_version=platform.release(),
+            architecture=_MACHINE,
+            ram_total_gb=ram_total_gb,
+            ram_available_gb=ram_available_gb,
+            disk_total_gb=disk_total_gb,
+            disk_free_gb=disk_free_gb,
+            cpu_cores=profile.cpu_cores or 1,
+            cpu_name=profile.cpu_name or "Unknown",
+            gpu_name=gpu_name,
+            gpu_type=_gpu_type(profile.gpu_vendor, gpu_name) if include_gpu else None,
             python_versions=python_versions,
             node_versions=node_versions,
-            package_managers=package_managers,
-            home_dir=home_dir,
-            temp_dir=temp_dir
+            package_managers=package_managers
         )
         
     except Exception as e:
         # Return minimal info if something fails
         return SystemInfo(
-            os_name=platform.system().lower(),
+            os_name=_SYSTEM,
             os_version=platform.release(),
-            architecture=platform.machine().lower(),
+            architecture=_MACHINE,
             ram_total_gb=0.0,
             ram_available_gb=0.0,
             disk_total_gb=0.0,
@@ -108,201 +134,37 @@ def get_system_info() -> SystemInfo:
             gpu_type=None,
             python_versions=[],
             node_versions=[],
-            package_managers=[],
-            home_dir=str(Path.home()),
-            temp_dir=str(Path.home() / ".he2plus" / "temp")
-        )
-
-
-def _get_ram_info() -> Tuple[float, float]:
-    """Get RAM information in GB"""
-    try:
-        memory = psutil.virtual_memory()
-        total_gb = memory.total / (1024**3)
-        available_gb = memory.available / (1024**3)
-        return round(total_gb, 2), round(available_gb, 2)
-    except Exception:
-        return 0.0, 0.0
-
-
-def _get_disk_info() -> Tuple[float, float]:
-    """Get disk information for home directory in GB"""
-    try:
-        home_path = Path.home()
-        disk_usage = psutil.disk_usage(str(home_path))
-        total_gb = disk_usage.total / (1024**3)
-        free_gb = disk_usage.free / (1024**3)
-        return round(total_gb, 2), round(free_gb, 2)
-    except Exception:
-        return 0.0, 0.0
-
-
-def _get_cpu_info() -> Tuple[int, str]:
-    """Get CPU information"""
-    try:
-        cpu_count = psutil.cpu_count()
-        cpu_name = "Unknown"
-        
-        # Try to get CPU name
-        try:
-            if platform.system().lower() == "darwin":  # macOS
-                result = subprocess.run(
-                    ["sysctl", "-n", "machdep.cpu.brand_string"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    cpu_name = result.stdout.strip()
-            elif platform.system().lower() == "linux":
-                with open("/proc/cpuinfo", "r") as f:
-                    for line in f:
-                        if line.startswith("model name"):
-                            cpu_name = line.split(":")[1].strip()
-                            break
-            elif platform.system().lower() == "windows":
-                result = subprocess.run(
-                    ["wmic", "cpu", "get", "name", "/value"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.split("\n"):
-                        if line.startswith("Name="):
-                            cpu_name = line.split("=", 1)[1].strip()
-                            break
-        except Exception:
-            pass
-        
-        return cpu_count or 1, cpu_name
-        
-    except Exception:
-        return 1, "Unknown"
-
-
-def _get_gpu_info() -> Tuple[Optional[str], Optional[str]]:
-    """Detect GPU information"""
-    try:
-        if platform.system().lower() == "darwin":  # macOS
-            return _detect_gpu_macos()
-        elif platform.system().lower() == "linux":
-            return _detect_gpu_linux()
-        elif platform.system().lower() == "windows":
-            return _detect_gpu_windows()
-        else:
-            return None, None
-    except Exception:
-        return None, None
-
-
-def _detect_gpu_macos() -> Tuple[Optional[str], Optional[str]]:
-    """Detect GPU on macOS"""
-    try:
-        result = subprocess.run(
-            ["system_profiler", "SPDisplaysDataType"],
-            capture_output=True, text=True, timeout=10
-        )
-        if result.returncode == 0:
-            output = result.stdout.lower()
-            if "nvidia" in output:
-                return "NVIDIA GPU", "nvidia"
-            elif "amd" in output or "radeon" in output:
-                return "AMD GPU", "amd"
-            elif "apple" in output or "m1" in output or "m2" in output or "m3" in output:
-                return "Apple GPU", "apple"
-            elif "intel" in output:
-                return "Intel GPU", "intel"
-        return None, None
-    except Exception:
-        return None, None
-
-
-def _detect_gpu_linux() -> Tuple[Optional[str], Optional[str]]:
-    """Detect GPU on Linux"""
-    try:
-        # Try nvidia-smi first
-        result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            gpu_name = result.stdout.strip()
-            return gpu_name, "nvidia"
-        
-        # Try lspci
-        result = subprocess.run(
-            ["lspci"],
-            capture_output=True, text=True, timeout=5
+            package_managers=[]
         )
-        if result.returncode == 0:
-            output = result.stdout.lower()
-            if "nvidia" in output:
-                return "NVIDIA GPU", "nvidia"
-            elif "amd" in output or "radeon" in output:
-                return "AMD GPU", "amd"
-            elif "intel" in output:
-                return "Intel GPU", "intel"
-        
-        return None, None
-    except Exception:
-        return None, None
 
 
-def _detect_gpu_windows() -> Tuple[Optional[str], Optional[str]]:
-    """Detect GPU on Windows"""
-    try:
-        result = subprocess.run(
-            ["wmic", "path", "win32_VideoController", "get", "name", "/value"],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            output = result.stdout.lower()
-            if "nvidia" in output:
-                return "NVIDIA GPU", "nvidia"
-            elif "amd" in output or "radeon" in output:
-                return "AMD GPU", "amd"
-            elif "intel" in output:
-                return "Intel GPU", "intel"
-        return None, None
-    except Exception:
-        return None, None
+def _gpu_type(gpu_vendor: Optional[str], gpu_name: Optional[str]) -> Optional[str]:
+    """Map SystemProfiler's GPU vendor/name onto nvidia, amd, apple or intel"""
+    vendor = _match_gpu_vendor(f"{gpu_vendor or ''} {gpu_name or ''}")
+    return vendor.lower() if vendor else None
 
 
 def _find_python_versions() -> List[str]:
     """Find installed Python versions"""
-    versions = []
+    # Check current Python
+    versions = {f"{sys.version_info.major}.{sys.version_info.minor}"}
     
-    try:
-        # Check current Python
-        current_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-        versions.append(current_version)
-        
-        # Check PATH for other Python versions
-        path_dirs = os.environ.get("PATH", "").split(os.pathsep)
-        for path_dir in path_dirs:
-            try:
-                for item in os.listdir(path_dir):
-                    if item.startswith("python") and item[6:].replace(".", "").isdigit():
-                        version = item[6:]  # Remove "python" prefix
-                        if version not in versions:
-                            versions.append(version)
-            except (OSError, PermissionError):
-                continue
-        
-        # Check common installation locations
-        common_paths = [
-            "/usr/bin/python*",
-            "/usr/local/bin/python*",
-            "/opt/homebrew/bin/python*",
-            "C:\\Python*",
-            "C:\\Program Files\\Python*",
-            "C:\\Users\\*\\AppData\\Local\\Programs\\Python\\Python*"
-        ]
-        
-        # This is a simplified check - in practice, you'd use glob patterns
-        # For now, we'll rely on PATH detection
-        
-    except Exception:
-        pass
+    # Check PATH for other Python versions, visiting each directory once
+    seen_dirs = set()
+    for path_dir in os.environ.get("PATH", "").split(os.pathsep):
+        if not path_dir or path_dir in seen_dirs:
+            continue
+        seen_dirs.add(path_dir)
+        try:
+            with os.scandir(path_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("python") and name[6:].replace(".", "").isdigit():
+                        versions.add(name[6:])  # Remove "python" prefix
+        except OSError:
+            continue
     
-    return sorted(list(set(versions)))
+    return sorted(versions)
 
 
 def _find_node_versions() -> List[str]:
@@ -318,67 +180,32 @@ def _find_node_versions() -> List[str]:
         if result.returncode == 0:
             version = result.stdout.strip().lstrip("v")
             versions.append(version)
-        
-        # Check for nvm installations
-        nvm_path = Path.home() / ".nvm"
-        if nvm_path.exists():
-            try:
-                for item in nvm_path.iterdir():
-                    if item.is_dir() and item.name.startswith("v"):
-                        version = item.name[1:]  # Remove "v" prefix
-                        if version not in versions:
-                            versions.append(version)
-            except (OSError, PermissionError):
-                pass
-        
-        # Check for fnm installations
-        fnm_path = Path.home() / ".fnm"
-        if fnm_path.exists():
-            try:
-                for item in fnm_path.iterdir():
-                    if item.is_dir() and item.name.startswith("v"):
-                        version = item.name[1:]  # Remove "v" prefix
-                        if version not in versions:
-                            versions.append(version)
-            except (OSError, PermissionError):
-                pass
-        
     except Exception:
         pass
     
-    return sorted(list(set(versions)))
+    # Check for nvm and fnm installations
+    home = Path.home()
+    nvm_dir = os.environ.get("NVM_DIR", str(home / ".nvm"))
+    fnm_dir = os.environ.get("FNM_DIR", str(home / ".fnm"))
+    versions.extend(_scan_version_dirs(os.path.join(nvm_dir, "versions", "node")))
+    versions.extend(_scan_version_dirs(os.path.join(fnm_dir, "node-versions")))
+    
+    return sorted(set(versions))
 
 
-def _find_package_managers() -> List[str]:
-    """Find available package managers"""
-    managers = []
-    
-    # List of package managers to check
-    package_managers = [
-        ("brew", "Homebrew"),
-        ("apt", "APT"),
-        ("yum", "YUM"),
-        ("dnf", "DNF"),
-        ("pacman", "Pacman"),
-        ("choco", "Chocolatey"),
-        ("winget", "Winget"),
-        ("snap", "Snap"),
-        ("flatpak", "Flatpak"),
-        ("port", "MacPorts")
-    ]
-    
-    for command, name in package_managers:
-        try:
-            result = subprocess.run(
-                [command, "--version"],
-                capture_output=True, text=True, timeout=3
-            )
-            if result.returncode == 0:
-                managers.append(name)
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            continue
-    
-    return managers
+def _scan_version_dirs(path: str) -> List[str]:
+    """List the versions of the ``v<version>`` directories under path"""
+    # DirEntry caches the file type from the directory read, so this costs
+    # one syscall per directory instead of a stat per entry.
+    try:
+        with os.scandir(path) as entries:
+            return [
+                entry.name[1:]  # Remove "v" prefix
+                for entry in entries
+                if entry.name.startswith("v") and entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return []
 
 
 def print_system_info() -> None:
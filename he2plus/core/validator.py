@@ -5,16 +5,24 @@ This module validates system resources against profile requirements
 and provides clear feedback on what's needed.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Collection, Dict, FrozenSet, Iterator, List, Optional
 import structlog
 
 from .system import SystemInfo
 
 logger = structlog.get_logger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older versions keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Shared default for ProfileRequirements.supported_archs
+_DEFAULT_ARCHS: FrozenSet[str] = frozenset(("x86_64", "arm64", "arm"))
+
+
+@dataclass(**_SLOTS)
 class ProfileRequirements:
     """Requirements for a development profile."""
     
@@ -31,18 +39,14 @@ class ProfileRequirements:
     
     # Platform requirements
     min_os_version: Optional[str] = None
-    supported_archs: List[str] = None
+    supported_archs: Collection[str] = _DEFAULT_ARCHS
     
     # Network requirements
     internet_required: bool = True
     download_size_mb: float = 0.0
-    
-    def __post_init__(self):
-        if self.supported_archs is None:
-            self.supported_archs = ["x86_64", "arm64", "arm"]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationResult:
     """Result of system validation against profile requirements."""
     
@@ -63,45 +67,390 @@ class ValidationResult:
     disk_space_after_gb: float
 
 
+@lru_cache(maxsize=256)
+def _pack_version(version: str) -> Optional[int]:
+    """Pack a dotted version's major.minor.patch into one comparable int, or None.
+    
+    Each part gets 16 bits, so packed versions compare like the tuples
+    they came from. Parts after the patch number are ignored.
+    """
+    try:
+        parts = [int(part) for part in version.split('.')[:3]]
+    except (ValueError, AttributeError):
+        return None
+    parts += [0] * (3 - len(parts))
+    return (parts[0] << 32) | (parts[1] << 16) | parts[2]
+
+
+# GPU capability bits. Vendor bits start at _GPU_VENDOR_SHIFT; the table is
+# fixed, and vendors outside it have no bit and are compared by name instead.
+_GPU_PRESENT = 1 << 0
+_GPU_CUDA = 1 << 1
+_GPU_METAL = 1 << 2
+_GPU_VENDOR_SHIFT = 3
+_GPU_VENDOR_BITS = {
+    "NVIDIA": 1 << 3,
+    "AMD": 1 << 4,
+    "Apple": 1 << 5,
+    "Intel": 1 << 6,
+}
+# Reported as missing when an unlisted required vendor doesn't match by name
+_GPU_VENDOR_OTHER = 1 << 7
+
+
+def _gpu_vendor_bit(vendor: Optional[str]) -> int:
+    """Return the capability bit for a GPU vendor name, or 0 for None or an unlisted vendor."""
+    return _GPU_VENDOR_BITS.get(vendor, 0) if vendor else 0
+
+
+@lru_cache(maxsize=64)
+def _required_gpu_caps(gpu_required: bool, gpu_vendor: Optional[str],
+                       cuda_required: bool, metal_required: bool) -> int:
+    """Pack a profile's GPU requirements into capability bits."""
+    if not gpu_required:
+        return 0
+    return (_GPU_PRESENT
+            | _gpu_vendor_bit(gpu_vendor)
+            | (_GPU_CUDA if cuda_required else 0)
+            | (_GPU_METAL if metal_required else 0))
+
+
+@dataclass(frozen=True)
+class _SystemSnapshot:
+    """Read-only copy of the SystemInfo fields the checks compare against.
+    
+    GPU details and package managers can be expensive for SystemInfo to
+    collect, so they're read through from the system by the checks that
+    need them instead of being copied up front.
+    """
+    
+    __slots__ = (
+        "os_name", "os_version", "os_version_packed", "arch", "cpu_cores",
+        "ram_total_gb", "ram_available_gb", "disk_total_gb", "disk_free_gb",
+        "ram_warn_gb", "disk_warn_gb", "disk_percent_scale", "system",
+    )
+    
+    os_name: str
+    os_version: str
+    os_version_packed: Optional[int]
+    arch: str
+    cpu_cores: int
+    ram_total_gb: float
+    ram_available_gb: float
+    disk_total_gb: float
+    disk_free_gb: float
+    # Derived thresholds, precomputed so the rules compare without arithmetic
+    ram_warn_gb: float         # largest requirement not warned about for available RAM
+    disk_warn_gb: float        # free space to keep after installing (20% of total)
+    disk_percent_scale: float  # 100 / disk_total_gb, or 0 for an unknown disk size
+    system: SystemInfo
+    
+    @property
+    def gpu_name(self) -> Optional[str]:
+        return self.system.gpu_name
+    
+    @property
+    def gpu_vendor(self) -> Optional[str]:
+        return self.system.gpu_vendor
+    
+    @property
+    def gpu_caps(self) -> int:
+        """_GPU_* bits for the detected GPU."""
+        system = self.system
+        return ((_GPU_PRESENT | _gpu_vendor_bit(system.gpu_vendor) if system.gpu_name else 0)
+                | (_GPU_CUDA if system.cuda_available else 0)
+                | (_GPU_METAL if system.metal_available else 0))
+    
+    @property
+    def has_package_managers(self) -> bool:
+        return bool(self.system.package_managers)
+    
+    @classmethod
+    def from_system(cls, system: SystemInfo) -> "_SystemSnapshot":
+        """Take a snapshot of system, parsing the OS version once."""
+        # Only macOS versions are compared against min_os_version
+        os_version_packed = None
+        if system.os_name == "macOS":
+            os_version_packed = _pack_version(system.os_version)
+        
+        return cls(
+            os_name=system.os_name,
+            os_version=system.os_version,
+            os_version_packed=os_version_packed,
+            arch=system.arch,
+            cpu_cores=system.cpu_cores,
+            ram_total_gb=system.ram_total_gb,
+            ram_available_gb=system.ram_available_gb,
+            disk_total_gb=system.disk_total_gb,
+            disk_free_gb=system.disk_free_gb,
+            ram_warn_gb=system.ram_available_gb * 2,
+            disk_warn_gb=system.disk_total_gb * 0.2,
+            disk_percent_scale=100.0 / system.disk_total_gb if system.disk_total_gb else 0.0,
+            system=system,
+        )
+
+
+def _os_version_parsed(snap: _SystemSnapshot, requirements: ProfileRequirements) -> bool:
+    """True unless a macOS version comparison is needed but can't be made."""
+    if not requirements.min_os_version or snap.os_name != "macOS":
+        return True
+    return (snap.os_version_packed is not None
+            and _pack_version(requirements.min_os_version) is not None)
+
+
+def _os_version_supported(snap: _SystemSnapshot, requirements: ProfileRequirements) -> bool:
+    """True unless the macOS version is older than min_os_version."""
+    if not requirements.min_os_version or snap.os_name != "macOS":
+        return True
+    return snap.os_version_packed >= _pack_version(requirements.min_os_version)
+
+
+# Message templates, formatted with str.format_map against _message_fields()
+_MSG_RAM_INSUFFICIENT = "Insufficient RAM: {snap.ram_total_gb}GB available, {req.ram_gb}GB required"
+_MSG_RAM_LOW = "Low available RAM: {snap.ram_available_gb}GB available, consider closing other applications"
+_MSG_DISK_INSUFFICIENT = "Insufficient disk space: {snap.disk_free_gb}GB available, {req.disk_gb}GB required"
+_MSG_DISK_LOW = ("Low disk space after installation: {space_after:.1f}GB will remain "
+                 "({space_after_percent:.1f}% of total disk)")
+_MSG_CPU_INSUFFICIENT = "Insufficient CPU cores: {snap.cpu_cores} available, {req.cpu_cores} required"
+_MSG_GPU_MISSING = "GPU required but not detected"
+_MSG_GPU_VENDOR = "Wrong GPU vendor: {snap.gpu_vendor} detected, {req.gpu_vendor} required"
+_MSG_CUDA_MISSING = "CUDA required but not available"
+_MSG_METAL_MISSING = "Metal Performance Shaders required but not available"
+_MSG_ARCH_UNSUPPORTED = "Unsupported architecture: {snap.arch}, supported: {supported_archs}"
+_MSG_OS_UNPARSABLE = "Could not parse OS version for comparison"
+_MSG_OS_TOO_OLD = "OS version too old: {snap.os_version}, minimum: {req.min_os_version}"
+_MSG_RAM_UPGRADE = "Consider upgrading to {ram_gb}GB RAM for better performance"
+
+# Validation rules as (resource, blocking, passes, message), applied in order.
+# Once a rule fails, later rules for the same resource are skipped. Messages
+# are templates, or functions of (snap, req), only built for failing rules.
+_RULES = (
+    ("ram", True, lambda snap, req: snap.ram_total_gb >= req.ram_gb, _MSG_RAM_INSUFFICIENT),
+    ("ram", False, lambda snap, req: req.ram_gb <= snap.ram_warn_gb, _MSG_RAM_LOW),
+    ("disk", True, lambda snap, req: snap.disk_free_gb >= req.disk_gb, _MSG_DISK_INSUFFICIENT),
+    # Warn if less than 20% free space after installation
+    ("disk", False,
+     lambda snap, req: snap.disk_free_gb - req.disk_gb >= snap.disk_warn_gb,
+     _MSG_DISK_LOW),
+    ("cpu", True, lambda snap, req: snap.cpu_cores >= req.cpu_cores, _MSG_CPU_INSUFFICIENT),
+    ("gpu", True,
+     lambda snap, req: not _missing_gpu_caps(snap, req),
+     lambda snap, req: _gpu_issue(snap, req)),
+    ("arch", True,
+     lambda snap, req: not req.supported_archs or snap.arch in req.supported_archs,
+     _MSG_ARCH_UNSUPPORTED),
+    ("os", False, _os_version_parsed, _MSG_OS_UNPARSABLE),
+    ("os", True, _os_version_supported, _MSG_OS_TOO_OLD),
+)
+
+
+def _missing_gpu_caps(snap: _SystemSnapshot, requirements: ProfileRequirements) -> int:
+    """Return the required GPU capability bits the system lacks."""
+    need = _required_gpu_caps(requirements.gpu_required, requirements.gpu_vendor,
+                              requirements.cuda_required, requirements.metal_required)
+    if not need:
+        return 0
+    missing = need & ~snap.gpu_caps
+    vendor = requirements.gpu_vendor
+    if (vendor and vendor not in _GPU_VENDOR_BITS
+            and (not snap.gpu_name or snap.gpu_vendor != vendor)):
+        missing |= _GPU_VENDOR_OTHER
+    return missing
+
+
+def _gpu_issue(snap: _SystemSnapshot, requirements: ProfileRequirements) -> str:
+    """Describe the most basic GPU requirement the system fails, if any."""
+    missing = _missing_gpu_caps(snap, requirements)
+    if missing & _GPU_PRESENT:
+        return _MSG_GPU_MISSING
+    if missing >> _GPU_VENDOR_SHIFT:
+        return _MSG_GPU_VENDOR.format(snap=snap, req=requirements)
+    if missing & _GPU_CUDA:
+        return _MSG_CUDA_MISSING
+    if missing & _GPU_METAL:
+        return _MSG_METAL_MISSING
+    return ""
+
+
+def _message_fields(snap: _SystemSnapshot, requirements: ProfileRequirements) -> Dict[str, object]:
+    """Build the values rule message templates are formatted with."""
+    space_after = snap.disk_free_gb - requirements.disk_gb
+    return {
+        "snap": snap,
+        "req": requirements,
+        "space_after": space_after,
+        "space_after_percent": space_after * snap.disk_percent_scale,
+        "supported_archs": ', '.join(sorted(requirements.supported_archs or ())),
+    }
+
+
+# RAM and disk needs add up across profiles installed together; the other
+# rules are per profile
+_ADDITIVE_RULES = tuple(rule for rule in _RULES if rule[0] in ("ram", "disk"))
+_PER_PROFILE_RULES = tuple(rule for rule in _RULES if rule[0] not in ("ram", "disk"))
+
+
+def _apply_rules(snap: _SystemSnapshot, requirements: ProfileRequirements,
+                 blocking_issues: List[str], warnings: List[str],
+                 stop_on_block: bool = False, rules: tuple = _RULES) -> set:
+    """Apply rules, returning the resources that have a blocking issue."""
+    failed = set()
+    blocked = set()
+    fields = None
+    for resource, blocking, passes, template in rules:
+        if resource in failed or passes(snap, requirements):
+            continue
+        
+        failed.add(resource)
+        if callable(template):
+            message = template(snap, requirements)
+        else:
+            if fields is None:
+                fields = _message_fields(snap, requirements)
+            message = template.format_map(fields)
+        if blocking:
+            blocked.add(resource)
+            blocking_issues.append(message)
+            if stop_on_block:
+                break
+        else:
+            warnings.append(message)
+    
+    return blocked
+
+
+def _resources_sufficient(snap: _SystemSnapshot,
+                          requirements_list: List[ProfileRequirements]) -> List[bool]:
+    """Compare the RAM, disk and CPU needs of many profiles against snap in one batch."""
+    try:
+        import numpy as np
+    except ImportError:
+        return [
+            snap.ram_total_gb >= req.ram_gb
+            and snap.disk_free_gb >= req.disk_gb
+            and snap.cpu_cores >= req.cpu_cores
+            for req in requirements_list
+        ]
+    
+    count = len(requirements_list)
+    ram = np.fromiter((req.ram_gb for req in requirements_list), dtype=np.float64, count=count)
+    disk = np.fromiter((req.disk_gb for req in requirements_list), dtype=np.float64, count=count)
+    cpu = np.fromiter((req.cpu_cores for req in requirements_list), dtype=np.int64, count=count)
+    sufficient = (ram <= snap.ram_total_gb) & (disk <= snap.disk_free_gb) & (cpu <= snap.cpu_cores)
+    return sufficient.tolist()
+
+
+@lru_cache(maxsize=512)
+def _estimate_install_time(download_size_mb: float, disk_gb: float,
+                           cuda_required: bool, metal_required: bool) -> int:
+    """Estimate installation time in minutes."""
+    base_time = 5.0  # Base time for any installation
+    
+    # Add time based on download size, assuming 10 MB/s
+    if download_size_mb > 0:
+        base_time += download_size_mb / 600
+    
+    # Add time based on disk space (compilation, extraction)
+    if disk_gb > 5:
+        base_time += disk_gb * 0.5
+    
+    # Add time for GPU drivers if needed
+    if cuda_required or metal_required:
+        base_time += 10
+    
+    return int(base_time)
+
+
+def _generate_recommendations(snap: _SystemSnapshot,
+                              requirements: ProfileRequirements) -> List[str]:
+    """Generate recommendations for optimal setup."""
+    recommendations = []
+    ram_gb = requirements.ram_gb
+    
+    # RAM recommendations
+    if snap.ram_total_gb < ram_gb * 1.5:
+        recommendations.append(_MSG_RAM_UPGRADE.format(ram_gb=ram_gb * 2))
+    
+    # Disk recommendations
+    if snap.disk_free_gb < requirements.disk_gb * 2:
+        recommendations.append(
+            "Consider freeing up disk space or using external storage"
+        )
+    
+    # GPU recommendations
+    if requirements.gpu_required and not snap.gpu_name:
+        recommendations.append("Consider adding a dedicated GPU for better performance")
+    
+    # Package manager recommendations
+    if not snap.has_package_managers:
+        recommendations.append("Install a package manager (brew, apt, choco) for easier setup")
+    
+    # Network recommendations
+    if requirements.internet_required and requirements.download_size_mb > 1000:
+        recommendations.append("Ensure stable internet connection for large downloads")
+    
+    return recommendations
+
+
+# Package manager to suggest per OS when none is installed
+_PACKAGE_MANAGER_SUGGESTIONS = {
+    "macOS": "Install Homebrew: /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"",
+    "Linux": "Install a package manager (apt, yum, dnf, or pacman)",
+    "Windows": "Install Chocolatey or winget for easier package management",
+}
+
+
 class SystemValidator:
     """Validates system resources against profile requirements."""
     
     def __init__(self, system_info: SystemInfo):
         self.system = system_info
         self.logger = logger.bind(component="system_validator")
+        # System resources don't change during a run, so read them once
+        self._snapshot = _SystemSnapshot.from_system(system_info)
     
-    def validate(self, requirements: ProfileRequirements) -> ValidationResult:
-        """Validate system against profile requirements."""
-        self.logger.info("Validating system against requirements", 
+    def validate(self, requirements: ProfileRequirements, *,
+                 fast_path: bool = False) -> ValidationResult:
+        """Validate system against profile requirements.
+        
+        With fast_path, stop at the first blocking issue and return a
+        minimal result without warnings, recommendations or estimates.
+        A fast_path result that passes has no recommendations either; call
+        get_recommendations() for them.
+        """
+        self.logger.debug("Validating system against requirements", 
                         ram_gb=requirements.ram_gb, 
                         disk_gb=requirements.disk_gb)
         
+        snap = self._snapshot
         blocking_issues = []
         warnings = []
-        recommendations = []
-        
-        # Check RAM
-        ram_sufficient = self._check_ram(requirements, blocking_issues, warnings)
-        
-        # Check disk space
-        disk_sufficient = self._check_disk(requirements, blocking_issues, warnings)
-        
-        # Check CPU
-        cpu_sufficient = self._check_cpu(requirements, blocking_issues, warnings)
-        
-        # Check GPU
-        gpu_sufficient = self._check_gpu(requirements, blocking_issues, warnings)
         
-        # Check platform compatibility
-        self._check_platform(requirements, blocking_issues, warnings)
+        # Check RAM, disk, CPU, GPU and platform compatibility
+        blocked = _apply_rules(snap, requirements, blocking_issues, warnings,
+                               stop_on_block=fast_path)
+        ram_sufficient = "ram" not in blocked
+        disk_sufficient = "disk" not in blocked
+        cpu_sufficient = "cpu" not in blocked
+        gpu_sufficient = "gpu" not in blocked
+        
+        if fast_path and blocking_issues:
+            return ValidationResult(
+                False, blocking_issues, [], [],
+                ram_sufficient, disk_sufficient, cpu_sufficient, gpu_sufficient,
+                0.0, 0, 0.0
+            )
         
-        # Generate recommendations
-        self._generate_recommendations(requirements, recommendations)
+        # Generate recommendations, which pass/fail gates never read
+        recommendations = [] if fast_path else _generate_recommendations(snap, requirements)
         
         # Calculate estimates
         estimated_download_mb = requirements.download_size_mb
-        estimated_install_time = self._estimate_install_time(requirements)
-        disk_space_after = self.system.disk_free_gb - requirements.disk_gb
+        estimated_install_time = _estimate_install_time(
+            requirements.download_size_mb, requirements.disk_gb,
+            requirements.cuda_required, requirements.metal_required
+        )
+        disk_space_after = snap.disk_free_gb - requirements.disk_gb
         
         safe_to_install = (
             ram_sufficient and 
@@ -111,237 +460,135 @@ class SystemValidator:
             len(blocking_issues) == 0
         )
         
+        # Positional, in field order, to skip building a kwargs dict
         result = ValidationResult(
-            safe_to_install=safe_to_install,
-            blocking_issues=blocking_issues,
-            warnings=warnings,
-            recommendations=recommendations,
-            ram_sufficient=ram_sufficient,
-            disk_sufficient=disk_sufficient,
-            cpu_sufficient=cpu_sufficient,
-            gpu_sufficient=gpu_sufficient,
-            estimated_download_mb=estimated_download_mb,
-            estimated_install_time_minutes=estimated_install_time,
-            disk_space_after_gb=disk_space_after
+            safe_to_install, blocking_issues, warnings, recommendations,
+            ram_sufficient, disk_sufficient, cpu_sufficient, gpu_sufficient,
+            estimated_download_mb, estimated_install_time, disk_space_after
         )
         
-        self.logger.info("Validation completed", 
+        self.logger.debug("Validation completed", 
                         safe_to_install=safe_to_install,
                         blocking_issues=len(blocking_issues),
                         warnings=len(warnings))
         
         return result
     
-    def _check_ram(self, requirements: ProfileRequirements, 
-                   blocking_issues: List[str], warnings: List[str]) -> bool:
-        """Check RAM requirements."""
-        if self.system.ram_total_gb < requirements.ram_gb:
-            blocking_issues.append(
-                f"Insufficient RAM: {self.system.ram_total_gb}GB available, "
-                f"{requirements.ram_gb}GB required"
-            )
-            return False
-        
-        if self.system.ram_available_gb < requirements.ram_gb * 0.5:
-            warnings.append(
-                f"Low available RAM: {self.system.ram_available_gb}GB available, "
-                f"consider closing other applications"
-            )
-        
-        return True
-    
-    def _check_disk(self, requirements: ProfileRequirements,
-                    blocking_issues: List[str], warnings: List[str]) -> bool:
-        """Check disk space requirements."""
-        if self.system.disk_free_gb < requirements.disk_gb:
-            blocking_issues.append(
-                f"Insufficient disk space: {self.system.disk_free_gb}GB available, "
-                f"{requirements.disk_gb}GB required"
-            )
-            return False
-        
-        # Warn if less than 20% free space after installation
-        space_after = self.system.disk_free_gb - requirements.disk_gb
-        if space_after < self.system.disk_total_gb * 0.2:
-            warnings.append(
-                f"Low disk space after installation: {space_after:.1f}GB will remain "
-                f"({(space_after/self.system.disk_total_gb)*100:.1f}% of total disk)"
-            )
-        
-        return True
+    def get_recommendations(self, requirements: ProfileRequirements) -> List[str]:
+        """Return recommendations for an optimal setup of a profile."""
+        return _generate_recommendations(self._snapshot, requirements)
     
-    def _check_cpu(self, requirements: ProfileRequirements,
-                   blocking_issues: List[str], warnings: List[str]) -> bool:
-        """Check CPU requirements."""
-        if self.system.cpu_cores < requirements.cpu_cores:
-            blocking_issues.append(
-                f"Insufficient CPU cores: {self.system.cpu_cores} available, "
-                f"{requirements.cpu_cores} required"
-            )
-            return False
-        
-        return True
-    
-    def _check_gpu(self, requirements: ProfileRequirements,
-                   blocking_issues: List[str], warnings: List[str]) -> bool:
-        """Check GPU requirements."""
-        if not requirements.gpu_required:
-            return True
-        
-        if not self.system.gpu_name:
-            blocking_issues.append("GPU required but not detected")
-            return False
-        
-        # Check specific GPU vendor requirements
-        if requirements.gpu_vendor:
-            if self.system.gpu_vendor != requirements.gpu_vendor:
-                blocking_issues.append(
-                    f"Wrong GPU vendor: {self.system.gpu_vendor} detected, "
-                    f"{requirements.gpu_vendor} required"
-                )
-                return False
-        
-        # Check CUDA requirements
-        if requirements.cuda_required and not self.system.cuda_available:
-            blocking_issues.append("CUDA required but not available")
-            return False
-        
-        # Check Metal requirements
-        if requirements.metal_required and not self.system.metal_available:
-            blocking_issues.append("Metal Performance Shaders required but not available")
-            return False
-        
-        return True
-    
-    def _check_platform(self, requirements: ProfileRequirements,
-                        blocking_issues: List[str], warnings: List[str]) -> None:
-        """Check platform compatibility."""
-        # Check architecture support
-        if requirements.supported_archs:
-            if self.system.arch not in requirements.supported_archs:
-                blocking_issues.append(
-                    f"Unsupported architecture: {self.system.arch}, "
-                    f"supported: {', '.join(requirements.supported_archs)}"
-                )
-        
-        # Check OS version (basic check)
-        if requirements.min_os_version:
-            # This is a simplified check - in practice, you'd want more sophisticated version comparison
-            if self.system.os_name == "macOS":
-                try:
-                    current_version = tuple(map(int, self.system.os_version.split('.')))
-                    min_version = tuple(map(int, requirements.min_os_version.split('.')))
-                    if current_version < min_version:
-                        blocking_issues.append(
-                            f"OS version too old: {self.system.os_version}, "
-                            f"minimum: {requirements.min_os_version}"
-                        )
-                except (ValueError, AttributeError):
-                    warnings.append("Could not parse OS version for comparison")
-    
-    def _generate_recommendations(self, requirements: ProfileRequirements,
-                                 recommendations: List[str]) -> None:
-        """Generate recommendations for optimal setup."""
-        
-        # RAM recommendations
-        if self.system.ram_total_gb < requirements.ram_gb * 1.5:
-            recommendations.append(
-                f"Consider upgrading to {requirements.ram_gb * 2}GB RAM for better performance"
-            )
-        
-        # Disk recommendations
-        if self.system.disk_free_gb < requirements.disk_gb * 2:
-            recommendations.append(
-                "Consider freeing up disk space or using external storage"
-            )
-        
-        # GPU recommendations
-        if requirements.gpu_required and not self.system.gpu_name:
-            recommendations.append("Consider adding a dedicated GPU for better performance")
-        
-        # Package manager recommendations
-        if not self.system.package_managers:
-            recommendations.append("Install a package manager (brew, apt, choco) for easier setup")
-        
-        # Network recommendations
-        if requirements.internet_required and requirements.download_size_mb > 1000:
-            recommendations.append("Ensure stable internet connection for large downloads")
-    
-    def _estimate_install_time(self, requirements: ProfileRequirements) -> int:
-        """Estimate installation time in minutes."""
-        base_time = 5  # Base time for any installation
-        
-        # Add time based on download size
-        if requirements.download_size_mb > 0:
-            # Assume 10 MB/s download speed
-            download_time = requirements.download_size_mb / 10 / 60
-            base_time += download_time
-        
-        # Add time based on disk space (compilation, extraction)
-        if requirements.disk_gb > 5:
-            base_time += requirements.disk_gb * 0.5
-        
-        # Add time for GPU drivers if needed
-        if requirements.cuda_required or requirements.metal_required:
-            base_time += 10
-        
-        return int(base_time)
+    def validate_multiple_profiles_fast(self, requirements_list: List[ProfileRequirements]) -> List[bool]:
+        """Return whether each profile is safe to install, without building results.
+        
+        RAM, disk and CPU needs are compared in one batch (vectorized when
+        NumPy is installed); only profiles that pass go through the
+        remaining rules. Call validate() for profiles that need messages.
+        """
+        snap = self._snapshot
+        return [
+            sufficient and not _apply_rules(snap, requirements, [], [], stop_on_block=True)
+            for sufficient, requirements in zip(_resources_sufficient(snap, requirements_list),
+                                                requirements_list)
+        ]
     
     def validate_multiple_profiles(self, requirements_list: List[ProfileRequirements]) -> Dict[str, ValidationResult]:
         """Validate system against multiple profiles."""
         results = {}
         
-        total_ram = sum(req.ram_gb for req in requirements_list)
-        total_disk = sum(req.disk_gb for req in requirements_list)
-        total_download = sum(req.download_size_mb for req in requirements_list)
+        # Aggregate every profile's needs in a single pass
+        total_ram = total_disk = total_download = 0.0
+        gpu_required = cuda_required = metal_required = False
+        for req in requirements_list:
+            total_ram += req.ram_gb
+            total_disk += req.disk_gb
+            total_download += req.download_size_mb
+            gpu_required |= req.gpu_required
+            cuda_required |= req.cuda_required
+            metal_required |= req.metal_required
         
         # Create combined requirements
         combined_requirements = ProfileRequirements(
             ram_gb=total_ram,
             disk_gb=total_disk,
             download_size_mb=total_download,
-            gpu_required=any(req.gpu_required for req in requirements_list),
-            cuda_required=any(req.cuda_required for req in requirements_list),
-            metal_required=any(req.metal_required for req in requirements_list)
+            gpu_required=gpu_required,
+            cuda_required=cuda_required,
+            metal_required=metal_required
         )
         
         # Validate each profile individually
         for i, requirements in enumerate(requirements_list):
             result = self.validate(requirements)
             results[f"profile_{i}"] = result
+        profile_results = list(results.values())
         
-        # Validate combined requirements
-        combined_result = self.validate(combined_requirements)
-        results["combined"] = combined_result
+        # Combine the per-profile verdicts with the summed RAM and disk needs
+        # instead of running a full validation of the combined requirements
+        snap = self._snapshot
+        blocking_issues = []
+        warnings = []
+        blocked = _apply_rules(snap, combined_requirements, blocking_issues, warnings,
+                               rules=_ADDITIVE_RULES)
+        
+        # Carry over the CPU, GPU, architecture and OS issues of the profiles
+        # that failed, so an unsafe combined result always says why
+        for requirements, result in zip(requirements_list, profile_results):
+            if result.safe_to_install:
+                continue
+            profile_issues = []
+            _apply_rules(snap, requirements, profile_issues, [], rules=_PER_PROFILE_RULES)
+            blocking_issues.extend(issue for issue in profile_issues
+                                   if issue not in blocking_issues)
+        
+        ram_sufficient = "ram" not in blocked
+        disk_sufficient = "disk" not in blocked
+        cpu_sufficient = all(result.cpu_sufficient for result in profile_results)
+        gpu_sufficient = all(result.gpu_sufficient for result in profile_results)
+        safe_to_install = (
+            ram_sufficient and
+            disk_sufficient and
+            all(result.safe_to_install for result in profile_results)
+        )
+        
+        results["combined"] = ValidationResult(
+            safe_to_install, blocking_issues, warnings,
+            _generate_recommendations(snap, combined_requirements),
+            ram_sufficient, disk_sufficient, cpu_sufficient, gpu_sufficient,
+            total_download,
+            _estimate_install_time(total_download, total_disk, cuda_required, metal_required),
+            snap.disk_free_gb - total_disk
+        )
         
         return results
     
-    def get_optimization_suggestions(self) -> List[str]:
-        """Get suggestions for optimizing the system for development."""
-        suggestions = []
+    def iter_optimization_suggestions(self) -> Iterator[str]:
+        """Yield suggestions for optimizing the system for development."""
+        snap = self._snapshot
         
         # RAM optimization
-        if self.system.ram_total_gb < 8:
-            suggestions.append("Consider upgrading to 16GB+ RAM for better development experience")
+        if snap.ram_total_gb < 8:
+            yield "Consider upgrading to 16GB+ RAM for better development experience"
         
         # Storage optimization
-        if self.system.disk_free_gb < 50:
-            suggestions.append("Free up disk space or add external storage for development projects")
+        if snap.disk_free_gb < 50:
+            yield "Free up disk space or add external storage for development projects"
         
         # Package manager optimization
-        if not self.system.package_managers:
-            if self.system.os_name == "macOS":
-                suggestions.append("Install Homebrew: /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"")
-            elif self.system.os_name == "Linux":
-                suggestions.append("Install a package manager (apt, yum, dnf, or pacman)")
-            elif self.system.os_name == "Windows":
-                suggestions.append("Install Chocolatey or winget for easier package management")
-        
-        # Development tools
-        if "git" not in self.system.languages:
-            suggestions.append("Install Git for version control")
-        
-        if "python" not in self.system.languages:
-            suggestions.append("Install Python 3.8+ for development")
-        
-        return suggestions
\ No newline at end of file
+        if not snap.has_package_managers:
+            suggestion = _PACKAGE_MANAGER_SUGGESTIONS.get(snap.os_name)
+            if suggestion:
+                yield suggestion
+        
+        # Development tools; languages is a dict keyed by tool name, so
+        # these are hash lookups. Read it once, as detecting it is lazy.
+        languages = self.system.languages
+        if "git" not in languages:
+            yield "Install Git for version control"
+        
+        if "python" not in languages:
+            yield "Install Python 3.8+ for development"
+    
+    def get_optimization_suggestions(self) -> List[str]:
+        """Get suggestions for optimizing the system for development."""
+        return list(self.iter_optimization_suggestions())
@@ -2,16 +2,118 @@
 Development environment management for he2plus library
 """
 
+import atexit
+import hashlib
+import json
+import logging
 import os
 import sys
+import shutil
 import subprocess
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional, Sequence, Set
+import requests
 from .utils import Logger
 
 
+# For commands whose output is never read; the kernel discards it instead
+# of it being buffered into bytes objects
+_DEVNULL = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+
+# Global Git settings written when the user has no Git config yet; user
+# name and email are placeholders the user is expected to change
+_DEFAULT_GITCONFIG = """\
+[user]
+\tname = he2plus User
+\temail = user@he2plus.local
+[init]
+\tdefaultBranch = main
+[pull]
+\trebase = false
+"""
+
+
+# Tools whose presence on PATH is part of the setup fingerprint
+_FINGERPRINT_TOOLS = ("node", "npm", "git", "docker", "docker-compose", "brownie")
+
+# Seconds a recorded setup or a latest PyPI version stays valid, so pip
+# upgrades still run daily
+_SETUP_CACHE_TTL = 24 * 60 * 60
+
+
+def _setup_cache_path() -> Path:
+    """Location of the on-disk setup cache."""
+    return Path.home() / ".he2plus" / "cache" / "setup.json"
+
+
+def _pypi_cache_path() -> Path:
+    """Location of the on-disk cache of latest PyPI versions."""
+    return Path.home() / ".he2plus" / "cache" / "pypi_latest.json"
+
+
+# Seconds the PyPI lookups of one setup may take together
+_PYPI_TIMEOUT = 5
+
+
+def _fetch_latest_version(package: str) -> str:
+    """Latest version of a package according to PyPI"""
+    response = requests.get(f"https://pypi.org/pypi/{package}/json", timeout=_PYPI_TIMEOUT)
+    response.raise_for_status()
+    return response.json()["info"]["version"]
+
+
+# pip packages providing the brownie command
+_BROWNIE_PACKAGES = ("eth-brownie",)
+
+# Install command per Linux package manager, in detection order
+_LINUX_INSTALL_COMMANDS = {
+    "apt": ['sudo', 'apt', 'install', '-y'],
+    "dnf": ['sudo', 'dnf', 'install', '-y'],
+    "yum": ['sudo', 'yum', 'install', '-y'],
+    "pacman": ['sudo', 'pacman', '-S', '--noconfirm'],
+    "zypper": ['sudo', 'zypper', '--non-interactive', 'install'],
+}
+
+# System packages per tool on PATH as (profile component, package names by
+# package manager); "*" covers the managers without their own entry
+_LINUX_TOOL_PACKAGES = {
+    "node": ("nodejs", {"*": ("nodejs", "npm")}),
+    "git": ("git", {"*": ("git",)}),
+    "docker": ("docker", {"apt": ("docker.io",), "*": ("docker",)}),
+    "docker-compose": ("docker", {"*": ("docker-compose",)}),
+}
+
+
 class DevEnvironment:
     """Development environment setup and management"""
     
+    # Setup components as (profile key, setup method, components it needs
+    # first), listed so that every component comes after its dependencies
+    _COMPONENTS = (
+        ("python", "_setup_python", frozenset()),
+        ("nodejs", "_setup_nodejs", frozenset()),
+        ("git", "_setup_git", frozenset()),
+        ("docker", "_setup_docker", frozenset()),
+        ("brownie", "_setup_brownie", frozenset({"python"})),
+        ("hardhat", "_setup_hardhat", frozenset({"nodejs"})),
+        ("react", "_setup_react", frozenset({"nodejs"})),
+    )
+    
+    # Worker threads shared by every instance, created on first setup
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
+    # Setups run concurrently, but system package managers hold a global
+    # lock (and may prompt for sudo) and npm -g writes one shared prefix, so
+    # installs through either still go one at a time
+    _system_install_lock = threading.Lock()
+    _npm_global_lock = threading.Lock()
+    
     def __init__(self, logger: Logger, config):
         """
         Initialize development environment manager
@@ -23,6 +125,13 @@ class DevEnvironment:
         self.logger = logger
         self.config = config
         self.platform = sys.platform.lower()
+        self._which_cache: Dict[str, str] = {}
+        
+        # Linux package manager, detected once instead of trying each in turn
+        self._pkg_mgr = None
+        if self.platform == "linux":
+            self._pkg_mgr = next((manager for manager in _LINUX_INSTALL_COMMANDS
+                                  if shutil.which(manager)), None)
         
         self.logger.info("DevEnvironment initialized")
     
@@ -32,56 +141,261 @@ class DevEnvironment:
         
         Args:
             profile: Environment profile to use
-            
+        
         Returns:
             True if setup was successful, False otherwise
         """
         try:
-            self.logger.info(f"Setting up development environment with profile: {profile}")
+            self.logger.info("Setting up development environment with profile: %s", profile)
             
             # Get profile configuration
             profile_config = self.config.get(f"dev.profiles.{profile}", {})
             if not profile_config:
-                self.logger.warning(f"Profile {profile} not found, using default")
+                self.logger.warning("Profile %s not found, using default", profile)
                 profile_config = self.config.get("dev.profiles.default", {})
             
-            # Setup components based on profile
+            # Nothing to do if this profile already set up on an unchanged system
+            fingerprint = self._setup_fingerprint(profile_config)
+            cache = self._load_cache(_setup_cache_path())
+            entry = cache.get(profile)
+            if (isinstance(entry, dict) and entry.get("fingerprint") == fingerprint
+                    and 0 <= time.time() - entry.get("created_at", 0) < _SETUP_CACHE_TTL):
+                self.logger.info("Profile %s is already set up, skipping", profile)
+                return True
+            
+            enabled = [
+                component for component in self._COMPONENTS
+                if profile_config.get(component[0], False)
+            ]
+            enabled_names = {name for name, _, _ in enabled}
+            
+            # Brownie is a pip package, so when Python is set up too it joins
+            # the Python pip run and its own setup only checks the command
+            setup_kwargs = {}
+            if {"python", "brownie"} <= enabled_names:
+                setup_kwargs["python"] = {"extra_packages": _BROWNIE_PACKAGES}
+                setup_kwargs["brownie"] = {"install": False}
+            
+            # Install missing system tools in one package manager run up front;
+            # anything still missing afterwards goes through its own setup
+            if self.platform == "linux":
+                self._install_linux_packages(enabled_names)
+            
+            # Setups spend most of their time waiting on installers, so run
+            # them concurrently; dependencies are queued before the setups
+            # waiting on them, so a waiting setup never starves its prerequisite
             success = True
-            
-            if profile_config.get("python", False):
-                success &= self._setup_python()
-            
-            if profile_config.get("nodejs", False):
-                success &= self._setup_nodejs()
-            
-            if profile_config.get("git", False):
-                success &= self._setup_git()
-            
-            if profile_config.get("docker", False):
-                success &= self._setup_docker()
-            
-            if profile_config.get("brownie", False):
-                success &= self._setup_brownie()
-            
-            if profile_config.get("hardhat", False):
-                success &= self._setup_hardhat()
-            
-            if profile_config.get("react", False):
-                success &= self._setup_react()
+            if enabled:
+                executor = self._get_executor()
+                futures = {}
+                for name, method, deps in enabled:
+                    setup = partial(getattr(self, method), **setup_kwargs.get(name, {}))
+                    prerequisites = [futures[dep] for dep in deps if dep in futures]
+                    futures[name] = executor.submit(self._run_after, prerequisites, setup)
+                success = all([future.result() for future in futures.values()])
             
             if success:
+                cache[profile] = {"fingerprint": fingerprint, "created_at": time.time()}
+                self._save_cache(_setup_cache_path(), cache)
                 self.logger.info("Development environment setup completed successfully")
             else:
                 self.logger.warning("Development environment setup completed with some issues")
             
             return success
-            
+        
         except Exception as e:
-            self.logger.error(f"Error setting up development environment: {e}")
+            self.logger.error("Error setting up development environment: %s", e)
+            return False
+    
+    def _setup_fingerprint(self, profile_config: Dict[str, Any]) -> str:
+        """Hash of everything a completed setup depends on, cheap enough to compute every run"""
+        try:
+            config_mtime = os.stat(self.config.config_path).st_mtime
+        except (AttributeError, TypeError, OSError):
+            config_mtime = None
+        
+        state = {
+            "profile": profile_config,
+            "platform": self.platform,
+            "python": sys.version,
+            "executable": sys.executable,
+            "tools": {tool: shutil.which(tool) for tool in _FINGERPRINT_TOOLS},
+            "config_mtime": config_mtime,
+        }
+        encoded = json.dumps(state, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def _load_cache(self, path: Path) -> Dict[str, Any]:
+        """Load an on-disk JSON cache, or an empty one if missing or corrupt"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        return data if isinstance(data, dict) else {}
+    
+    def _save_cache(self, path: Path, data: Dict[str, Any]) -> None:
+        """Atomically write an on-disk JSON cache, ignoring failures"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug("Could not write cache %s: %s", path, e)
+    
+    def _latest_versions(self, packages: Sequence[str]) -> Dict[str, str]:
+        """Latest PyPI version of each package, cached on disk for a day"""
+        path = _pypi_cache_path()
+        cache = self._load_cache(path)
+        now = time.time()
+        latest = {}
+        missing = []
+        for package in packages:
+            entry = cache.get(package)
+            if isinstance(entry, dict) and 0 <= now - entry.get("fetched_at", 0) < _SETUP_CACHE_TTL:
+                latest[package] = entry.get("version")
+            else:
+                missing.append(package)
+        if not missing:
+            return latest
+        
+        # Look the rest up concurrently under one deadline; packages PyPI
+        # doesn't answer for in time are left to pip. A pool of its own, as
+        # this runs on a worker of the shared setup pool
+        pool = ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix="he2plus-pypi")
+        try:
+            futures = {pool.submit(_fetch_latest_version, package): package for package in missing}
+            done, _ = wait(futures, timeout=_PYPI_TIMEOUT)
+        finally:
+            pool.shutdown(wait=False)
+        
+        fetched = False
+        for future in done:
+            try:
+                version = future.result()
+            except (requests.RequestException, ValueError, KeyError, TypeError):
+                continue
+            package = futures[future]
+            cache[package] = {"version": version, "fetched_at": now}
+            latest[package] = version
+            fetched = True
+        
+        if fetched:
+            self._save_cache(path, cache)
+        return latest
+    
+    def _outdated_packages(self, packages: Sequence[str]) -> List[str]:
+        """Packages that are missing or not at their latest PyPI version"""
+        latest = self._latest_versions(packages)
+        outdated = []
+        for package in packages:
+            try:
+                current = metadata.version(package)
+            except metadata.PackageNotFoundError:
+                current = None
+            if current is None or current != latest.get(package):
+                outdated.append(package)
+        return outdated
+    
+    def _has(self, tool: str) -> bool:
+        """Check whether a tool is on PATH, remembering the ones found"""
+        # Misses aren't cached, so a tool installed later is still found
+        if tool not in self._which_cache:
+            path = shutil.which(tool)
+            if path is None:
+                return False
+            self._which_cache[tool] = path
+        return True
+    
+    @property
+    def has_node(self) -> bool:
+        """Whether node is on PATH"""
+        return self._has('node')
+    
+    @property
+    def has_git(self) -> bool:
+        """Whether git is on PATH"""
+        return self._has('git')
+    
+    @property
+    def has_docker(self) -> bool:
+        """Whether docker is on PATH"""
+        return self._has('docker')
+    
+    @property
+    def has_brownie(self) -> bool:
+        """Whether brownie is on PATH"""
+        return self._has('brownie')
+    
+    def _install_linux_packages(self, components: Set[str]) -> bool:
+        """Install the system packages of every missing tool with a single package manager run"""
+        tools = [
+            tool for tool, (component, _) in _LINUX_TOOL_PACKAGES.items()
+            if component in components and not self._has(tool)
+        ]
+        if not tools:
+            return True
+        
+        if self._install_linux_tools(tools):
+            return True
+        
+        self.logger.warning("Batch install of system packages failed, installing tools one by one")
+        return False
+    
+    def _install_linux_tools(self, tools: List[str]) -> bool:
+        """Install the system packages for tools with the detected package manager"""
+        if self._pkg_mgr is None:
+            return False
+        
+        packages = []
+        for tool in tools:
+            names = _LINUX_TOOL_PACKAGES[tool][1]
+            packages.extend(names.get(self._pkg_mgr, names["*"]))
+        
+        try:
+            with self._system_install_lock:
+                subprocess.run([*_LINUX_INSTALL_COMMANDS[self._pkg_mgr], *packages],
+                               check=True, **_DEVNULL)
+        except (subprocess.CalledProcessError, FileNotFoundError):
             return False
+        
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info("Installed %s", ' '.join(packages))
+        return True
+    
+    def _run_streaming(self, cmd: List[str]) -> int:
+        """Run a long install, streaming its output line by line to the debug log"""
+        if not self.logger.is_enabled_for(logging.DEBUG):
+            return subprocess.run(cmd, **_DEVNULL).returncode
+        
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as process:
+            for line in process.stdout:
+                self.logger.debug("%s", line.rstrip())
+            return process.wait()
+    
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Shared setup thread pool, so repeated setups don't respawn worker threads"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=len(cls._COMPONENTS),
+                                                   thread_name_prefix="he2plus-setup")
+                atexit.register(cls._executor.shutdown)
+            return cls._executor
+    
+    @staticmethod
+    def _run_after(prerequisites: List[Future], setup: Callable[[], bool]) -> bool:
+        """Run setup once all prerequisites have finished, whatever their results"""
+        for prerequisite in prerequisites:
+            prerequisite.result()
+        return setup()
     
-    def _setup_python(self) -> bool:
-        """Set up Python development environment"""
+    def _setup_python(self, extra_packages: Sequence[str] = ()) -> bool:
+        """Set up Python development environment, installing extra_packages in the same pip run"""
         try:
             self.logger.info("Setting up Python environment")
             
@@ -97,21 +411,37 @@ class DevEnvironment:
                 "wheel",
                 "virtualenv",
                 "pipenv",
-                "poetry"
+                "poetry",
+                *extra_packages
             ]
             
+            # Only hand pip the packages that actually need work
+            packages = self._outdated_packages(packages)
+            if not packages:
+                self.logger.info("Python packages are up to date")
+                return True
+            
+            # One pip run resolves and fetches everything together
+            result = subprocess.run([sys.executable, '-m', 'pip', 'install', '--upgrade', *packages], 
+                                    **_DEVNULL)
+            if result.returncode == 0:
+                if self.logger.is_enabled_for(logging.INFO):
+                    self.logger.info("Installed/updated %s", ', '.join(packages))
+                return True
+            
+            # Retry one at a time to find out which packages failed
             for package in packages:
                 try:
                     subprocess.run([sys.executable, '-m', 'pip', 'install', '--upgrade', package], 
-                                 check=True, capture_output=True)
-                    self.logger.info(f"Installed/updated {package}")
+                                 check=True, **_DEVNULL)
+                    self.logger.info("Installed/updated %s", package)
                 except subprocess.CalledProcessError:
-                    self.logger.warning(f"Failed to install {package}")
+                    self.logger.warning("Failed to install %s", package)
             
             return True
-            
+        
         except Exception as e:
-            self.logger.error(f"Error setting up Python: {e}")
+            self.logger.error("Error setting up Python: %s", e)
             return False
     
     def _setup_nodejs(self) -> bool:
@@ -120,37 +450,37 @@ class DevEnvironment:
             self.logger.info("Setting up Node.js environment")
             
             # Check if Node.js is available
-            try:
-                result = subprocess.run(['node', '--version'], capture_output=True, text=True)
-                if result.returncode != 0:
-                    self.logger.warning("Node.js not found, attempting to install")
-                    return self._install_nodejs()
-            except FileNotFoundError:
+            if not self.has_node:
                 self.logger.warning("Node.js not found, attempting to install")
                 return self._install_nodejs()
             
-            # Install common Node.js packages
+            # Install common Node.js packages (npm comes with Node.js)
             packages = [
-                "npm",
                 "yarn",
                 "pnpm"
             ]
             
-            for package in packages:
-                try:
-                    if package == "npm":
-                        # npm comes with Node.js
-                        continue
-                    subprocess.run(['npm', 'install', '-g', package], 
-                                 check=True, capture_output=True)
-                    self.logger.info(f"Installed {package}")
-                except subprocess.CalledProcessError:
-                    self.logger.warning(f"Failed to install {package}")
+            with self._npm_global_lock:
+                # One npm run fetches both packages from the registry together
+                result = subprocess.run(['npm', 'install', '-g', *packages], **_DEVNULL)
+                if result.returncode == 0:
+                    if self.logger.is_enabled_for(logging.INFO):
+                        self.logger.info("Installed %s", ', '.join(packages))
+                    return True
+                
+                # Retry one at a time to find out which packages failed
+                for package in packages:
+                    try:
+                        subprocess.run(['npm', 'install', '-g', package], 
+                                     check=True, **_DEVNULL)
+                        self.logger.info("Installed %s", package)
+                    except subprocess.CalledProcessError:
+                        self.logger.warning("Failed to install %s", package)
             
             return True
-            
+        
         except Exception as e:
-            self.logger.error(f"Error setting up Node.js: {e}")
+            self.logger.error("Error setting up Node.js: %s", e)
             return False
     
     def _setup_git(self) -> bool:
@@ -159,12 +489,7 @@ class DevEnvironment:
             self.logger.info("Setting up Git environment")
             
             # Check if Git is available
-            try:
-                result = subprocess.run(['git', '--version'], capture_output=True, text=True)
-                if result.returncode != 0:
-                    self.logger.warning("Git not found, attempting to install")
-                    return self._install_git()
-            except FileNotFoundError:
+            if not self.has_git:
                 self.logger.warning("Git not found, attempting to install")
                 return self._install_git()
             
@@ -172,9 +497,9 @@ class DevEnvironment:
             self._configure_git()
             
             return True
-            
+        
         except Exception as e:
-            self.logger.error(f"Error setting up Git: {e}")
+            self.logger.error("Error setting up Git: %s", e)
             return False
     
     def _setup_docker(self) -> bool:
@@ -183,60 +508,43 @@ class DevEnvironment:
             self.logger.info("Setting up Docker environment")
             
             # Check if Docker is available
-            try:
-                result = subprocess.run(['docker', '--version'], capture_output=True, text=True)
-                if result.returncode != 0:
-                    self.logger.warning("Docker not found, attempting to install")
-                    return self._install_docker()
-            except FileNotFoundError:
+            if not self.has_docker:
                 self.logger.warning("Docker not found, attempting to install")
                 return self._install_docker()
             
             # Check if Docker Compose is available
-            try:
-                result = subprocess.run(['docker-compose', '--version'], capture_output=True, text=True)
-                if result.returncode != 0:
-                    self.logger.warning("Docker Compose not found, attempting to install")
-                    self._install_docker_compose()
-            except FileNotFoundError:
+            if not self._has('docker-compose'):
                 self.logger.warning("Docker Compose not found, attempting to install")
                 self._install_docker_compose()
             
             return True
-            
+        
         except Exception as e:
-            self.logger.error(f"Error setting up Docker: {e}")
+            self.logger.error("Error setting up Docker: %s", e)
             return False
     
-    def _setup_brownie(self) -> bool:
-        """Set up Brownie development environment"""
+    def _setup_brownie(self, install: bool = True) -> bool:
+        """Set up Brownie development environment, skipping the pip install if it ran elsewhere"""
         try:
             self.logger.info("Setting up Brownie environment")
             
             # Install Brownie
-            try:
-                subprocess.run([sys.executable, '-m', 'pip', 'install', 'eth-brownie'], 
-                             check=True, capture_output=True)
+            if install:
+                if self._run_streaming([sys.executable, '-m', 'pip', 'install', *_BROWNIE_PACKAGES]) != 0:
+                    self.logger.warning("Failed to install Brownie")
+                    return False
                 self.logger.info("Installed Brownie")
-            except subprocess.CalledProcessError:
-                self.logger.warning("Failed to install Brownie")
-                return False
             
-            # Initialize Brownie if not already done
-            try:
-                result = subprocess.run(['brownie', '--version'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    self.logger.info("Brownie is ready")
-                else:
-                    self.logger.warning("Brownie installation may have issues")
-            except FileNotFoundError:
+            # Check the brownie command is now on PATH
+            if not self.has_brownie:
                 self.logger.warning("Brownie command not found")
                 return False
+            self.logger.info("Brownie is ready")
             
             return True
-            
+        
         except Exception as e:
-            self.logger.error(f"Error setting up Brownie: {e}")
+            self.logger.error("Error setting up Brownie: %s", e)
             return False
     
     def _setup_hardhat(self) -> bool:
@@ -245,28 +553,22 @@ class DevEnvironment:
             self.logger.info("Setting up Hardhat environment")
             
             # Check if Node.js is available
-            try:
-                result = subprocess.run(['node', '--version'], capture_output=True, text=True)
-                if result.returncode != 0:
-                    self.logger.error("Node.js required for Hardhat")
-                    return False
-            except FileNotFoundError:
+            if not self.has_node:
                 self.logger.error("Node.js required for Hardhat")
                 return False
             
             # Install Hardhat globally
-            try:
-                subprocess.run(['npm', 'install', '-g', 'hardhat'], 
-                             check=True, capture_output=True)
-                self.logger.info("Installed Hardhat")
-            except subprocess.CalledProcessError:
+            with self._npm_global_lock:
+                returncode = self._run_streaming(['npm', 'install', '-g', 'hardhat'])
+            if returncode != 0:
                 self.logger.warning("Failed to install Hardhat")
                 return False
+            self.logger.info("Installed Hardhat")
             
             return True
-            
+        
         except Exception as e:
-            self.logger.error(f"Error setting up Hardhat: {e}")
+            self.logger.error("Error setting up Hardhat: %s", e)
             return False
     
     def _setup_react(self) -> bool:
@@ -275,28 +577,22 @@ class DevEnvironment:
             self.logger.info("Setting up React environment")
             
             # Check if Node.js is available
-            try:
-                result = subprocess.run(['node', '--version'], capture_output=True, text=True)
-                if result.returncode != 0:
-                    self.logger.error("Node.js required for React")
-                    return False
-            except FileNotFoundError:
+            if not self.has_node:
                 self.logger.error("Node.js required for React")
                 return False
             
             # Install Create React App globally
-            try:
-                subprocess.run(['npm', 'install', '-g', 'create-react-app'], 
-                             check=True, capture_output=True)
-                self.logger.info("Installed Create React App")
-            except subprocess.CalledProcessError:
+            with self._npm_global_lock:
+                returncode = self._run_streaming(['npm', 'install', '-g', 'create-react-app'])
+            if returncode != 0:
                 self.logger.warning("Failed to install Create React App")
                 return False
+            self.logger.info("Installed Create React App")
             
             return True
-            
+        
         except Exception as e:
-            self.logger.error(f"Error setting up React: {e}")
+            self.logger.error("Error setting up React: %s", e)
             return False
     
     def _install_nodejs(self) -> bool:
@@ -305,7 +601,8 @@ class DevEnvironment:
             if self.platform == "darwin":
                 # Try Homebrew first
                 try:
-                    subprocess.run(['brew', 'install', 'node'], check=True, capture_output=True)
+                    with self._system_install_lock:
+                        subprocess.run(['brew', 'install', 'node'], check=True, **_DEVNULL)
                     return True
                 except subprocess.CalledProcessError:
                     pass
@@ -313,34 +610,23 @@ class DevEnvironment:
                 # Fallback to official installer
                 self.logger.info("Please install Node.js manually from https://nodejs.org/")
                 return False
-                
+            
             elif self.platform == "linux":
                 # Try package manager
-                try:
-                    subprocess.run(['sudo', 'apt', 'install', '-y', 'nodejs', 'npm'], 
-                                 check=True, capture_output=True)
+                if self._install_linux_tools(['node']):
                     return True
-                except subprocess.CalledProcessError:
-                    pass
-                
-                try:
-                    subprocess.run(['sudo', 'yum', 'install', '-y', 'nodejs', 'npm'], 
-                                 check=True, capture_output=True)
-                    return True
-                except subprocess.CalledProcessError:
-                    pass
                 
                 self.logger.info("Please install Node.js manually from https://nodejs.org/")
                 return False
-                
+            
             elif self.platform == "win32":
                 self.logger.info("Please install Node.js manually from https://nodejs.org/")
                 return False
             
             return False
-            
+        
         except Exception as e:
-            self.logger.error(f"Error installing Node.js: {e}")
+            self.logger.error("Error installing Node.js: %s", e)
             return False
     
     def _install_git(self) -> bool:
@@ -349,48 +635,38 @@ class DevEnvironment:
             if self.platform == "darwin":
                 # Try Homebrew first
                 try:
-                    subprocess.run(['brew', 'install', 'git'], check=True, capture_output=True)
+                    with self._system_install_lock:
+                        subprocess.run(['brew', 'install', 'git'], check=True, **_DEVNULL)
                     return True
                 except subprocess.CalledProcessError:
                     pass
                 
                 # Fallback to Xcode command line tools
                 try:
-                    subprocess.run(['xcode-select', '--install'], check=True, capture_output=True)
+                    subprocess.run(['xcode-select', '--install'], check=True, **_DEVNULL)
                     return True
                 except subprocess.CalledProcessError:
                     pass
                 
                 self.logger.info("Please install Git manually from https://git-scm.com/")
                 return False
-                
+            
             elif self.platform == "linux":
                 # Try package manager
-                try:
-                    subprocess.run(['sudo', 'apt', 'install', '-y', 'git'], 
-                                 check=True, capture_output=True)
+                if self._install_linux_tools(['git']):
                     return True
-                except subprocess.CalledProcessError:
-                    pass
-                
-                try:
-                    subprocess.run(['sudo', 'yum', 'install', '-y', 'git'], 
-                                 check=True, capture_output=True)
-                    return True
-                except subprocess.CalledProcessError:
-                    pass
                 
                 self.logger.info("Please install Git manually from https://git-scm.com/")
                 return False
-                
+            
             elif self.platform == "win32":
                 self.logger.info("Please install Git manually from https://git-scm.com/")
                 return False
             
             return False
-            
+        
         except Exception as e:
-            self.logger.error(f"Error installing Git: {e}")
+            self.logger.error("Error installing Git: %s", e)
             return False
     
     def _install_docker(self) -> bool:
@@ -399,34 +675,23 @@ class DevEnvironment:
             if self.platform == "darwin":
                 self.logger.info("Please install Docker Desktop from https://www.docker.com/products/docker-desktop")
                 return False
-                
+            
             elif self.platform == "linux":
                 # Try package manager
-                try:
-                    subprocess.run(['sudo', 'apt', 'install', '-y', 'docker.io'], 
-                                 check=True, capture_output=True)
-                    return True
-                except subprocess.CalledProcessError:
-                    pass
-                
-                try:
-                    subprocess.run(['sudo', 'yum', 'install', '-y', 'docker'], 
-                                 check=True, capture_output=True)
+                if self._install_linux_tools(['docker']):
                     return True
-                except subprocess.CalledProcessError:
-                    pass
                 
                 self.logger.info("Please install Docker manually from https://www.docker.com/")
                 return False
-                
+            
             elif self.platform == "win32":
                 self.logger.info("Please install Docker Desktop from https://www.docker.com/products/docker-desktop")
                 return False
             
             return False
-            
+        
         except Exception as e:
-            self.logger.error(f"Error installing Docker: {e}")
+            self.logger.error("Error installing Docker: %s", e)
             return False
     
     def _install_docker_compose(self) -> bool:
@@ -435,47 +700,51 @@ class DevEnvironment:
             if self.platform == "darwin":
                 # Try Homebrew first
                 try:
-                    subprocess.run(['brew', 'install', 'docker-compose'], 
-                                 check=True, capture_output=True)
+                    with self._system_install_lock:
+                        subprocess.run(['brew', 'install', 'docker-compose'], 
+                                     check=True, **_DEVNULL)
                     return True
                 except subprocess.CalledProcessError:
                     pass
                 
                 self.logger.info("Docker Compose should be included with Docker Desktop")
                 return False
-                
+            
             elif self.platform == "linux":
                 # Try package manager
-                try:
-                    subprocess.run(['sudo', 'apt', 'install', '-y', 'docker-compose'], 
-                                 check=True, capture_output=True)
+                if self._install_linux_tools(['docker-compose']):
                     return True
-                except subprocess.CalledProcessError:
-                    pass
-                
-                try:
-                    subprocess.run(['sudo', 'yum', 'install', '-y', 'docker-compose'], 
-                                 check=True, capture_output=True)
-                    return True
-                except subprocess.CalledProcessError:
-                    pass
                 
                 self.logger.info("Please install Docker Compose manually")
                 return False
-                
+            
             elif self.platform == "win32":
                 self.logger.info("Docker Compose should be included with Docker Desktop")
                 return False
             
             return False
-            
+        
         except Exception as e:
-            self.logger.error(f"Error installing Docker Compose: {e}")
+            self.logger.error("Error installing Docker Compose: %s", e)
             return False
     
     def _configure_git(self) -> bool:
         """Configure Git with basic settings"""
         try:
+            # Without any global config file there is nothing to probe or
+            # merge with, so write the defaults directly instead of running git
+            gitconfig = Path.home() / ".gitconfig"
+            xdg_config = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+            if (not os.environ.get("GIT_CONFIG_GLOBAL")
+                    and not gitconfig.exists()
+                    and not (xdg_config / "git" / "config").exists()):
+                self.logger.info("Configuring Git with basic settings")
+                tmp_path = gitconfig.with_name(".gitconfig.he2plus.tmp")
+                tmp_path.write_text(_DEFAULT_GITCONFIG)
+                os.replace(tmp_path, gitconfig)
+                self.logger.info("Git configured with basic settings")
+                return True
+            
             # Check if Git is already configured
             try:
                 result = subprocess.run(['git', 'config', '--global', 'user.name'], 
@@ -492,19 +761,19 @@ class DevEnvironment:
             # Set user name and email (these should be configured by the user)
             # For now, just set some defaults
             subprocess.run(['git', 'config', '--global', 'user.name', 'he2plus User'], 
-                         capture_output=True)
+                         **_DEVNULL)
             subprocess.run(['git', 'config', '--global', 'user.email', 'user@he2plus.local'], 
-                         capture_output=True)
+                         **_DEVNULL)
             
             # Set some useful defaults
             subprocess.run(['git', 'config', '--global', 'init.defaultBranch', 'main'], 
-                         capture_output=True)
+                         **_DEVNULL)
             subprocess.run(['git', 'config', '--global', 'pull.rebase', 'false'], 
-                         capture_output=True)
+                         **_DEVNULL)
             
             self.logger.info("Git configured with basic settings")
             return True
-            
+        
         except Exception as e:
-            self.logger.error(f"Error configuring Git: {e}")
+            self.logger.error("Error configuring Git: %s", e)
             return False
@@ -3,33 +3,259 @@ Node.js Installer for he2plus
 Smart Node.js installation with LTS support and version management
 """
 
+import hashlib
+import json
 import os
-import platform
+import select
+import shlex
+import shutil
+import signal
 import subprocess
-import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Tuple
-from ..core.system_profiler import SystemInfo, get_system_info
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from ..core.system_profiler import SystemInfo
+
+
+# Timeouts in seconds per kind of command, each the smallest that leaves
+# room for a slow mirror rather than a round upper bound
+_TIMEOUTS = {
+    'probe': 5,                      # node/npm --version
+    'http': 30,                      # nodejs.org requests, per read
+    'npm_list': 15,                  # npm ls -g
+    'npm_global': 120,               # per package in one npm install -g
+    'npm_install': 180,              # local dependencies of a template
+    'apt_install': 240,              # apt-get update and install together
+    'system_install': 240,           # yum, dnf, winget, choco, .pkg/.msi
+    'brew_install': 300,             # brew updates itself before installing
+    'version_manager_install': 300,  # nvm/fnm download a full Node.js build
+    'project_template': 420,         # create-react-app, vue create
+}
+
+# Lines of installer stderr kept for error messages
+_STDERR_TAIL_LINES = 64
+
+T = TypeVar('T')
+
+# Release directory holding the newest release of a Node.js major version
+_NODE_DIST_URL = "https://nodejs.org/dist/latest-v{version}.x/"
+
+
+def _wait_with_deadline(process: subprocess.Popen, timeout: float, read: Callable[[], T]) -> T:
+    """Return read() for a running process, killing the process if it outlives timeout"""
+    # subprocess.run's timeout turns the wait for exit into a sleep/poll loop;
+    # a timer that kills the child lets read() block until exit instead
+    expired = threading.Event()
+    
+    def expire():
+        expired.set()
+        process.kill()
+    
+    timer = threading.Timer(timeout, expire)
+    timer.start()
+    try:
+        output = read()
+    finally:
+        timer.cancel()
+    
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(process.args, timeout)
+    return output
+
+
+def _decode(output: bytes) -> str:
+    """Decode captured output in one go, never failing on stray bytes"""
+    return output.decode('utf-8', 'replace')
+
+
+def _run(cmd: List[str], timeout: float, **kwargs) -> subprocess.CompletedProcess:
+    """Run cmd capturing text output, killing it if it outlives timeout"""
+    # Pipes are read as bytes and decoded once at the end, which is cheaper
+    # than text mode decoding every chunk as it arrives
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs) as process:
+        stdout, stderr = _wait_with_deadline(process, timeout, process.communicate)
+    return subprocess.CompletedProcess(process.args, process.returncode, _decode(stdout), _decode(stderr))
+
+
+def _run_install(cmd: List[str], timeout: float, **kwargs) -> subprocess.CompletedProcess:
+    """Run a long install like _run, discarding stdout and keeping only the last lines of stderr"""
+    # Installers can print megabytes; only the end of stderr explains a failure
+    def read_tail() -> str:
+        tail = deque(process.stderr, maxlen=_STDERR_TAIL_LINES)
+        process.wait()
+        return _decode(b''.join(tail))
+    
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, **kwargs) as process:
+        stderr = _wait_with_deadline(process, timeout, read_tail)
+    return subprocess.CompletedProcess(process.args, process.returncode, None, stderr)
+
+def _node_versions_cache_path() -> Path:
+    """Location of the on-disk installed Node.js versions cache."""
+    return Path.home() / ".he2plus" / "cache" / "node_versions.json"
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Modification time of path in nanoseconds, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _node_versions_key() -> list:
+    """Stat-only fingerprint of everything the installed Node.js versions are read from"""
+    # Adding or removing a version changes its parent directory's mtime, and
+    # upgrading node in place replaces the binary
+    nvm_dir = os.environ.get('NVM_DIR') or os.path.expanduser('~/.nvm')
+    fnm_dir = os.environ.get('FNM_DIR') or os.path.expanduser('~/.fnm')
+    node_path = shutil.which('node')
+    node = os.path.realpath(node_path) if node_path else None
+    return [
+        _mtime_ns(os.path.join(nvm_dir, 'versions', 'node')),
+        _mtime_ns(os.path.join(fnm_dir, 'node-versions')),
+        node,
+        _mtime_ns(node) if node else None,
+    ]
+
+
+def _probe_version(exe: str) -> Optional[str]:
+    """What `exe --version` prints, or None if exe is missing or fails"""
+    path = shutil.which(exe)
+    if path is None:
+        return None
+    if not hasattr(os, 'posix_spawn'):
+        result = _run([path, '--version'], timeout=_TIMEOUTS['probe'])
+        return result.stdout.strip() if result.returncode == 0 else None
+    
+    # posix_spawn skips the generic fork/exec setup of Popen, which
+    # dominates the cost of a process this short-lived
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(path, [path, '--version'], os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, write_fd, 1),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ])
+    except BaseException:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+    
+    output = b''
+    deadline = time.monotonic() + _TIMEOUTS['probe']
+    with os.fdopen(read_fd, 'rb', buffering=0) as pipe:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([pipe], [], [], remaining)[0]:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                return None
+            chunk = pipe.read(4096)
+            if not chunk:
+                break
+            output += chunk
+    
+    _, status = os.waitpid(pid, 0)
+    if not (os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0):
+        return None
+    return _decode(output).strip()
+
+
+def _default_package_json(project_name: str) -> dict:
+    """The package.json `npm init -y` writes for a new project"""
+    return {
+        'name': project_name.lower().replace(' ', '-'),
+        'version': '1.0.0',
+        'description': '',
+        'main': 'index.js',
+        'scripts': {'test': 'echo "Error: no test specified" && exit 1'},
+        'keywords': [],
+        'author': '',
+        'license': 'ISC',
+    }
+
+
+def _npm_package_version(npm_path: str) -> Optional[str]:
+    """Version from the package.json of the npm install behind an npm executable, if found"""
+    # On Unix npm links to <npm>/bin/npm-cli.js; on Windows npm.cmd sits
+    # next to node_modules/npm
+    resolved = Path(os.path.realpath(npm_path))
+    candidates = [parent / 'package.json' for parent in list(resolved.parents)[:2]]
+    candidates.append(Path(npm_path).parent / 'node_modules' / 'npm' / 'package.json')
+    for candidate in candidates:
+        try:
+            with open(candidate, 'r', encoding='utf-8') as f:
+                package = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if isinstance(package, dict) and package.get('name') == 'npm':
+            return package.get('version')
+    return None
+
+
+def _package_spec_satisfied(spec: str, installed: Dict[str, str]) -> bool:
+    """Whether an npm package spec like 'yarn' or '@vue/cli@5.0.8' is already installed"""
+    # The version separator is the last '@' that isn't a scope's leading one
+    at = spec.rfind('@')
+    name, version = (spec[:at], spec[at + 1:]) if at > 0 else (spec, '')
+    if name not in installed:
+        return False
+    return not version or installed[name] == version
+
+
+def _npm_error(result: subprocess.CompletedProcess) -> str:
+    """Error summary from an npm --json run, falling back to its stderr"""
+    try:
+        return json.loads(result.stdout)["error"]["summary"]
+    except (ValueError, KeyError, TypeError):
+        return result.stderr
 
 
 class NodeInstaller:
     """Smart Node.js installer with LTS support and version management"""
     
     # Supported Node.js versions (LTS and current)
-    SUPPORTED_VERSIONS = ['16', '18', '20', '21']
+    SUPPORTED_VERSIONS = frozenset(('16', '18', '20', '21'))
     
     # Recommended versions for different use cases
-    RECOMMENDED_VERSIONS = {
+    RECOMMENDED_VERSIONS = MappingProxyType({
         'web3': '18',    # Good compatibility with Hardhat and Web3 tools
         'ml': '18',      # Stable for ML tooling
         'web': '20',     # Latest LTS for web development
         'mobile': '18',  # React Native compatibility
         'general': '18'  # LTS version
-    }
+    })
+    
+    # Installer method per OS name
+    _OS_INSTALLERS = MappingProxyType({
+        'darwin': '_install_node_macos',
+        'linux': '_install_node_linux',
+        'windows': '_install_node_windows',
+    })
     
     def __init__(self):
         """Initialize the Node.js installer"""
-        self.system_info = get_system_info()
+        # Versions reported by node/npm, cleared whenever Node.js is installed
+        self._node_version_cache: Optional[str] = None
+        self._npm_version_cache: Optional[str] = None
+    
+    @cached_property
+    def system_info(self) -> "SystemInfo":
+        """System profile, collected on first use so construction stays free"""
+        from ..core.system_profiler import get_system_info
+        return get_system_info(include_languages=False, include_gpu=False)
+    
+    @cached_property
+    def _pkg_mgrs(self) -> frozenset:
+        """Detected system package managers"""
+        return frozenset(self.system_info.package_managers)
     
     def get_installed_versions(self) -> List[str]:
         """
@@ -38,7 +264,31 @@ class NodeInstaller:
         Returns:
             List of installed Node.js versions
         """
-        return self.system_info.node_versions
+        return self._installed_versions_cached()
+    
+    def _installed_versions_cached(self) -> List[str]:
+        """Installed Node.js versions, reused from disk while node and the version dirs are unchanged"""
+        key = _node_versions_key()
+        path = _node_versions_cache_path()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and cache.get('key') == key:
+                return list(cache['versions'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        from ..core.system_profiler import _find_node_versions
+        versions = _find_node_versions()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'versions': versions}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+        return versions
     
     def is_version_installed(self, version: str) -> bool:
         """
@@ -50,7 +300,12 @@ class NodeInstaller:
         Returns:
             True if version is installed, False otherwise
         """
-        return version in self.get_installed_versions()
+        return version in self._installed_versions
+    
+    @cached_property
+    def _installed_versions(self) -> frozenset:
+        """Installed Node.js versions as a set for membership checks"""
+        return frozenset(self.get_installed_versions())
     
     def get_recommended_version(self, use_case: str = 'general') -> str:
         """
@@ -82,15 +337,17 @@ class NodeInstaller:
         print(f"📦 Installing Node.js {version}...")
         
         try:
-            if self.system_info.os_name == 'darwin':  # macOS
-                return self._install_node_macos(version)
-            elif self.system_info.os_name == 'linux':
-                return self._install_node_linux(version)
-            elif self.system_info.os_name == 'windows':
-                return self._install_node_windows(version)
-            else:
+            install_method = self._OS_INSTALLERS.get(self.system_info.os_name)
+            if install_method is None:
                 print(f"❌ Unsupported OS: {self.system_info.os_name}")
                 return False
+            installed = getattr(self, install_method)(version)
+            
+            if installed:
+                self._node_version_cache = None
+                self._npm_version_cache = None
+                self.__dict__.pop('_installed_versions', None)
+            return installed
         except Exception as e:
             print(f"❌ Failed to install Node.js {version}: {e}")
             return False
@@ -99,11 +356,11 @@ class NodeInstaller:
         """Install Node.js on macOS"""
         try:
             # Try Homebrew first
-            if 'Homebrew' in self.system_info.package_managers:
+            if 'Homebrew' in self._available_managers:
                 print("🍺 Using Homebrew to install Node.js...")
-                result = subprocess.run(
+                result = _run_install(
                     ['brew', 'install', 'node'],
-                    capture_output=True, text=True, timeout=300
+                    timeout=_TIMEOUTS['brew_install']
                 )
                 if result.returncode == 0:
                     print(f"✅ Node.js installed via Homebrew")
@@ -112,26 +369,25 @@ class NodeInstaller:
                     print(f"⚠️  Homebrew installation failed: {result.stderr}")
             
             # Try nvm
-            if self._is_nvm_available():
+            if 'nvm' in self._available_managers:
                 print("📦 Using nvm to install Node.js...")
-                result = subprocess.run(
-                    ['nvm', 'install', version],
-                    capture_output=True, text=True, timeout=600
+                result = _run_install(
+                    self._nvm_command(('install', version), ('use', version),
+                                      ('alias', 'default', version)),
+                    timeout=_TIMEOUTS['version_manager_install']
                 )
                 if result.returncode == 0:
-                    subprocess.run(['nvm', 'use', version], check=False)
-                    subprocess.run(['nvm', 'alias', 'default', version], check=False)
                     print(f"✅ Node.js {version} installed via nvm")
                     return True
                 else:
                     print(f"⚠️  nvm installation failed: {result.stderr}")
             
             # Try fnm
-            if self._is_fnm_available():
+            if 'fnm' in self._available_managers:
                 print("📦 Using fnm to install Node.js...")
-                result = subprocess.run(
+                result = _run_install(
                     ['fnm', 'install', version],
-                    capture_output=True, text=True, timeout=600
+                    timeout=_TIMEOUTS['version_manager_install']
                 )
                 if result.returncode == 0:
                     subprocess.run(['fnm', 'use', version], check=False)
@@ -153,60 +409,55 @@ class NodeInstaller:
         """Install Node.js on Linux"""
         try:
             # Try system package manager first
-            if 'APT' in self.system_info.package_managers:
+            if 'APT' in self._available_managers:
                 print("📦 Using APT to install Node.js...")
-                result = subprocess.run(
-                    ['sudo', 'apt', 'update'],
-                    capture_output=True, text=True, timeout=60
+                # One sudo/shell for both steps; apt-get has a stable CLI for scripts
+                result = _run_install(
+                    ['sudo', 'sh', '-c', 'apt-get update && apt-get install -y nodejs npm'],
+                    timeout=_TIMEOUTS['apt_install']
                 )
                 if result.returncode == 0:
-                    result = subprocess.run(
-                        ['sudo', 'apt', 'install', '-y', 'nodejs', 'npm'],
-                        capture_output=True, text=True, timeout=300
-                    )
-                    if result.returncode == 0:
-                        print(f"✅ Node.js installed via APT")
-                        return True
+                    print(f"✅ Node.js installed via APT")
+                    return True
             
-            elif 'YUM' in self.system_info.package_managers:
+            elif 'YUM' in self._available_managers:
                 print("📦 Using YUM to install Node.js...")
-                result = subprocess.run(
+                result = _run_install(
                     ['sudo', 'yum', 'install', '-y', 'nodejs', 'npm'],
-                    capture_output=True, text=True, timeout=300
+                    timeout=_TIMEOUTS['system_install']
                 )
                 if result.returncode == 0:
                     print(f"✅ Node.js installed via YUM")
                     return True
             
-            elif 'DNF' in self.system_info.package_managers:
+            elif 'DNF' in self._available_managers:
                 print("📦 Using DNF to install Node.js...")
-                result = subprocess.run(
+                result = _run_install(
                     ['sudo', 'dnf', 'install', '-y', 'nodejs', 'npm'],
-                    capture_output=True, text=True, timeout=300
+                    timeout=_TIMEOUTS['system_install']
                 )
                 if result.returncode == 0:
                     print(f"✅ Node.js installed via DNF")
                     return True
             
             # Try nvm as fallback
-            if self._is_nvm_available():
+            if 'nvm' in self._available_managers:
                 print("📦 Using nvm to install Node.js...")
-                result = subprocess.run(
-                    ['nvm', 'install', version],
-                    capture_output=True, text=True, timeout=600
+                result = _run_install(
+                    self._nvm_command(('install', version), ('use', version),
+                                      ('alias', 'default', version)),
+                    timeout=_TIMEOUTS['version_manager_install']
                 )
                 if result.returncode == 0:
-                    subprocess.run(['nvm', 'use', version], check=False)
-                    subprocess.run(['nvm', 'alias', 'default', version], check=False)
                     print(f"✅ Node.js {version} installed via nvm")
                     return True
             
             # Try fnm as fallback
-            if self._is_fnm_available():
+            if 'fnm' in self._available_managers:
                 print("📦 Using fnm to install Node.js...")
-                result = subprocess.run(
+                result = _run_install(
                     ['fnm', 'install', version],
-                    capture_output=True, text=True, timeout=600
+                    timeout=_TIMEOUTS['version_manager_install']
                 )
                 if result.returncode == 0:
                     subprocess.run(['fnm', 'use', version], check=False)
@@ -225,22 +476,22 @@ class NodeInstaller:
         """Install Node.js on Windows"""
         try:
             # Try winget first
-            if 'Winget' in self.system_info.package_managers:
+            if 'Winget' in self._available_managers:
                 print("📦 Using winget to install Node.js...")
-                result = subprocess.run(
+                result = _run_install(
                     ['winget', 'install', 'OpenJS.NodeJS'],
-                    capture_output=True, text=True, timeout=300
+                    timeout=_TIMEOUTS['system_install']
                 )
                 if result.returncode == 0:
                     print(f"✅ Node.js installed via winget")
                     return True
             
             # Try Chocolatey
-            if 'Chocolatey' in self.system_info.package_managers:
+            if 'Chocolatey' in self._available_managers:
                 print("📦 Using Chocolatey to install Node.js...")
-                result = subprocess.run(
+                result = _run_install(
                     ['choco', 'install', 'nodejs'],
-                    capture_output=True, text=True, timeout=300
+                    timeout=_TIMEOUTS['system_install']
                 )
                 if result.returncode == 0:
                     print(f"✅ Node.js installed via Chocolatey")
@@ -256,63 +507,120 @@ class NodeInstaller:
     
     def _install_node_org_macos(self, version: str) -> bool:
         """Install Node.js from nodejs.org on macOS"""
-        try:
-            # Download and install from nodejs.org
-            url = f"https://nodejs.org/dist/v{version}.0.0/node-v{version}.0.0.pkg"
-            
-            print(f"📥 Downloading Node.js {version} from nodejs.org...")
-            print("⚠️  Manual installation required:")
-            print(f"   1. Open: {url}")
-            print("   2. Download and run the installer")
-            print("   3. Follow the installation wizard")
-            print("   4. Restart your terminal")
-            
-            return False  # Manual installation required
-            
-        except Exception as e:
-            print(f"❌ nodejs.org installation failed: {e}")
-            return False
+        return self._install_node_org(
+            version, '.pkg',
+            lambda path: ['sudo', 'installer', '-pkg', str(path), '-target', '/']
+        )
     
     def _install_node_org_windows(self, version: str) -> bool:
         """Install Node.js from nodejs.org on Windows"""
+        arch = 'arm64' if self.system_info.architecture in ('arm64', 'aarch64') else 'x64'
+        return self._install_node_org(
+            version, f'-{arch}.msi',
+            lambda path: ['msiexec', '/i', str(path), '/qn']
+        )
+    
+    def _install_node_org(self, version: str, suffix: str, install_cmd: Callable[[Path], List[str]]) -> bool:
+        """Download the nodejs.org installer ending in suffix and run it unattended"""
+        url = _NODE_DIST_URL.format(version=version)
         try:
-            # Download and install from nodejs.org
-            url = f"https://nodejs.org/dist/v{version}.0.0/node-v{version}.0.0-x64.msi"
-            
-            print(f"📥 Downloading Node.js {version} from nodejs.org...")
-            print("⚠️  Manual installation required:")
-            print(f"   1. Open: {url}")
-            print("   2. Download and run the installer")
-            print("   3. Follow the installation wizard")
-            print("   4. Restart your terminal")
-            
-            return False  # Manual installation required
-            
+            # The installer runs privileged, so it's downloaded into a fresh
+            # directory only this user can write to rather than a guessable
+            # path in the shared temp dir
+            download_dir = Path(tempfile.mkdtemp(prefix='he2plus-node-'))
+            try:
+                installer_path = self._download_node_installer(version, suffix, download_dir)
+                result = None
+                if installer_path is not None:
+                    result = _run_install(install_cmd(installer_path), timeout=_TIMEOUTS['system_install'])
+            finally:
+                shutil.rmtree(download_dir, ignore_errors=True)
+            
+            if result is not None:
+                if result.returncode == 0:
+                    print(f"✅ Node.js {version} installed from nodejs.org")
+                    return True
+                print(f"⚠️  nodejs.org installer failed: {result.stderr}")
+        
         except Exception as e:
             print(f"❌ nodejs.org installation failed: {e}")
-            return False
+        
+        print("⚠️  Manual installation required:")
+        print(f"   1. Open: {url}")
+        print("   2. Download and run the installer")
+        print("   3. Follow the installation wizard")
+        print("   4. Restart your terminal")
+        return False
+    
+    def _download_node_installer(self, version: str, suffix: str, download_dir: Path) -> Optional[Path]:
+        """Stream the latest nodejs.org installer for a major version into download_dir, checking its SHA-256"""
+        import requests
+        
+        url = _NODE_DIST_URL.format(version=version)
+        response = requests.get(url + 'SHASUMS256.txt', timeout=_TIMEOUTS['http'])
+        response.raise_for_status()
+        checksums = {}
+        for line in response.text.splitlines():
+            digest, _, filename = line.partition('  ')
+            checksums[filename.strip()] = digest
+        
+        filename = next((name for name in checksums
+                         if name.startswith('node-v') and name.endswith(suffix)), None)
+        if filename is None:
+            print(f"❌ nodejs.org has no {suffix} installer for Node.js {version}")
+            return None
+        
+        print(f"📥 Downloading {filename} from nodejs.org...")
+        sha256 = hashlib.sha256()
+        installer_path = download_dir / Path(filename).name
+        with requests.get(url + filename, stream=True, timeout=_TIMEOUTS['http']) as response:
+            response.raise_for_status()
+            with open(installer_path, 'xb') as f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+                    sha256.update(chunk)
+        
+        if sha256.hexdigest() != checksums[filename]:
+            installer_path.unlink()
+            print(f"❌ Checksum mismatch for {filename}")
+            return None
+        return installer_path
+    
+    @cached_property
+    def _nvm_script(self) -> Optional[str]:
+        """Path to nvm.sh, or None if nvm isn't installed"""
+        # nvm is a shell function rather than an executable, so look for its script
+        nvm_dir = os.environ.get('NVM_DIR') or os.path.expanduser('~/.nvm')
+        script = os.path.join(nvm_dir, 'nvm.sh')
+        return script if os.path.isfile(script) else None
+    
+    @cached_property
+    def _fnm_path(self) -> Optional[str]:
+        """Path to the fnm executable, or None if it isn't on PATH"""
+        return shutil.which('fnm')
     
     def _is_nvm_available(self) -> bool:
         """Check if nvm is available"""
-        try:
-            result = subprocess.run(
-                ['nvm', '--version'],
-                capture_output=True, text=True, timeout=5
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return self._nvm_script is not None
     
     def _is_fnm_available(self) -> bool:
         """Check if fnm is available"""
-        try:
-            result = subprocess.run(
-                ['fnm', '--version'],
-                capture_output=True, text=True, timeout=5
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return self._fnm_path is not None
+    
+    @cached_property
+    def _available_managers(self) -> frozenset:
+        """Every package and version manager usable for installing Node.js"""
+        # Each probe is a stat or PATH lookup, so resolving all of them up
+        # front costs less than a single spawned --version check
+        version_managers = {'nvm': self._is_nvm_available(), 'fnm': self._is_fnm_available()}
+        return self._pkg_mgrs | {name for name, available in version_managers.items() if available}
+    
+    def _nvm_command(self, *commands: Sequence[str]) -> List[str]:
+        """Command running each nvm command in turn in one shell that has sourced nvm.sh"""
+        steps = ' && '.join(
+            'nvm ' + ' '.join(shlex.quote(arg) for arg in command) for command in commands
+        )
+        return ['bash', '-c', f'. {shlex.quote(self._nvm_script)} && {steps}']
     
     def setup_npm(self, version: str) -> bool:
         """
@@ -326,9 +634,9 @@ class NodeInstaller:
         """
         try:
             # Upgrade npm
-            result = subprocess.run(
+            result = _run_install(
                 ['npm', 'install', '-g', 'npm@latest'],
-                capture_output=True, text=True, timeout=120
+                timeout=_TIMEOUTS['npm_global']
             )
             
             if result.returncode == 0:
@@ -352,26 +660,52 @@ class NodeInstaller:
         Returns:
             True if successful, False otherwise
         """
+        if not packages:
+            return True
+        
         try:
-            for package in packages:
-                print(f"📦 Installing {package} globally...")
-                result = subprocess.run(
-                    ['npm', 'install', '-g', package],
-                    capture_output=True, text=True, timeout=300
-                )
-                
-                if result.returncode == 0:
-                    print(f"✅ {package} installed globally")
-                else:
-                    print(f"❌ Failed to install {package}: {result.stderr}")
-                    return False
+            # One cheap listing saves a registry round trip per present package
+            installed = self._global_packages()
+            present = [package for package in packages if _package_spec_satisfied(package, installed)]
+            if present:
+                print('\n'.join(f"✅ {package} already installed globally" for package in present))
+            packages = [package for package in packages if package not in present]
+            if not packages:
+                return True
             
-            return True
+            # One npm run fetches registry metadata once for every package
+            print(f"📦 Installing {', '.join(packages)} globally...")
+            result = _run(
+                ['npm', 'install', '-g', '--json', *packages],
+                timeout=_TIMEOUTS['npm_global'] * len(packages)
+            )
+            
+            if result.returncode == 0:
+                print('\n'.join(f"✅ {package} installed globally" for package in packages))
+                return True
+            else:
+                print(f"❌ Failed to install {', '.join(packages)}: {_npm_error(result)}")
+                return False
             
         except Exception as e:
             print(f"❌ Global package installation failed: {e}")
             return False
     
+    def _global_packages(self) -> Dict[str, str]:
+        """Globally installed npm packages and their versions, empty if npm can't list them"""
+        try:
+            result = _run(['npm', 'ls', '-g', '--depth=0', '--json'], timeout=_TIMEOUTS['npm_list'])
+            dependencies = json.loads(result.stdout).get('dependencies', {})
+        except (OSError, subprocess.SubprocessError, ValueError, TypeError, AttributeError):
+            return {}
+        
+        if not isinstance(dependencies, dict):
+            return {}
+        return {
+            name: info.get('version', '') if isinstance(info, dict) else ''
+            for name, info in dependencies.items()
+        }
+    
     def create_project(self, project_name: str, template: str = 'basic') -> bool:
         """
         Create a new Node.js project
@@ -387,43 +721,40 @@ class NodeInstaller:
             project_path = Path.home() / project_name
             project_path.mkdir(exist_ok=True)
             
-            # Initialize npm project
-            result = subprocess.run(
-                ['npm', 'init', '-y'],
-                cwd=project_path,
-                capture_output=True, text=True, timeout=60
-            )
-            
-            if result.returncode != 0:
-                print(f"❌ Failed to initialize npm project: {result.stderr}")
-                return False
+            # Initialize npm project by writing what `npm init -y` would, without
+            # starting Node.js; the React and Vue generators write their own
+            package_json = project_path / 'package.json'
+            if template not in ('react', 'vue') and not package_json.exists():
+                package_json.write_text(
+                    json.dumps(_default_package_json(project_name), indent=2) + '\n',
+                    encoding='utf-8'
+                )
             
             # Install template-specific packages
+            result = None
             if template == 'express':
-                result = subprocess.run(
+                result = _run_install(
                     ['npm', 'install', 'express'],
                     cwd=project_path,
-                    capture_output=True, text=True, timeout=300
+                    timeout=_TIMEOUTS['npm_install']
                 )
             elif template == 'react':
-                result = subprocess.run(
-                    ['npx', 'create-react-app', '.'],
+                result = _run_install(
+                    ['npx', 'create-react-app', '.', '--use-npm'],
                     cwd=project_path,
-                    capture_output=True, text=True, timeout=600
+                    timeout=_TIMEOUTS['project_template']
                 )
             elif template == 'vue':
-                result = subprocess.run(
-                    ['npm', 'install', '-g', '@vue/cli'],
-                    capture_output=True, text=True, timeout=300
+                # npx fetches the CLI into its cache and runs it in one step,
+                # leaving nothing installed globally; --merge skips the prompt
+                # about generating into the current directory
+                result = _run_install(
+                    ['npx', '--yes', '@vue/cli', 'create', '--default', '--merge', '.'],
+                    cwd=project_path,
+                    timeout=_TIMEOUTS['project_template']
                 )
-                if result.returncode == 0:
-                    result = subprocess.run(
-                        ['vue', 'create', '.'],
-                        cwd=project_path,
-                        capture_output=True, text=True, timeout=600
-                    )
             
-            if result.returncode == 0:
+            if result is None or result.returncode == 0:
                 print(f"✅ Project '{project_name}' created with {template} template")
                 return True
             else:
@@ -446,31 +777,26 @@ class NodeInstaller:
         """
         try:
             # Check Node.js version
-            result = subprocess.run(
-                ['node', '--version'],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            if result.returncode == 0:
-                installed_version = result.stdout.strip()
-                print(f"✅ Node.js {version} verified: {installed_version}")
-                
-                # Check npm
-                result = subprocess.run(
-                    ['npm', '--version'],
-                    capture_output=True, text=True, timeout=10
-                )
-                
-                if result.returncode == 0:
-                    npm_version = result.stdout.strip()
-                    print(f"✅ npm verified: {npm_version}")
-                    return True
-                else:
+            if self._node_version_cache is None:
+                node_version = _probe_version('node')
+                if node_version is None:
+                    print(f"❌ Node.js {version} not working")
+                    return False
+                self._node_version_cache = node_version
+            print(f"✅ Node.js {version} verified: {self._node_version_cache}")
+            
+            # Check npm, reading its version from its package.json when possible
+            if self._npm_version_cache is None:
+                npm_path = shutil.which('npm')
+                npm_version = _npm_package_version(npm_path) if npm_path else None
+                if npm_version is None and npm_path:
+                    npm_version = _probe_version('npm')
+                if npm_version is None:
                     print(f"⚠️  npm not working for Node.js {version}")
                     return False
-            else:
-                print(f"❌ Node.js {version} not working")
-                return False
+                self._npm_version_cache = npm_version
+            print(f"✅ npm verified: {self._npm_version_cache}")
+            return True
                 
         except Exception as e:
             print(f"❌ Verification failed: {e}")
@@ -520,9 +846,10 @@ if __name__ == "__main__":
     print(f"Installed versions: {', '.join(installed) if installed else 'None'}")
     
     # Show recommended versions
-    for use_case in ['web3', 'ml', 'web', 'mobile', 'general']:
-        recommended = installer.get_recommended_version(use_case)
-        print(f"Recommended for {use_case}: Node.js {recommended}")
+    print('\n'.join(
+        f"Recommended for {use_case}: Node.js {installer.get_recommended_version(use_case)}"
+        for use_case in ('web3', 'ml', 'web', 'mobile', 'general')
+    ))
     
     # Test installation for web3
     print(f"\n🧪 Testing Web3 Node.js installation...")
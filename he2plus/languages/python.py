@@ -3,20 +3,156 @@ Python Installer for he2plus
 Smart Python installation with version detection and cross-platform support
 """
 
+import json
 import os
-import platform
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from collections import deque
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
-from ..core.system_profiler import SystemInfo, get_system_info
+from ..core.system_profiler import SystemInfo, _find_python_versions, get_system_info
+
+# Timeouts in seconds per kind of command
+_TIMEOUTS = {
+    'probe': 5,             # pyenv --version, py -0p
+    'interpreter': 10,      # python -c version checks
+    'apt_update': 45,       # index refresh; a slow mirror fails fast and falls back
+    'system_install': 300,  # apt, yum, dnf, winget, choco
+    'brew_install': 300,    # brew updates itself before installing
+    'pyenv_install': 1800,  # pyenv compiles Python from source
+    'pip_upgrade': 120,     # pip install --upgrade pip
+    'pip_install': 300,     # requested packages, in one pip run
+    'venv': 120,            # python -m venv, which also bootstraps pip
+}
+
+# Linux package managers that can install Python, in the order they're preferred
+_LINUX_PACKAGE_MANAGERS = {'apt': 'APT', 'yum': 'YUM', 'dnf': 'DNF'}
+
+# Where system, Homebrew and source-built interpreters are installed
+_PYTHON_BIN_DIRS = ('/usr/bin', '/usr/local/bin', '/opt/homebrew/bin')
+
+# Touched by apt after every successful index update
+_APT_UPDATE_STAMP = '/var/lib/apt/periodic/update-success-stamp'
+_APT_UPDATE_MAX_AGE = 3600
+
+# One interpreter in the output of `py -0p`: its version and path
+_PY_LAUNCHER_LINE = re.compile(r'^\s*-(?:V:)?(\d+\.\d+)\S*\s+(?:\*\s+)?(.+?)\s*$')
+
+# Oldest pip that's left alone for an interpreter that was already installed
+_PIP_MIN_VERSION = (23, 0)
+
+# Lines of installer stderr kept for error messages
+_STDERR_TAIL_LINES = 64
+
+# Reports the interpreter and pip versions from a single interpreter start
+_VERIFY_SCRIPT = (
+    "import sys; print('Python ' + sys.version.split()[0], flush=True); "
+    "import pip; print('pip ' + pip.__version__)"
+)
+
+
+@lru_cache(maxsize=1)
+def _cached_system_info() -> SystemInfo:
+    """System profile shared by every installer in this process"""
+    # Installed versions are scanned separately and package managers are
+    # found on PATH, so the language scans would go unused
+    return get_system_info(include_languages=False, include_gpu=False,
+                           include_package_managers=False)
+
+
+def _python_versions_cache_path() -> Path:
+    """Location of the on-disk installed Python versions cache."""
+    return Path.home() / ".he2plus" / "cache" / "python_versions.json"
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Modification time of path in nanoseconds, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _python_versions_key() -> list:
+    """Stat-only fingerprint of everything the installed Python versions are read from"""
+    # Versions come from the running interpreter and a scan of PATH; adding
+    # or removing an interpreter changes its directory's mtime
+    path_dirs = dict.fromkeys(d for d in os.environ.get('PATH', '').split(os.pathsep) if d)
+    return [
+        f"{sys.version_info.major}.{sys.version_info.minor}",
+        [[path_dir, _mtime_ns(path_dir)] for path_dir in path_dirs],
+    ]
+
+
+def _run_install(cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """Run a long install with its output shown live, keeping only the end of stderr"""
+    # Compiling or downloading Python can print megabytes; stdout goes straight
+    # to the terminal and stderr is spooled to disk, so memory stays flat
+    with tempfile.TemporaryFile() as stderr:
+        result = subprocess.run(cmd, stderr=stderr, timeout=timeout)
+        stderr.seek(0)
+        tail = deque(stderr, maxlen=_STDERR_TAIL_LINES)
+    result.stderr = b''.join(tail).decode('utf-8', 'replace')
+    return result
+
+
+@lru_cache(maxsize=None)
+def _resolve_python_exe(version: str) -> Optional[str]:
+    """Interpreter path the Windows py launcher picks for version, or None if unknown"""
+    # py.exe searches the registry on every start; asking it once for the
+    # path lets later commands start the interpreter directly
+    try:
+        result = subprocess.run(
+            ['py', '-0p'],
+            capture_output=True, text=True, timeout=_TIMEOUTS['probe']
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    
+    # Lines look like " -V:3.11 *  C:\Python311\python.exe" on current
+    # launchers and " -3.11-64  C:\Python311\python.exe" on older ones
+    for line in result.stdout.splitlines():
+        match = _PY_LAUNCHER_LINE.match(line)
+        if match and match.group(1) == version:
+            return match.group(2)
+    return None
+
+
+def _apt_index_fresh() -> bool:
+    """Whether apt's package index was updated within the last hour"""
+    try:
+        return time.time() - os.stat(_APT_UPDATE_STAMP).st_mtime < _APT_UPDATE_MAX_AGE
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _pyenv_available() -> bool:
+    """Whether pyenv runs, probed once per process"""
+    if shutil.which('pyenv') is None:
+        return False
+    try:
+        result = subprocess.run(
+            ['pyenv', '--version'],
+            capture_output=True, text=True, timeout=_TIMEOUTS['probe']
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
 
 
 class PythonInstaller:
     """Smart Python installer with version detection and cross-platform support"""
     
     # Supported Python versions (LTS and recent)
-    SUPPORTED_VERSIONS = ['3.8', '3.9', '3.10', '3.11', '3.12']
+    SUPPORTED_VERSIONS = frozenset(('3.8', '3.9', '3.10', '3.11', '3.12'))
     
     # Recommended versions for different use cases
     RECOMMENDED_VERSIONS = {
@@ -26,9 +162,10 @@ class PythonInstaller:
         'general': '3.11'  # Latest stable
     }
     
-    def __init__(self):
-        """Initialize the Python installer"""
-        self.system_info = get_system_info()
+    @cached_property
+    def system_info(self) -> SystemInfo:
+        """System profile, collected on first use so construction stays free"""
+        return _cached_system_info()
     
     def get_installed_versions(self) -> List[str]:
         """
@@ -37,7 +174,44 @@ class PythonInstaller:
         Returns:
             List of installed Python versions
         """
-        return self.system_info.python_versions
+        return self._installed_versions_cached()
+    
+    def _installed_versions_cached(self) -> List[str]:
+        """Installed Python versions, reused from disk while the PATH directories are unchanged"""
+        key = _python_versions_key()
+        path = _python_versions_cache_path()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and cache.get('key') == key:
+                return list(cache['versions'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        versions = _find_python_versions()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'versions': versions}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+        return versions
+    
+    def _forget_installed_versions(self) -> None:
+        """Drop the installed versions cached before an install"""
+        # pyenv installs outside PATH, so the disk cache's key may not change
+        self.__dict__.pop('installed_versions', None)
+        try:
+            _python_versions_cache_path().unlink(missing_ok=True)
+        except OSError:
+            pass
+    
+    @cached_property
+    def installed_versions(self) -> frozenset:
+        """Installed Python versions as a set for membership checks"""
+        return frozenset(self.get_installed_versions())
     
     def is_version_installed(self, version: str) -> bool:
         """
@@ -49,7 +223,11 @@ class PythonInstaller:
         Returns:
             True if version is installed, False otherwise
         """
-        return version in self.get_installed_versions()
+        # Interpreters in the usual locations are found with a stat each,
+        # before anything falls back to scanning PATH
+        if any(os.path.isfile(os.path.join(d, f'python{version}')) for d in _PYTHON_BIN_DIRS):
+            return True
+        return version in self.installed_versions
     
     def get_recommended_version(self, use_case: str = 'general') -> str:
         """
@@ -82,14 +260,18 @@ class PythonInstaller:
         
         try:
             if self.system_info.os_name == 'darwin':  # macOS
-                return self._install_python_macos(version)
+                installed = self._install_python_macos(version)
             elif self.system_info.os_name == 'linux':
-                return self._install_python_linux(version)
+                installed = self._install_python_linux(version)
             elif self.system_info.os_name == 'windows':
-                return self._install_python_windows(version)
+                installed = self._install_python_windows(version)
             else:
                 print(f"❌ Unsupported OS: {self.system_info.os_name}")
                 return False
+            
+            if installed:
+                self._forget_installed_versions()
+            return installed
         except Exception as e:
             print(f"❌ Failed to install Python {version}: {e}")
             return False
@@ -98,11 +280,11 @@ class PythonInstaller:
         """Install Python on macOS"""
         try:
             # Try Homebrew first
-            if 'Homebrew' in self.system_info.package_managers:
+            if shutil.which('brew'):
                 print("🍺 Using Homebrew to install Python...")
-                result = subprocess.run(
+                result = _run_install(
                     ['brew', 'install', f'python@{version}'],
-                    capture_output=True, text=True, timeout=300
+                    timeout=_TIMEOUTS['brew_install']
                 )
                 if result.returncode == 0:
                     print(f"✅ Python {version} installed via Homebrew")
@@ -113,9 +295,9 @@ class PythonInstaller:
             # Try pyenv
             if self._is_pyenv_available():
                 print("🐍 Using pyenv to install Python...")
-                result = subprocess.run(
+                result = _run_install(
                     ['pyenv', 'install', version],
-                    capture_output=True, text=True, timeout=600
+                    timeout=_TIMEOUTS['pyenv_install']
                 )
                 if result.returncode == 0:
                     subprocess.run(['pyenv', 'global', version], check=False)
@@ -135,48 +317,44 @@ class PythonInstaller:
     def _install_python_linux(self, version: str) -> bool:
         """Install Python on Linux"""
         try:
-            # Try system package manager first
-            if 'APT' in self.system_info.package_managers:
+            # Each candidate is a PATH lookup, so find the one that's present
+            # before starting any update or install run
+            manager = next((name for name in _LINUX_PACKAGE_MANAGERS if shutil.which(name)), None)
+            
+            if manager == 'apt':
                 print("📦 Using APT to install Python...")
-                result = subprocess.run(
-                    ['sudo', 'apt', 'update'],
-                    capture_output=True, text=True, timeout=60
-                )
-                if result.returncode == 0:
+                result = None
+                if not _apt_index_fresh():
                     result = subprocess.run(
+                        ['sudo', 'apt', 'update'],
+                        capture_output=True, text=True, timeout=_TIMEOUTS['apt_update']
+                    )
+                if result is None or result.returncode == 0:
+                    result = _run_install(
                         ['sudo', 'apt', 'install', '-y', f'python{version}', f'python{version}-pip'],
-                        capture_output=True, text=True, timeout=300
+                        timeout=_TIMEOUTS['system_install']
                     )
                     if result.returncode == 0:
                         print(f"✅ Python {version} installed via APT")
                         return True
             
-            elif 'YUM' in self.system_info.package_managers:
-                print("📦 Using YUM to install Python...")
-                result = subprocess.run(
-                    ['sudo', 'yum', 'install', '-y', f'python{version}', f'python{version}-pip'],
-                    capture_output=True, text=True, timeout=300
-                )
-                if result.returncode == 0:
-                    print(f"✅ Python {version} installed via YUM")
-                    return True
-            
-            elif 'DNF' in self.system_info.package_managers:
-                print("📦 Using DNF to install Python...")
-                result = subprocess.run(
-                    ['sudo', 'dnf', 'install', '-y', f'python{version}', f'python{version}-pip'],
-                    capture_output=True, text=True, timeout=300
+            elif manager is not None:
+                label = _LINUX_PACKAGE_MANAGERS[manager]
+                print(f"📦 Using {label} to install Python...")
+                result = _run_install(
+                    ['sudo', manager, 'install', '-y', f'python{version}', f'python{version}-pip'],
+                    timeout=_TIMEOUTS['system_install']
                 )
                 if result.returncode == 0:
-                    print(f"✅ Python {version} installed via DNF")
+                    print(f"✅ Python {version} installed via {label}")
                     return True
             
             # Try pyenv as fallback
             if self._is_pyenv_available():
                 print("🐍 Using pyenv to install Python...")
-                result = subprocess.run(
+                result = _run_install(
                     ['pyenv', 'install', version],
-                    capture_output=True, text=True, timeout=600
+                    timeout=_TIMEOUTS['pyenv_install']
                 )
                 if result.returncode == 0:
                     subprocess.run(['pyenv', 'global', version], check=False)
@@ -194,22 +372,22 @@ class PythonInstaller:
         """Install Python on Windows"""
         try:
             # Try winget first
-            if 'Winget' in self.system_info.package_managers:
+            if shutil.which('winget'):
                 print("📦 Using winget to install Python...")
                 result = subprocess.run(
                     ['winget', 'install', 'Python.Python.3.11'],
-                    capture_output=True, text=True, timeout=300
+                    capture_output=True, text=True, timeout=_TIMEOUTS['system_install']
                 )
                 if result.returncode == 0:
                     print(f"✅ Python {version} installed via winget")
                     return True
             
             # Try Chocolatey
-            if 'Chocolatey' in self.system_info.package_managers:
+            if shutil.which('choco'):
                 print("📦 Using Chocolatey to install Python...")
                 result = subprocess.run(
                     ['choco', 'install', 'python', '--version', version],
-                    capture_output=True, text=True, timeout=300
+                    capture_output=True, text=True, timeout=_TIMEOUTS['system_install']
                 )
                 if result.returncode == 0:
                     print(f"✅ Python {version} installed via Chocolatey")
@@ -226,10 +404,8 @@ class PythonInstaller:
     def _install_python_org_macos(self, version: str) -> bool:
         """Install Python from python.org on macOS"""
         try:
-            # Download and install from python.org
+            # The macos11 installer is universal2, so it serves arm64 and x86_64 alike
             url = f"https://www.python.org/ftp/python/{version}/python-{version}-macos11.pkg"
-            if self.system_info.architecture == 'arm64':
-                url = f"https://www.python.org/ftp/python/{version}/python-{version}-macos11.pkg"
             
             print(f"📥 Downloading Python {version} from python.org...")
             print("⚠️  Manual installation required:")
@@ -266,14 +442,33 @@ class PythonInstaller:
     
     def _is_pyenv_available(self) -> bool:
         """Check if pyenv is available"""
+        return _pyenv_available()
+    
+    def _python_cmd(self, version: str) -> List[str]:
+        """Command that starts the given Python version"""
+        if self.system_info.os_name == 'windows':
+            exe = _resolve_python_exe(version)
+            return [exe] if exe else ['py', f'-{version}']
+        return [f'python{version}']
+    
+    def _pip_version(self, version: str) -> Optional[Tuple[int, ...]]:
+        """Version of pip for the given Python version, or None if pip doesn't run"""
         try:
             result = subprocess.run(
-                ['pyenv', '--version'],
-                capture_output=True, text=True, timeout=5
+                [*self._python_cmd(version), '-c', 'import pip; print(pip.__version__)'],
+                capture_output=True, text=True, timeout=_TIMEOUTS['interpreter']
             )
-            return result.returncode == 0
         except Exception:
-            return False
+            return None
+        if result.returncode != 0:
+            return None
+        
+        parts = []
+        for part in result.stdout.strip().split('.'):
+            if not part.isdigit():
+                break
+            parts.append(int(part))
+        return tuple(parts) or None
     
     def setup_pip(self, version: str) -> bool:
         """
@@ -286,14 +481,12 @@ class PythonInstaller:
             True if successful, False otherwise
         """
         try:
-            python_cmd = f"python{version}"
-            if self.system_info.os_name == 'windows':
-                python_cmd = f"py -{version}"
+            python_cmd = self._python_cmd(version)
             
             # Upgrade pip
             result = subprocess.run(
-                [python_cmd, '-m', 'pip', 'install', '--upgrade', 'pip'],
-                capture_output=True, text=True, timeout=120
+                [*python_cmd, '-m', 'pip', 'install', '--prefer-binary', '--upgrade', 'pip'],
+                capture_output=True, text=True, timeout=_TIMEOUTS['pip_upgrade']
             )
             
             if result.returncode == 0:
@@ -319,14 +512,12 @@ class PythonInstaller:
             True if successful, False otherwise
         """
         try:
-            python_cmd = f"python{version}"
-            if self.system_info.os_name == 'windows':
-                python_cmd = f"py -{version}"
+            python_cmd = self._python_cmd(version)
             
             # Create virtual environment
             result = subprocess.run(
-                [python_cmd, '-m', 'venv', env_name],
-                capture_output=True, text=True, timeout=120
+                [*python_cmd, '-m', 'venv', env_name],
+                capture_output=True, text=True, timeout=_TIMEOUTS['venv']
             )
             
             if result.returncode == 0:
@@ -352,15 +543,27 @@ class PythonInstaller:
             True if successful, False otherwise
         """
         try:
-            python_cmd = f"python{version}"
-            if self.system_info.os_name == 'windows':
-                python_cmd = f"py -{version}"
+            python_cmd = self._python_cmd(version)
+            
+            if not packages:
+                return True
+            
+            # One pip run resolves everything together and pays pip's startup
+            # cost once; packages are only retried one by one to name a failure
+            print(f"📦 Installing {', '.join(packages)}...")
+            result = subprocess.run(
+                [*python_cmd, '-m', 'pip', 'install', '--prefer-binary', *packages],
+                capture_output=True, text=True, timeout=_TIMEOUTS['pip_install']
+            )
+            if result.returncode == 0:
+                print(f"✅ {', '.join(packages)} installed successfully")
+                return True
             
             for package in packages:
                 print(f"📦 Installing {package}...")
                 result = subprocess.run(
-                    [python_cmd, '-m', 'pip', 'install', package],
-                    capture_output=True, text=True, timeout=300
+                    [*python_cmd, '-m', 'pip', 'install', '--prefer-binary', package],
+                    capture_output=True, text=True, timeout=_TIMEOUTS['pip_install']
                 )
                 
                 if result.returncode == 0:
@@ -386,36 +589,27 @@ class PythonInstaller:
             True if installation is working, False otherwise
         """
         try:
-            python_cmd = f"python{version}"
-            if self.system_info.os_name == 'windows':
-                python_cmd = f"py -{version}"
+            python_cmd = self._python_cmd(version)
             
-            # Check Python version
+            # One interpreter start answers both checks; the Python version is
+            # flushed first so it's still reported if pip fails to import
             result = subprocess.run(
-                [python_cmd, '--version'],
-                capture_output=True, text=True, timeout=10
+                [*python_cmd, '-c', _VERIFY_SCRIPT],
+                capture_output=True, text=True, timeout=_TIMEOUTS['interpreter']
             )
+            lines = result.stdout.splitlines()
             
-            if result.returncode == 0:
-                installed_version = result.stdout.strip()
-                print(f"✅ Python {version} verified: {installed_version}")
-                
-                # Check pip
-                result = subprocess.run(
-                    [python_cmd, '-m', 'pip', '--version'],
-                    capture_output=True, text=True, timeout=10
-                )
-                
-                if result.returncode == 0:
-                    pip_version = result.stdout.strip()
-                    print(f"✅ pip verified: {pip_version}")
-                    return True
-                else:
-                    print(f"⚠️  pip not working for Python {version}")
-                    return False
-            else:
+            if not lines:
                 print(f"❌ Python {version} not working")
                 return False
+            
+            print(f"✅ Python {version} verified: {lines[0]}")
+            if result.returncode == 0 and len(lines) > 1:
+                print(f"✅ pip verified: {lines[1]}")
+                return True
+            else:
+                print(f"⚠️  pip not working for Python {version}")
+                return False
                 
         except Exception as e:
             print(f"❌ Verification failed: {e}")
@@ -438,9 +632,18 @@ def install_python_for_use_case(use_case: str) -> bool:
     print(f"🐍 Installing Python {recommended_version} for {use_case} development...")
     
     # Install Python
+    already_installed = installer.is_version_installed(recommended_version)
     if not installer.install_python(recommended_version, use_case):
         return False
     
+    # An existing interpreter whose pip runs and is recent needs nothing more
+    if already_installed:
+        pip_version = installer._pip_version(recommended_version)
+        if pip_version is not None and pip_version >= _PIP_MIN_VERSION:
+            print(f"✅ pip {'.'.join(map(str, pip_version))} already up to date")
+            print(f"✅ Python {recommended_version} ready for {use_case} development!")
+            return True
+    
     # Setup pip
     if not installer.setup_pip(recommended_version):
         return False
@@ -6,6 +6,7 @@ This module defines the base classes and interfaces for all development profiles
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict, Optional, Any
 import structlog
 
@@ -14,6 +15,13 @@ from ..core.validator import ProfileRequirements
 logger = structlog.get_logger(__name__)
 
 
+def _any_conflict(conflicts: frozenset, ids: frozenset) -> bool:
+    """Check whether any of the conflicting IDs is among ids."""
+    # isdisjoint probes the smaller set against the larger one, stops at the
+    # first shared ID and builds no result set
+    return not conflicts.isdisjoint(ids)
+
+
 @dataclass
 class Component:
     """Represents a component that can be installed."""
@@ -161,37 +169,44 @@ class BaseProfile(ABC):
                 return comp
         return None
     
+    # Components are fixed once the profile is initialized, so the ID sets
+    # below are built on first use and reused by every later call
+    
+    @cached_property
+    def _component_id_set(self) -> frozenset:
+        """IDs of this profile's components."""
+        return frozenset(comp.id for comp in self.components)
+    
+    @cached_property
+    def _dependency_set(self) -> frozenset:
+        """IDs every component of this profile depends on."""
+        return frozenset().union(*(comp.depends_on for comp in self.components))
+    
+    @cached_property
+    def _conflict_set(self) -> frozenset:
+        """IDs any component of this profile conflicts with."""
+        return frozenset().union(*(comp.conflicts_with for comp in self.components))
+    
     def get_dependencies(self) -> List[str]:
         """Get all dependencies for this profile."""
-        deps = set()
-        for comp in self.components:
-            deps.update(comp.depends_on)
-        return list(deps)
+        return list(self._dependency_set)
     
     def get_conflicts(self) -> List[str]:
         """Get all conflicts for this profile."""
-        conflicts = set()
-        for comp in self.components:
-            conflicts.update(comp.conflicts_with)
-        return list(conflicts)
+        return list(self._conflict_set)
     
     def is_compatible_with(self, other_profile: 'BaseProfile') -> bool:
         """Check if this profile is compatible with another."""
-        our_conflicts = set(self.get_conflicts())
-        their_components = set(other_profile.get_component_ids())
-        
-        # Check if any of our conflicts are in their components
-        if our_conflicts.intersection(their_components):
-            return False
-        
-        their_conflicts = set(other_profile.get_conflicts())
-        our_components = set(self.get_component_ids())
-        
-        # Check if any of their conflicts are in our components
-        if their_conflicts.intersection(our_components):
-            return False
-        
-        return True
+        # Our conflicts against their components and theirs against ours,
+        # cheapest direction first so a hit there skips the other
+        checks = sorted(
+            [
+                (self._conflict_set, other_profile._component_id_set),
+                (other_profile._conflict_set, self._component_id_set),
+            ],
+            key=lambda check: min(len(check[0]), len(check[1])),
+        )
+        return not any(_any_conflict(conflicts, ids) for conflicts, ids in checks)
     
     def get_installation_plan(self) -> Dict[str, Any]:
         """Get a detailed installation plan."""
@@ -301,7 +316,7 @@ class BaseProfile(ABC):
                 "cuda_required": self.requirements.cuda_required,
                 "metal_required": self.requirements.metal_required,
                 "min_os_version": self.requirements.min_os_version,
-                "supported_archs": self.requirements.supported_archs,
+                "supported_archs": sorted(self.requirements.supported_archs),
                 "internet_required": self.requirements.internet_required,
                 "download_size_mb": self.requirements.download_size_mb
             },
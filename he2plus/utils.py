@@ -35,21 +35,25 @@ class Logger:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
     
-    def info(self, message: str):
-        """Log info message"""
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        """Log info message, formatting args only if the record is emitted"""
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
-        """Log warning message"""
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        """Log warning message, formatting args only if the record is emitted"""
+        self.logger.warning(message, *args)
     
-    def error(self, message: str):
-        """Log error message"""
-        self.logger.error(message)
+    def error(self, message: str, *args):
+        """Log error message, formatting args only if the record is emitted"""
+        self.logger.error(message, *args)
     
-    def debug(self, message: str):
-        """Log debug message"""
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        """Log debug message, formatting args only if the record is emitted"""
+        self.logger.debug(message, *args)
+    
+    def is_enabled_for(self, level: int) -> bool:
+        """Check if messages of the given level would be emitted"""
+        return self.logger.isEnabledFor(level)
     
     def is_active(self) -> bool:
         """Check if logger is active"""
@@ -201,7 +201,9 @@ def mock_platform():
     """Mock platform for testing."""
     with patch('platform.system') as mock_system, \
          patch('platform.machine') as mock_machine, \
-         patch('platform.platform') as mock_platform_func:
+         patch('platform.platform') as mock_platform_func, \
+         patch('he2plus.core.system._SYSTEM', "darwin"), \
+         patch('he2plus.core.system._MACHINE', "arm64"):
         
         mock_system.return_value = "Darwin"
         mock_machine.return_value = "arm64"
@@ -217,12 +219,14 @@ def mock_platform():
 def mock_psutil():
     """Mock psutil for testing."""
     with patch('psutil.virtual_memory') as mock_memory, \
+         patch('he2plus.core.system._linux_meminfo') as mock_meminfo, \
          patch('psutil.disk_usage') as mock_disk, \
          patch('psutil.cpu_count') as mock_cpu:
         
         # Mock memory
         mock_memory.return_value.total = 16 * 1024**3  # 16 GB
         mock_memory.return_value.available = 8 * 1024**3  # 8 GB
+        mock_meminfo.return_value = (16 * 1024**3, 8 * 1024**3)
         
         # Mock disk
         mock_disk.return_value.total = 1000 * 1024**3  # 1000 GB
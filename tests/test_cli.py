@@ -143,6 +143,21 @@ class TestCLI:
         assert result.exit_code == 0
         assert "System Health Check" in result.output
     
+    @patch('he2plus.cli.main.SystemValidator')
+    def test_doctor_with_profile_lists_every_issue(self, mock_validator):
+        """Test that doctor reports all blocking issues for a profile."""
+        mock_validator.return_value.validate.return_value = Mock(
+            safe_to_install=False,
+            blocking_issues=["Insufficient RAM", "Insufficient CPU cores"],
+        )
+        
+        result = self.runner.invoke(cli, ['doctor', '--profile', 'web3-solidity'])
+        assert result.exit_code == 0
+        assert "Insufficient RAM" in result.output
+        assert "Insufficient CPU cores" in result.output
+        _, kwargs = mock_validator.return_value.validate.call_args
+        assert not kwargs.get('fast_path')
+    
     def test_install_command(self):
         """Test install command."""
         result = self.runner.invoke(cli, ['install', '--help'])
@@ -0,0 +1,393 @@
+"""Unit tests for development environment setup."""
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from he2plus.dev import DevEnvironment
+
+
+@pytest.fixture(autouse=True)
+def setup_cache(tmp_path):
+    """Keep the setup cache out of the real home directory."""
+    path = tmp_path / "setup.json"
+    with patch('he2plus.dev._setup_cache_path', return_value=path):
+        yield path
+
+
+@pytest.fixture(autouse=True)
+def pypi_cache(tmp_path):
+    """Keep PyPI lookups offline and their cache out of the home directory."""
+    path = tmp_path / "pypi_latest.json"
+    with patch('he2plus.dev._pypi_cache_path', return_value=path), \
+         patch('he2plus.dev.requests.get', side_effect=requests.ConnectionError):
+        yield path
+
+
+@pytest.fixture
+def dev_env():
+    """DevEnvironment with a mock logger and config."""
+    return DevEnvironment(Mock(), Mock())
+
+
+class TestSetupPython:
+    """Test Python environment setup."""
+    
+    def test_setup_python_single_pip_run(self, dev_env):
+        """Test that all packages are installed in one pip invocation."""
+        with patch('he2plus.dev.subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert dev_env._setup_python() is True
+        
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:5] == [sys.executable, '-m', 'pip', 'install', '--upgrade']
+        assert {"pip", "setuptools", "wheel", "virtualenv", "pipenv", "poetry"} <= set(cmd[5:])
+    
+    def test_setup_python_skips_up_to_date_packages(self, dev_env, pypi_cache):
+        """Test that packages already at their cached latest version aren't reinstalled."""
+        current = {"pip": "24.0", "setuptools": "70.0.0", "wheel": "0.43.0",
+                   "virtualenv": "20.26.0", "pipenv": "2024.0.1", "poetry": "1.8.3"}
+        now = time.time()
+        cache = {name: {"version": version, "fetched_at": now} for name, version in current.items()}
+        cache["poetry"]["version"] = "1.8.4"
+        pypi_cache.write_text(json.dumps(cache))
+        
+        with patch('he2plus.dev.metadata.version', side_effect=current.__getitem__), \
+             patch('he2plus.dev.subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert dev_env._setup_python() is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][5:] == ["poetry"]
+    
+    def test_latest_versions_fetches_and_caches(self, dev_env, pypi_cache):
+        """Test that PyPI is queried once per package and the result is cached."""
+        response = Mock()
+        response.json.return_value = {"info": {"version": "24.0"}}
+        
+        with patch('he2plus.dev.requests.get', return_value=response) as mock_get:
+            assert dev_env._latest_versions(["pip"]) == {"pip": "24.0"}
+            assert dev_env._latest_versions(["pip"]) == {"pip": "24.0"}
+        
+        mock_get.assert_called_once()
+        assert json.loads(pypi_cache.read_text())["pip"]["version"] == "24.0"
+    
+    def test_latest_versions_share_one_deadline(self, dev_env, pypi_cache):
+        """Test that PyPI lookups run concurrently and a hung one doesn't hold up the rest."""
+        release = threading.Event()
+        
+        def fake_get(url, **kwargs):
+            if "/poetry/" in url:
+                release.wait(5)
+                raise requests.Timeout
+            response = Mock()
+            response.json.return_value = {"info": {"version": "1.0"}}
+            return response
+        
+        start = time.monotonic()
+        try:
+            with patch('he2plus.dev._PYPI_TIMEOUT', 0.5), \
+                 patch('he2plus.dev.requests.get', side_effect=fake_get) as mock_get:
+                latest = dev_env._latest_versions(["pip", "poetry", "wheel"])
+        finally:
+            release.set()
+        
+        assert time.monotonic() - start < 2
+        assert mock_get.call_count == 3
+        assert latest == {"pip": "1.0", "wheel": "1.0"}
+        assert set(json.loads(pypi_cache.read_text())) == {"pip", "wheel"}
+    
+    def test_setup_python_retries_individually_on_failure(self, dev_env):
+        """Test the per-package fallback when the batched install fails."""
+        def fake_run(cmd, **kwargs):
+            if len(cmd) > 6:
+                return Mock(returncode=1)
+            if cmd[-1] == "poetry":
+                raise subprocess.CalledProcessError(1, cmd)
+            return Mock(returncode=0)
+        
+        with patch('he2plus.dev.subprocess.run', side_effect=fake_run) as mock_run:
+            assert dev_env._setup_python() is True
+        
+        assert mock_run.call_count == 7
+        dev_env.logger.warning.assert_called_once_with("Failed to install %s", "poetry")
+
+
+class TestSetupNodejs:
+    """Test Node.js environment setup."""
+    
+    def test_setup_nodejs_single_npm_run(self, dev_env):
+        """Test that the global npm packages are installed in one npm invocation."""
+        with patch('he2plus.dev.shutil.which', return_value="/usr/bin/node"), \
+             patch('he2plus.dev.subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert dev_env._setup_nodejs() is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ['npm', 'install', '-g', 'yarn', 'pnpm']
+
+
+class TestSetupEnvironment:
+    """Test profile-driven environment setup."""
+    
+    def test_setup_environment_runs_enabled_setups(self, dev_env):
+        """Test that only enabled setups run and results are combined."""
+        dev_env.config.get.return_value = {"python": True, "git": True}
+        
+        with patch.object(dev_env, '_setup_python', return_value=True) as mock_python, \
+             patch.object(dev_env, '_setup_git', return_value=False) as mock_git, \
+             patch.object(dev_env, '_setup_docker') as mock_docker:
+            assert dev_env.setup_environment() is False
+        
+        mock_python.assert_called_once()
+        mock_git.assert_called_once()
+        mock_docker.assert_not_called()
+    
+    def test_setup_environment_waits_for_prerequisites(self, dev_env):
+        """Test that dependent setups start after their prerequisite finishes."""
+        dev_env.config.get.return_value = {"nodejs": True, "hardhat": True, "react": True}
+        order = []
+        
+        def setup_nodejs():
+            time.sleep(0.05)
+            order.append("nodejs")
+            return True
+        
+        with patch.object(dev_env, '_setup_nodejs', side_effect=setup_nodejs), \
+             patch.object(dev_env, '_setup_hardhat', side_effect=lambda: order.append("hardhat") or True), \
+             patch.object(dev_env, '_setup_react', side_effect=lambda: order.append("react") or True):
+            assert dev_env.setup_environment() is True
+        
+        assert order[0] == "nodejs"
+        assert sorted(order[1:]) == ["hardhat", "react"]
+    
+    def test_components_listed_after_dependencies(self):
+        """Test that the component table is in dependency order."""
+        seen = set()
+        for name, method, deps in DevEnvironment._COMPONENTS:
+            assert deps <= seen
+            assert callable(getattr(DevEnvironment, method))
+            seen.add(name)
+    
+    def test_get_executor_is_shared(self):
+        """Test that every setup run shares one thread pool."""
+        executor = DevEnvironment._get_executor()
+        
+        assert DevEnvironment(Mock(), Mock())._get_executor() is executor
+        assert executor._max_workers == len(DevEnvironment._COMPONENTS)
+    
+    def test_setup_environment_batches_brownie_with_python(self, dev_env):
+        """Test that Brownie joins the Python pip run when both are enabled."""
+        dev_env.config.get.return_value = {"python": True, "brownie": True}
+        
+        with patch('he2plus.dev.shutil.which', return_value="/usr/bin/brownie"), \
+             patch('he2plus.dev.subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert dev_env.setup_environment() is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][-1] == "eth-brownie"
+    
+    def test_setup_environment_skips_unchanged_profile(self, dev_env, setup_cache):
+        """Test that a repeated setup with the same fingerprint runs nothing."""
+        dev_env.config.get.return_value = {"python": True}
+        
+        with patch.object(dev_env, '_setup_python', return_value=True) as mock_python:
+            assert dev_env.setup_environment() is True
+            assert dev_env.setup_environment() is True
+        
+        mock_python.assert_called_once()
+        assert "default" in json.loads(setup_cache.read_text())
+    
+    def test_setup_environment_reruns_changed_profile(self, dev_env):
+        """Test that a changed profile config invalidates the recorded setup."""
+        dev_env.config.get.return_value = {"python": True}
+        
+        with patch.object(dev_env, '_setup_python', return_value=True) as mock_python, \
+             patch.object(dev_env, '_setup_git', return_value=True):
+            dev_env.setup_environment()
+            dev_env.config.get.return_value = {"python": True, "git": True}
+            dev_env.setup_environment()
+        
+        assert mock_python.call_count == 2
+    
+    def test_setup_environment_batches_linux_packages(self, dev_env):
+        """Test that missing Linux tools are installed with one apt run."""
+        dev_env.platform = "linux"
+        dev_env._pkg_mgr = "apt"
+        dev_env.config.get.return_value = {"nodejs": True, "git": True, "docker": True}
+        
+        with patch('he2plus.dev.shutil.which', return_value=None), \
+             patch('he2plus.dev.subprocess.run') as mock_run, \
+             patch.object(dev_env, '_setup_nodejs', return_value=True), \
+             patch.object(dev_env, '_setup_git', return_value=True), \
+             patch.object(dev_env, '_setup_docker', return_value=True):
+            assert dev_env.setup_environment() is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            'sudo', 'apt', 'install', '-y', 'nodejs', 'npm', 'git', 'docker.io', 'docker-compose'
+        ]
+
+    
+    def test_setup_environment_serializes_installs(self, dev_env):
+        """Test that package manager and npm -g installs never overlap across setups."""
+        dev_env.platform = "linux"
+        dev_env._pkg_mgr = "apt"
+        dev_env.config.get.return_value = {"nodejs": True, "git": True, "docker": True,
+                                           "hardhat": True, "react": True}
+        running = []
+        overlaps = []
+        lock = threading.Lock()
+        
+        def install(cmd, **kwargs):
+            with lock:
+                overlaps.extend(other for other in running if other[:2] == cmd[:2])
+                running.append(cmd)
+            time.sleep(0.05)
+            with lock:
+                running.remove(cmd)
+            return Mock(returncode=1)
+        
+        with patch('he2plus.dev.shutil.which', return_value=None), \
+             patch('he2plus.dev.subprocess.run', side_effect=install), \
+             patch.object(dev_env, '_has', side_effect=lambda tool: tool == 'node'):
+            dev_env.setup_environment()
+        
+        assert overlaps == []
+
+    
+    def test_setup_environment_serializes_installs(self, dev_env):
+        """Test that package manager and npm -g installs never overlap across setups."""
+        dev_env.platform = "linux"
+        dev_env._pkg_mgr = "apt"
+        dev_env.config.get.return_value = {"nodejs": True, "git": True, "docker": True,
+                                           "hardhat": True, "react": True}
+        running = []
+        overlaps = []
+        lock = threading.Lock()
+        
+        def install(cmd, **kwargs):
+            with lock:
+                overlaps.extend(other for other in running if other[:2] == cmd[:2])
+                running.append(cmd)
+            time.sleep(0.05)
+            with lock:
+                running.remove(cmd)
+            return Mock(returncode=1)
+        
+        with patch('he2plus.dev.shutil.which', return_value=None), \
+             patch('he2plus.dev.subprocess.run', side_effect=install), \
+             patch.object(dev_env, '_run_streaming', side_effect=lambda cmd: install(cmd).returncode), \
+             patch.object(dev_env, '_has', side_effect=lambda tool: tool == 'node'):
+            dev_env.setup_environment()
+        
+        assert overlaps == []
+
+
+class TestToolDetection:
+    """Test PATH-based tool detection."""
+    
+    def test_has_caches_found_tools(self, dev_env):
+        """Test that found tools are looked up once and misses are retried."""
+        with patch('he2plus.dev.shutil.which', side_effect=lambda tool: "/usr/bin/node" if tool == "node" else None) as mock_which:
+            assert dev_env._has('node') is True
+            assert dev_env._has('node') is True
+            assert dev_env._has('git') is False
+            assert dev_env._has('git') is False
+        
+        assert mock_which.call_count == 3
+    
+    def test_setup_node_checks_share_one_lookup(self, dev_env):
+        """Test that Node.js, Hardhat and React setups look node up only once."""
+        with patch('he2plus.dev.shutil.which', side_effect=lambda tool: "/usr/bin/" + tool) as mock_which, \
+             patch('he2plus.dev.subprocess.run', return_value=Mock(returncode=0)):
+            dev_env.logger.is_enabled_for.return_value = False
+            assert dev_env._setup_nodejs() is True
+            assert dev_env._setup_hardhat() is True
+            assert dev_env._setup_react() is True
+        
+        assert [call[0][0] for call in mock_which.call_args_list].count('node') == 1
+    
+    def test_setup_hardhat_without_node(self, dev_env):
+        """Test that Hardhat setup fails without spawning node when it is missing."""
+        with patch('he2plus.dev.shutil.which', return_value=None), \
+             patch('he2plus.dev.subprocess.run') as mock_run:
+            assert dev_env._setup_hardhat() is False
+        
+        mock_run.assert_not_called()
+    
+    def test_install_git_uses_detected_package_manager(self, dev_env):
+        """Test that Linux installs go straight to the detected package manager."""
+        dev_env.platform = "linux"
+        dev_env._pkg_mgr = "pacman"
+        
+        with patch('he2plus.dev.subprocess.run') as mock_run:
+            assert dev_env._install_git() is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ['sudo', 'pacman', '-S', '--noconfirm', 'git']
+    
+    def test_install_docker_without_package_manager(self, dev_env):
+        """Test that nothing is spawned when no package manager was found."""
+        dev_env.platform = "linux"
+        dev_env._pkg_mgr = None
+        
+        with patch('he2plus.dev.subprocess.run') as mock_run:
+            assert dev_env._install_docker() is False
+        
+        mock_run.assert_not_called()
+
+class TestRunStreaming:
+    """Test streamed output of long installs."""
+    
+    def test_run_streaming_logs_each_line(self, dev_env):
+        """Test that output lines go to the debug log and the exit code is returned."""
+        dev_env.logger.is_enabled_for.return_value = True
+        
+        assert dev_env._run_streaming([sys.executable, '-c', 'print("one"); print("two"); raise SystemExit(3)']) == 3
+        dev_env.logger.debug.assert_any_call("%s", "one")
+        dev_env.logger.debug.assert_any_call("%s", "two")
+    
+    def test_run_streaming_discards_output_without_debug(self, dev_env):
+        """Test that output is discarded without a pipe when debug logging is off."""
+        dev_env.logger.is_enabled_for.return_value = False
+        
+        with patch('he2plus.dev.subprocess.run', return_value=Mock(returncode=0)) as mock_run, \
+             patch('he2plus.dev.subprocess.Popen') as mock_popen:
+            assert dev_env._run_streaming(['npm', 'install', '-g', 'hardhat']) == 0
+        
+        mock_popen.assert_not_called()
+        assert mock_run.call_args[1]["stdout"] == subprocess.DEVNULL
+
+class TestConfigureGit:
+    """Test global Git configuration."""
+    
+    def test_configure_git_writes_new_config_directly(self, dev_env, tmp_path, monkeypatch):
+        """Test that a missing global config is written without running git."""
+        monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+        
+        with patch('pathlib.Path.home', return_value=tmp_path), \
+             patch('he2plus.dev.subprocess.run') as mock_run:
+            assert dev_env._configure_git() is True
+        
+        mock_run.assert_not_called()
+        content = (tmp_path / ".gitconfig").read_text()
+        assert "[user]\n\tname = he2plus User\n" in content
+        assert "defaultBranch = main" in content
+    
+    def test_configure_git_keeps_existing_config(self, dev_env, tmp_path, monkeypatch):
+        """Test that an existing global config is only checked through git."""
+        monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+        (tmp_path / ".gitconfig").write_text("[user]\n\tname = Someone\n")
+        
+        with patch('pathlib.Path.home', return_value=tmp_path), \
+             patch('he2plus.dev.subprocess.run', return_value=Mock(returncode=0, stdout="Someone\n")) as mock_run:
+            assert dev_env._configure_git() is True
+        
+        mock_run.assert_called_once()
+        assert (tmp_path / ".gitconfig").read_text() == "[user]\n\tname = Someone\n"
@@ -0,0 +1,455 @@
+"""Unit tests for the Node.js installer."""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from he2plus.languages.node import NodeInstaller, _probe_version, _run, _run_install
+
+
+@pytest.fixture(autouse=True)
+def node_versions_cache(tmp_path):
+    """Keep the installed versions cache out of the real home directory."""
+    path = tmp_path / "node_versions.json"
+    with patch('he2plus.languages.node._node_versions_cache_path', return_value=path):
+        yield path
+
+
+@pytest.fixture
+def installer():
+    """NodeInstaller on a Linux system with APT and no Node.js."""
+    system_info = Mock(os_name='linux', package_managers=['APT'], node_versions=[])
+    with patch('he2plus.core.system_profiler.get_system_info', return_value=system_info):
+        yield NodeInstaller()
+
+
+class TestNodeInstaller:
+    """Test installer construction."""
+    
+    def test_init_does_not_profile_system(self):
+        """Test that the system profile is only collected when first needed."""
+        with patch('he2plus.core.system_profiler.get_system_info') as mock_info:
+            installer = NodeInstaller()
+            assert installer.get_recommended_version('web') == '20'
+            mock_info.assert_not_called()
+            
+            installer.system_info
+            installer.system_info
+        
+        mock_info.assert_called_once()
+
+    
+    def test_version_tables_are_read_only(self):
+        """Test that the class-level version tables can't be mutated."""
+        assert NodeInstaller.SUPPORTED_VERSIONS == frozenset({'16', '18', '20', '21'})
+        with pytest.raises(TypeError):
+            NodeInstaller.RECOMMENDED_VERSIONS['web'] = '21'
+    
+    def test_is_version_installed(self, installer):
+        """Test membership against the installed versions."""
+        with patch('he2plus.core.system_profiler._find_node_versions', return_value=['18', '20']):
+            assert installer.is_version_installed('18') is True
+            assert installer.is_version_installed('16') is False
+    
+    def test_installed_versions_cached_on_disk(self, installer, node_versions_cache, tmp_path, monkeypatch):
+        """Test that versions are reused until the nvm versions directory changes."""
+        versions_dir = tmp_path / 'nvm' / 'versions' / 'node'
+        versions_dir.mkdir(parents=True)
+        monkeypatch.setenv('NVM_DIR', str(tmp_path / 'nvm'))
+        
+        with patch('he2plus.core.system_profiler._find_node_versions', return_value=['18.19.0']) as mock_find:
+            assert installer.get_installed_versions() == ['18.19.0']
+            assert NodeInstaller().get_installed_versions() == ['18.19.0']
+            assert mock_find.call_count == 1
+            
+            (versions_dir / 'v20.11.0').mkdir()
+            os.utime(versions_dir, ns=(0, 0))
+            NodeInstaller().get_installed_versions()
+            assert mock_find.call_count == 2
+
+
+class TestInstallGlobalPackages:
+    """Test global npm package installation."""
+    
+    def test_install_global_packages_single_npm_run(self, installer):
+        """Test that all packages are installed in one npm invocation."""
+        with patch.object(installer, '_global_packages', return_value={}), \
+             patch('he2plus.languages.node._run', return_value=Mock(returncode=0)) as mock_run:
+            assert installer.install_global_packages(['yarn', 'pnpm']) is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ['npm', 'install', '-g', '--json', 'yarn', 'pnpm']
+    
+    def test_install_global_packages_reports_npm_error(self, installer, capsys):
+        """Test that the npm JSON error summary is reported on failure."""
+        stdout = json.dumps({"error": {"code": "E404", "summary": "Not found - no-such-pkg"}})
+        with patch.object(installer, '_global_packages', return_value={}), \
+             patch('he2plus.languages.node._run',
+                   return_value=Mock(returncode=1, stdout=stdout, stderr="")):
+            assert installer.install_global_packages(['no-such-pkg']) is False
+        
+        assert "Not found - no-such-pkg" in capsys.readouterr().out
+    
+    def test_install_global_packages_empty(self, installer):
+        """Test that nothing is spawned for an empty package list."""
+        with patch('he2plus.languages.node._run') as mock_run:
+            assert installer.install_global_packages([]) is True
+        
+        mock_run.assert_not_called()
+    
+    def test_install_global_packages_skips_installed(self, installer):
+        """Test that packages listed by npm ls -g aren't installed again."""
+        listing = json.dumps({"dependencies": {"yarn": {"version": "1.22.19"},
+                                               "@vue/cli": {"version": "5.0.8"}}})
+        
+        def fake_run(cmd, **kwargs):
+            return Mock(returncode=0, stdout=listing if cmd[1] == 'ls' else "")
+        
+        with patch('he2plus.languages.node._run', side_effect=fake_run) as mock_run:
+            assert installer.install_global_packages(['yarn', '@vue/cli@4.5.0', 'pnpm']) is True
+        
+        assert mock_run.call_count == 2
+        assert mock_run.call_args[0][0] == ['npm', 'install', '-g', '--json', '@vue/cli@4.5.0', 'pnpm']
+    
+    def test_global_packages_without_npm(self, installer):
+        """Test that a failing npm ls -g is treated as nothing installed."""
+        with patch('he2plus.languages.node._run', side_effect=FileNotFoundError):
+            assert installer._global_packages() == {}
+
+
+class TestInstallNode:
+    """Test OS dispatch in install_node."""
+    
+    def test_install_node_dispatches_on_os(self, installer):
+        """Test that the installer method for the detected OS is used."""
+        installer.system_info.os_name = 'darwin'
+        
+        with patch.object(installer, '_install_node_macos', return_value=True) as mock_macos, \
+             patch.object(installer, '_install_node_linux') as mock_linux:
+            assert installer.install_node('18') is True
+        
+        mock_macos.assert_called_once_with('18')
+        mock_linux.assert_not_called()
+    
+    def test_install_node_refreshes_installed_versions(self, installer):
+        """Test that a version installed by install_node then reads as installed."""
+        with patch('he2plus.core.system_profiler._find_node_versions', return_value=[]):
+            assert installer.is_version_installed('18') is False
+        
+        with patch.object(installer, '_install_node_linux', return_value=True), \
+             patch('he2plus.core.system_profiler._find_node_versions', return_value=['18']), \
+             patch('he2plus.languages.node._node_versions_key', return_value=['installed']):
+            assert installer.install_node('18') is True
+            assert installer.is_version_installed('18') is True
+    
+    def test_install_node_unsupported_os(self, installer):
+        """Test that an unknown OS fails without trying any installer."""
+        installer.system_info.os_name = 'plan9'
+        
+        assert installer.install_node('18') is False
+
+
+class TestManagerDetection:
+    """Test nvm and fnm detection."""
+    
+    def test_nvm_detected_from_script(self, installer, tmp_path, monkeypatch):
+        """Test that nvm is found through $NVM_DIR/nvm.sh without spawning it."""
+        (tmp_path / 'nvm.sh').write_text("")
+        monkeypatch.setenv('NVM_DIR', str(tmp_path))
+        
+        with patch('he2plus.languages.node.subprocess.run') as mock_run:
+            assert installer._is_nvm_available() is True
+        
+        mock_run.assert_not_called()
+        cmd = installer._nvm_command(('install', '18'), ('alias', 'default', '18'))
+        assert cmd[:2] == ['bash', '-c']
+        assert cmd[2].endswith('&& nvm install 18 && nvm alias default 18')
+    
+    def test_fnm_detected_once(self, installer):
+        """Test that fnm is looked up on PATH once per installer."""
+        with patch('he2plus.languages.node.shutil.which', return_value=None) as mock_which:
+            assert installer._is_fnm_available() is False
+            assert installer._is_fnm_available() is False
+        
+        mock_which.assert_called_once_with('fnm')
+
+
+class TestVerifyInstallation:
+    """Test Node.js installation verification."""
+    
+    def test_verify_installation_caches_versions(self, installer):
+        """Test that node and npm are only run once across verifications."""
+        with patch('he2plus.languages.node.shutil.which', return_value="/usr/bin/npm"), \
+             patch('he2plus.languages.node._npm_package_version', return_value=None), \
+             patch('he2plus.languages.node._probe_version', return_value="v18.19.0") as mock_probe:
+            assert installer.verify_installation('18') is True
+            assert installer.verify_installation('18') is True
+        
+        assert [call[0][0] for call in mock_probe.call_args_list] == ['node', 'npm']
+    
+    def test_verify_installation_reads_npm_version_from_disk(self, installer, tmp_path):
+        """Test that npm's version comes from its package.json without spawning npm."""
+        npm_dir = tmp_path / 'lib' / 'node_modules' / 'npm'
+        (npm_dir / 'bin').mkdir(parents=True)
+        (npm_dir / 'package.json').write_text(json.dumps({"name": "npm", "version": "10.2.4"}))
+        (npm_dir / 'bin' / 'npm-cli.js').write_text("")
+        
+        with patch('he2plus.languages.node.shutil.which', return_value=str(npm_dir / 'bin' / 'npm-cli.js')), \
+             patch('he2plus.languages.node._probe_version', return_value="v18.19.0") as mock_probe:
+            assert installer.verify_installation('18') is True
+        
+        mock_probe.assert_called_once_with('node')
+        assert installer._npm_version_cache == "10.2.4"
+    
+    def test_verify_installation_without_node(self, installer):
+        """Test that a missing node binary fails without spawning anything."""
+        with patch('he2plus.languages.node.shutil.which', return_value=None), \
+             patch('he2plus.languages.node._run') as mock_run, \
+             patch('he2plus.languages.node.os.posix_spawn', create=True) as mock_spawn:
+            assert installer.verify_installation('18') is False
+        
+        mock_run.assert_not_called()
+        mock_spawn.assert_not_called()
+    
+    def test_install_node_clears_version_cache(self, installer):
+        """Test that a successful install forces the next verification to rerun."""
+        installer._node_version_cache = "v16.0.0"
+        installer._npm_version_cache = "8.0.0"
+        
+        with patch.object(installer, '_install_node_linux', return_value=True):
+            assert installer.install_node('18') is True
+        
+        assert installer._node_version_cache is None
+        assert installer._npm_version_cache is None
+
+
+class TestAvailableManagers:
+    """Test the precomputed set of usable managers."""
+    
+    def test_available_managers_combines_probes(self, installer):
+        """Test that package managers and version managers are resolved together."""
+        with patch.object(NodeInstaller, '_is_nvm_available', return_value=False), \
+             patch.object(NodeInstaller, '_is_fnm_available', return_value=True):
+            assert installer._available_managers == frozenset({'APT', 'fnm'})
+    
+    def test_install_node_linux_uses_available_managers(self, installer):
+        """Test that the Linux install falls through to fnm when APT fails."""
+        installer._available_managers = frozenset({'APT', 'fnm'})
+        
+        def fake_run(cmd, **kwargs):
+            return Mock(returncode=0 if cmd[0] == 'fnm' else 1, stderr="")
+        
+        with patch('he2plus.languages.node._run_install', side_effect=fake_run) as mock_run, \
+             patch('he2plus.languages.node.subprocess.run'):
+            assert installer._install_node_linux('18') is True
+        
+        assert ['fnm', 'install', '18'] in [call[0][0] for call in mock_run.call_args_list]
+    
+    def test_install_node_linux_nvm_single_shell(self, installer):
+        """Test that nvm install, use and alias run in one shell."""
+        installer._available_managers = frozenset({'nvm'})
+        installer._nvm_script = '/home/dev/.nvm/nvm.sh'
+        
+        with patch('he2plus.languages.node._run_install', return_value=Mock(returncode=0)) as mock_run, \
+             patch('he2plus.languages.node.subprocess.run') as mock_subprocess_run:
+            assert installer._install_node_linux('18') is True
+        
+        mock_run.assert_called_once()
+        mock_subprocess_run.assert_not_called()
+        assert mock_run.call_args[0][0][2] == (
+            '. /home/dev/.nvm/nvm.sh && nvm install 18 && nvm use 18 && nvm alias default 18'
+        )
+    
+    def test_install_node_linux_apt_single_run(self, installer):
+        """Test that apt-get update and install share one sudo invocation."""
+        installer._available_managers = frozenset({'APT'})
+        
+        with patch('he2plus.languages.node._run_install', return_value=Mock(returncode=0)) as mock_run:
+            assert installer._install_node_linux('18') is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            'sudo', 'sh', '-c', 'apt-get update && apt-get install -y nodejs npm'
+        ]
+
+
+class TestRun:
+    """Test the subprocess helper."""
+    
+    def test_run_captures_output(self):
+        """Test that output and exit code are returned like subprocess.run."""
+        result = _run([sys.executable, '-c', 'print("out"); raise SystemExit(2)'], timeout=30)
+        
+        assert result.returncode == 2
+        assert result.stdout == "out\n"
+    
+    def test_run_kills_on_timeout(self):
+        """Test that a child outliving its timeout is killed promptly."""
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run([sys.executable, '-c', 'import time; time.sleep(30)'], timeout=0.2)
+        
+        assert time.monotonic() - start < 10
+    
+    def test_run_decodes_invalid_utf8(self):
+        """Test that undecodable output is replaced rather than raising."""
+        result = _run([sys.executable, '-c', 'import sys; sys.stdout.buffer.write(b"ok \\xff")'], timeout=30)
+        
+        assert result.stdout == "ok \ufffd"
+    
+    def test_run_install_keeps_stderr_tail(self):
+        """Test that only the last stderr lines of an install are kept."""
+        script = 'import sys\nfor i in range(1000): print(i); print("err", i, file=sys.stderr)\nsys.exit(1)'
+        result = _run_install([sys.executable, '-c', script], timeout=30)
+        
+        assert result.returncode == 1
+        assert result.stdout is None
+        assert result.stderr.splitlines() == [f"err {i}" for i in range(936, 1000)]
+
+
+    
+    def test_probe_version(self):
+        """Test that a probe returns the --version output of an executable."""
+        with patch('he2plus.languages.node.shutil.which', return_value=sys.executable):
+            assert _probe_version('python').startswith('Python 3.')
+    
+    @pytest.mark.skipif(not hasattr(os, 'posix_spawn'), reason="needs posix_spawn")
+    def test_probe_version_kills_hung_probe(self, tmp_path):
+        """Test that a probe outliving its timeout is killed and reported missing."""
+        exe = tmp_path / 'hang'
+        exe.write_text("#!/bin/sh\nsleep 30\n")
+        exe.chmod(0o755)
+        
+        with patch('he2plus.languages.node.shutil.which', return_value=str(exe)), \
+             patch.dict('he2plus.languages.node._TIMEOUTS', probe=0.2):
+            start = time.monotonic()
+            assert _probe_version('hang') is None
+        
+        assert time.monotonic() - start < 10
+
+    
+    @pytest.mark.skipif(not hasattr(os, 'posix_spawn'), reason="needs posix_spawn")
+    def test_probe_version_closes_pipe_when_spawn_fails(self):
+        """Test that both ends of the probe pipe are closed when the spawn fails."""
+        fds = []
+        real_pipe = os.pipe
+        
+        def pipe():
+            fds.extend(real_pipe())
+            return fds[-2], fds[-1]
+        
+        with patch('he2plus.languages.node.shutil.which', return_value=sys.executable), \
+             patch('he2plus.languages.node.os.pipe', side_effect=pipe), \
+             patch('he2plus.languages.node.os.posix_spawn', side_effect=OSError("spawn failed")):
+            with pytest.raises(OSError):
+                _probe_version('python')
+        
+        assert len(fds) == 2
+        for fd in fds:
+            with pytest.raises(OSError):
+                os.fstat(fd)
+
+
+class TestNodeOrgInstaller:
+    """Test the nodejs.org installer fallback."""
+    
+    @staticmethod
+    def _fake_get(payload, digest):
+        """requests.get stand-in serving SHASUMS256.txt and one installer."""
+        def fake_get(url, **kwargs):
+            response = MagicMock()
+            response.__enter__.return_value = response
+            response.text = f"{digest}  node-v18.20.4.pkg\nabc  node-v18.20.4-x64.msi\n"
+            response.iter_content.return_value = [payload[:4], payload[4:]]
+            return response
+        return fake_get
+    
+    def test_install_node_org_macos_verifies_and_installs(self, installer):
+        """Test that a verified download is installed and then removed."""
+        payload = b"pkg-contents"
+        fake_get = self._fake_get(payload, hashlib.sha256(payload).hexdigest())
+        
+        with patch('requests.get', side_effect=fake_get), \
+             patch('he2plus.languages.node._run_install', return_value=Mock(returncode=0)) as mock_run:
+            assert installer._install_node_org_macos('18') is True
+        
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ['sudo', 'installer', '-pkg']
+        installer_path = Path(cmd[3])
+        assert installer_path.name == 'node-v18.20.4.pkg'
+        assert installer_path.parent != Path(tempfile.gettempdir())
+        assert not installer_path.parent.exists()
+    
+    def test_install_node_org_downloads_into_private_dir(self, installer):
+        """Test that the installer lands in a fresh directory only this user can write to."""
+        payload = b"pkg-contents"
+        fake_get = self._fake_get(payload, hashlib.sha256(payload).hexdigest())
+        seen = {}
+        
+        def run_install(cmd, **kwargs):
+            path = Path(cmd[3])
+            seen['mode'] = path.parent.stat().st_mode & 0o777
+            seen['contents'] = path.read_bytes()
+            return Mock(returncode=0)
+        
+        with patch('requests.get', side_effect=fake_get), \
+             patch('he2plus.languages.node._run_install', side_effect=run_install):
+            assert installer._install_node_org_macos('18') is True
+        
+        assert seen == {'mode': 0o700, 'contents': payload}
+    
+    def test_install_node_org_rejects_checksum_mismatch(self, installer):
+        """Test that a download not matching SHASUMS256.txt is never run."""
+        fake_get = self._fake_get(b"tampered", "0" * 64)
+        
+        with patch('requests.get', side_effect=fake_get), \
+             patch('he2plus.languages.node._run_install') as mock_run:
+            assert installer._install_node_org_macos('18') is False
+        
+        mock_run.assert_not_called()
+
+
+class TestCreateProject:
+    """Test Node.js project creation."""
+    
+    def test_create_basic_project_writes_package_json(self, installer, tmp_path):
+        """Test that a basic project gets package.json without running npm."""
+        with patch('he2plus.languages.node.Path.home', return_value=tmp_path), \
+             patch('he2plus.languages.node._run') as mock_run, \
+             patch('he2plus.languages.node._run_install') as mock_run_install:
+            assert installer.create_project('My App') is True
+        
+        mock_run.assert_not_called()
+        mock_run_install.assert_not_called()
+        package = json.loads((tmp_path / 'My App' / 'package.json').read_text())
+        assert package['name'] == 'my-app'
+        assert package['version'] == '1.0.0'
+    
+    def test_create_react_project_leaves_package_json_to_cra(self, installer, tmp_path):
+        """Test that create-react-app runs in a directory without package.json."""
+        with patch('he2plus.languages.node.Path.home', return_value=tmp_path), \
+             patch('he2plus.languages.node._run_install', return_value=Mock(returncode=0)) as mock_run_install:
+            assert installer.create_project('web', template='react') is True
+        
+        assert mock_run_install.call_args[0][0] == ['npx', 'create-react-app', '.', '--use-npm']
+        assert not (tmp_path / 'web' / 'package.json').exists()
+    
+    def test_create_vue_project_single_npx_run(self, installer, tmp_path):
+        """Test that the Vue CLI is fetched and run by one npx invocation."""
+        with patch('he2plus.languages.node.Path.home', return_value=tmp_path), \
+             patch('he2plus.languages.node._run_install', return_value=Mock(returncode=0)) as mock_run_install:
+            assert installer.create_project('site', template='vue') is True
+        
+        mock_run_install.assert_called_once()
+        assert mock_run_install.call_args[0][0] == [
+            'npx', '--yes', '@vue/cli', 'create', '--default', '--merge', '.'
+        ]
+        assert mock_run_install.call_args[1]['cwd'] == tmp_path / 'site'
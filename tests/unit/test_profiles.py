@@ -335,6 +335,32 @@ class TestBaseProfile:
         assert profile1.is_compatible_with(profile3) is False
         assert profile3.is_compatible_with(profile1) is False
     
+    def test_base_profile_conflicts_checked_both_ways(self):
+        """Test that a conflict on either side makes profiles incompatible."""
+        class ConfigurableProfile(BaseProfile):
+            def __init__(self, components):
+                self._components = components
+                super().__init__()
+            
+            def _initialize_profile(self):
+                self.id = "configurable"
+                self.components = self._components
+        
+        def component(id, conflicts_with=()):
+            return Component(id=id, name=id, description=id, category="tool",
+                             conflicts_with=list(conflicts_with))
+        
+        plain = ConfigurableProfile([component("a"), component("b"), component("c")])
+        conflicting = ConfigurableProfile([component("d", conflicts_with=["c", "x"])])
+        unrelated = ConfigurableProfile([component("e", conflicts_with=["x"])])
+        empty = ConfigurableProfile([])
+        
+        assert plain.is_compatible_with(conflicting) is False
+        assert conflicting.is_compatible_with(plain) is False
+        assert plain.is_compatible_with(unrelated) is True
+        assert unrelated.is_compatible_with(plain) is True
+        assert empty.is_compatible_with(conflicting) is True
+    
     def test_base_profile_validation(self):
         """Test BaseProfile validation."""
         class ValidProfile(BaseProfile):
@@ -0,0 +1,361 @@
+"""Unit tests for the Python installer."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from he2plus.languages.python import (
+    _VERIFY_SCRIPT, install_python_for_use_case, PythonInstaller, _cached_system_info, _pyenv_available, _resolve_python_exe,
+    _run_install,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_caches():
+    """Reset per-process probe caches between tests."""
+    for cached in (_cached_system_info, _pyenv_available, _resolve_python_exe):
+        cached.cache_clear()
+    yield
+    for cached in (_cached_system_info, _pyenv_available, _resolve_python_exe):
+        cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def python_versions_cache(tmp_path):
+    """Keep the installed versions cache out of the real home directory."""
+    path = tmp_path / "python_versions.json"
+    with patch('he2plus.languages.python._python_versions_cache_path', return_value=path):
+        yield path
+
+
+@pytest.fixture
+def installer():
+    """PythonInstaller on a Linux system with Python 3.10."""
+    system_info = Mock(os_name='linux')
+    with patch('he2plus.languages.python.get_system_info', return_value=system_info), \
+         patch('he2plus.languages.python._find_python_versions', return_value=['3.10']), \
+         patch('he2plus.languages.python._PYTHON_BIN_DIRS', ()):
+        yield PythonInstaller()
+
+
+class TestPythonInstaller:
+    """Test installer construction."""
+    
+    def test_system_info_shared_between_installers(self):
+        """Test that the system is only profiled once per process, on first use."""
+        with patch('he2plus.languages.python.get_system_info') as mock_info:
+            first = PythonInstaller()
+            second = PythonInstaller()
+            mock_info.assert_not_called()
+            
+            assert first.system_info is second.system_info
+        
+        mock_info.assert_called_once_with(include_languages=False, include_gpu=False,
+                                          include_package_managers=False)
+    
+    def test_supported_versions_is_a_set(self):
+        """Test that supported versions are a set for membership checks."""
+        assert PythonInstaller.SUPPORTED_VERSIONS == frozenset({'3.8', '3.9', '3.10', '3.11', '3.12'})
+    
+    def test_is_version_installed(self, installer):
+        """Test membership against the installed versions."""
+        assert installer.installed_versions == frozenset({'3.10'})
+        assert installer.is_version_installed('3.10') is True
+        assert installer.is_version_installed('3.11') is False
+
+    
+    def test_is_version_installed_fast_path(self, installer, tmp_path):
+        """Test that an interpreter in a standard location skips the version scan."""
+        (tmp_path / "python3.12").touch()
+        with patch('he2plus.languages.python._PYTHON_BIN_DIRS', (str(tmp_path),)), \
+             patch('he2plus.languages.python._find_python_versions') as mock_find:
+            assert installer.is_version_installed('3.12') is True
+        
+        mock_find.assert_not_called()
+    
+    def test_installed_versions_cached_on_disk(self, installer, python_versions_cache):
+        """Test that a second installer reads the versions from disk."""
+        assert installer.get_installed_versions() == ['3.10']
+        assert json.loads(python_versions_cache.read_text())['versions'] == ['3.10']
+        
+        with patch('he2plus.languages.python._find_python_versions') as mock_find:
+            assert PythonInstaller().get_installed_versions() == ['3.10']
+        
+        mock_find.assert_not_called()
+    
+    def test_installed_versions_cache_invalidated_by_path(self, installer, tmp_path, monkeypatch):
+        """Test that a change to a PATH directory rescans the versions."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        monkeypatch.setenv('PATH', str(bin_dir))
+        installer.get_installed_versions()
+        
+        (bin_dir / "python3.12").touch()
+        with patch('he2plus.languages.python._find_python_versions', return_value=['3.10', '3.12']):
+            assert PythonInstaller().get_installed_versions() == ['3.10', '3.12']
+
+
+class TestPyenvDetection:
+    """Test pyenv detection."""
+    
+    def test_probe_runs_once(self, installer):
+        """Test that pyenv is only spawned on the first check."""
+        with patch('shutil.which', return_value='/usr/bin/pyenv'), \
+             patch('subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert installer._is_pyenv_available() is True
+            assert installer._is_pyenv_available() is True
+        
+        mock_run.assert_called_once()
+    
+    def test_missing_pyenv(self, installer):
+        """Test that a missing pyenv executable reports unavailable without spawning."""
+        with patch('shutil.which', return_value=None), \
+             patch('subprocess.run') as mock_run:
+            assert installer._is_pyenv_available() is False
+        
+        mock_run.assert_not_called()
+
+
+class TestInstallPackages:
+    """Test package installation."""
+    
+    def test_single_pip_run(self, installer):
+        """Test that all packages are installed with one pip run."""
+        with patch('subprocess.run', return_value=Mock(returncode=0, stderr='')) as mock_run:
+            assert installer.install_packages('3.10', ['requests', 'rich']) is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ['python3.10', '-m', 'pip', 'install', '--prefer-binary', 'requests', 'rich']
+    
+    def test_failed_batch_retries_each_package(self, installer):
+        """Test that a failed batch falls back to per-package installs."""
+        results = [
+            Mock(returncode=1, stderr='conflict'),
+            Mock(returncode=0, stderr=''),
+            Mock(returncode=1, stderr='no such package'),
+        ]
+        with patch('subprocess.run', side_effect=results) as mock_run:
+            assert installer.install_packages('3.10', ['requests', 'missing']) is False
+        
+        assert mock_run.call_count == 3
+        assert mock_run.call_args[0][0] == ['python3.10', '-m', 'pip', 'install', '--prefer-binary', 'missing']
+    
+    def test_no_packages(self, installer):
+        """Test that an empty package list doesn't start pip."""
+        with patch('subprocess.run') as mock_run:
+            assert installer.install_packages('3.10', []) is True
+        
+        mock_run.assert_not_called()
+
+
+class TestInstallPython:
+    """Test the OS dispatch of install_python."""
+    
+    def test_install_refreshes_installed_versions(self, installer, python_versions_cache):
+        """Test that a successful install drops the cached installed versions."""
+        assert installer.is_version_installed('3.11') is False
+        assert python_versions_cache.exists()
+        
+        with patch.object(installer, '_install_python_linux', return_value=True), \
+             patch('he2plus.languages.python._find_python_versions', return_value=['3.10', '3.11']):
+            assert installer.install_python('3.11') is True
+            assert installer.is_version_installed('3.11') is True
+    
+    def test_failed_install_keeps_installed_versions(self, installer, python_versions_cache):
+        """Test that a failed install leaves the cached installed versions alone."""
+        assert installer.is_version_installed('3.11') is False
+        
+        with patch.object(installer, '_install_python_linux', return_value=False):
+            assert installer.install_python('3.11') is False
+        
+        assert 'installed_versions' in installer.__dict__
+        assert python_versions_cache.exists()
+
+
+class TestInstallPythonLinux:
+    """Test Linux installation."""
+    
+    def test_uses_manager_on_path(self, installer):
+        """Test that the package manager found on PATH is used."""
+        def which(name):
+            return '/usr/bin/dnf' if name == 'dnf' else None
+        
+        with patch('shutil.which', side_effect=which), \
+             patch('subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert installer._install_python_linux('3.11') is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ['sudo', 'dnf', 'install', '-y', 'python3.11', 'python3.11-pip']
+    
+    def test_fresh_apt_index_skips_update(self, installer, tmp_path):
+        """Test that apt update is skipped when the index was updated recently."""
+        stamp = tmp_path / "update-success-stamp"
+        stamp.touch()
+        with patch('he2plus.languages.python._APT_UPDATE_STAMP', str(stamp)), \
+             patch('shutil.which', side_effect=lambda name: '/usr/bin/apt' if name == 'apt' else None), \
+             patch('subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert installer._install_python_linux('3.11') is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][:3] == ['sudo', 'apt', 'install']
+    
+    def test_stale_apt_index_is_updated(self, installer, tmp_path):
+        """Test that apt update runs when the index is older than an hour."""
+        stamp = tmp_path / "update-success-stamp"
+        stamp.touch()
+        old = time.time() - 7200
+        os.utime(stamp, (old, old))
+        with patch('he2plus.languages.python._APT_UPDATE_STAMP', str(stamp)), \
+             patch('shutil.which', side_effect=lambda name: '/usr/bin/apt' if name == 'apt' else None), \
+             patch('subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert installer._install_python_linux('3.11') is True
+        
+        assert mock_run.call_count == 2
+        assert mock_run.call_args_list[0][0][0] == ['sudo', 'apt', 'update']
+    
+    def test_no_manager_or_pyenv(self, installer):
+        """Test that nothing is spawned when no installer is on PATH."""
+        with patch('shutil.which', return_value=None), \
+             patch('subprocess.run') as mock_run:
+            assert installer._install_python_linux('3.11') is False
+        
+        mock_run.assert_not_called()
+
+
+class TestInstallPythonWindows:
+    """Test Windows installation."""
+    
+    def test_uses_chocolatey_on_path(self, installer):
+        """Test that Chocolatey is used when it's the only manager on PATH."""
+        def which(name):
+            return 'C:\\ProgramData\\chocolatey\\bin\\choco.exe' if name == 'choco' else None
+        
+        with patch('shutil.which', side_effect=which), \
+             patch('subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert installer._install_python_windows('3.11') is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ['choco', 'install', 'python', '--version', '3.11']
+
+
+class TestSetupPip:
+    """Test pip setup."""
+    
+    def test_upgrades_pip(self, installer):
+        """Test that pip is upgraded with one pip run."""
+        with patch('subprocess.run', return_value=Mock(returncode=0, stderr='')) as mock_run:
+            assert installer.setup_pip('3.10') is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ['python3.10', '-m', 'pip', 'install', '--prefer-binary', '--upgrade', 'pip']
+
+
+class TestVerifyInstallation:
+    """Test installation verification."""
+    
+    def test_single_interpreter_run(self, installer):
+        """Test that Python and pip are verified with one interpreter start."""
+        result = Mock(returncode=0, stdout='Python 3.10.12\npip 24.0\n')
+        with patch('subprocess.run', return_value=result) as mock_run:
+            assert installer.verify_installation('3.10') is True
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][:2] == ['python3.10', '-c']
+    
+    def test_pip_missing(self, installer):
+        """Test that a failed pip import fails verification."""
+        result = Mock(returncode=1, stdout='Python 3.10.12\n')
+        with patch('subprocess.run', return_value=result):
+            assert installer.verify_installation('3.10') is False
+    
+    def test_script_reports_versions(self):
+        """Test the verification script against the running interpreter."""
+        result = subprocess.run([sys.executable, '-c', _VERIFY_SCRIPT], capture_output=True, text=True)
+        lines = result.stdout.splitlines()
+        assert lines[0] == f"Python {sys.version.split()[0]}"
+        assert lines[1].startswith('pip ')
+
+
+class TestWindowsInterpreter:
+    """Test resolving interpreters through the Windows py launcher."""
+    
+    LAUNCHER_OUTPUT = (
+        " -V:3.12 *        C:\\Program Files\\Python312\\python.exe\n"
+        " -V:3.11          C:\\Python311\\python.exe\n"
+    )
+    
+    def test_launcher_queried_once(self, installer):
+        """Test that py -0p runs once and later commands use the interpreter path."""
+        installer.system_info.os_name = 'windows'
+        with patch('subprocess.run', return_value=Mock(returncode=0, stdout=self.LAUNCHER_OUTPUT)) as mock_run:
+            assert installer._python_cmd('3.12') == ['C:\\Program Files\\Python312\\python.exe']
+            assert installer._python_cmd('3.12') == ['C:\\Program Files\\Python312\\python.exe']
+        
+        mock_run.assert_called_once()
+    
+    def test_legacy_launcher_output(self):
+        """Test parsing the output of launchers older than Python 3.11."""
+        output = " -3.10-64 *      C:\\Python310\\python.exe\n -3.9-32         C:\\Python39-32\\python.exe\n"
+        with patch('subprocess.run', return_value=Mock(returncode=0, stdout=output)):
+            assert _resolve_python_exe('3.9') == 'C:\\Python39-32\\python.exe'
+    
+    def test_unknown_version_uses_launcher(self, installer):
+        """Test falling back to the launcher for versions it didn't list."""
+        installer.system_info.os_name = 'windows'
+        with patch('subprocess.run', return_value=Mock(returncode=0, stdout=self.LAUNCHER_OUTPUT)):
+            assert installer._python_cmd('3.8') == ['py', '-3.8']
+
+
+class TestRunInstall:
+    """Test the long-running install helper."""
+    
+    def test_keeps_stderr_tail(self):
+        """Test that only the last lines of stderr are kept."""
+        script = "import sys\nfor i in range(1000): print(i, file=sys.stderr)\nsys.exit(3)"
+        result = _run_install([sys.executable, '-c', script], timeout=30)
+        
+        assert result.returncode == 3
+        lines = result.stderr.splitlines()
+        assert len(lines) == 64
+        assert lines[-1] == '999'
+    
+    def test_timeout(self):
+        """Test that an install outliving its timeout is killed."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_install([sys.executable, '-c', 'import time; time.sleep(10)'], timeout=0.5)
+
+
+class TestInstallForUseCase:
+    """Test the install_python_for_use_case convenience function."""
+    
+    @pytest.fixture
+    def system(self):
+        """Linux system where Python 3.11 is already installed."""
+        with patch('he2plus.languages.python.get_system_info', return_value=Mock(os_name='linux')), \
+             patch('he2plus.languages.python._find_python_versions', return_value=['3.11']):
+            yield
+    
+    def test_current_pip_skips_setup(self, system):
+        """Test that a recent pip on an installed interpreter is left alone."""
+        with patch('subprocess.run', return_value=Mock(returncode=0, stdout='24.0\n')) as mock_run:
+            assert install_python_for_use_case('web3') is True
+        
+        mock_run.assert_called_once()
+    
+    def test_old_pip_is_upgraded(self, system):
+        """Test that an old pip is upgraded and the installation verified."""
+        results = [
+            Mock(returncode=0, stdout='21.2.4\n'),
+            Mock(returncode=0, stderr=''),
+            Mock(returncode=0, stdout='Python 3.11.9\npip 24.0\n'),
+        ]
+        with patch('subprocess.run', side_effect=results) as mock_run:
+            assert install_python_for_use_case('web3') is True
+        
+        assert mock_run.call_count == 3
+        assert mock_run.call_args_list[1][0][0][-2:] == ['--upgrade', 'pip']
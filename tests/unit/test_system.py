@@ -5,6 +5,7 @@ from unittest.mock import patch, Mock
 import platform
 
 from he2plus.core.system import SystemProfiler, SystemInfo
+from he2plus.core.system_profiler import get_system_info
 
 
 class TestSystemProfiler:
@@ -26,19 +27,14 @@ class TestSystemProfiler:
     
     def test_profile_basic_info_linux(self, mock_psutil):
         """Test basic system info detection on Linux."""
-        with patch('platform.system') as mock_system, \
-             patch('platform.machine') as mock_machine, \
+        with patch('he2plus.core.system._SYSTEM', "linux"), \
+             patch('he2plus.core.system._MACHINE', "x86_64"), \
              patch('platform.platform') as mock_platform_func, \
-             patch('builtins.open', create=True) as mock_open:
-            
-            mock_system.return_value = "Linux"
-            mock_machine.return_value = "x86_64"
+             patch('he2plus.core.system._read_small') as mock_read:
             mock_platform_func.return_value = "Linux-5.15.0-x86_64"
             
             # Mock /etc/os-release
-            mock_open.return_value.__enter__.return_value = [
-                'PRETTY_NAME="Ubuntu 22.04 LTS"\n'
-            ]
+            mock_read.return_value = b'NAME="Ubuntu"\nPRETTY_NAME="Ubuntu 22.04 LTS"\n'
             
             profiler = SystemProfiler()
             system_info = profiler.profile()
@@ -49,13 +45,10 @@ class TestSystemProfiler:
     
     def test_profile_basic_info_windows(self, mock_psutil):
         """Test basic system info detection on Windows."""
-        with patch('platform.system') as mock_system, \
-             patch('platform.machine') as mock_machine, \
+        with patch('he2plus.core.system._SYSTEM', "windows"), \
+             patch('he2plus.core.system._MACHINE', "amd64"), \
              patch('platform.platform') as mock_platform_func, \
              patch('platform.win32_ver') as mock_win32_ver:
-            
-            mock_system.return_value = "Windows"
-            mock_machine.return_value = "AMD64"
             mock_platform_func.return_value = "Windows-11-10.0.22621"
             mock_win32_ver.return_value = ("11", "10.0.22621", "SP0", "")
             
@@ -66,13 +59,52 @@ class TestSystemProfiler:
             assert system_info.os_version == "11"
             assert system_info.arch == "x86_64"
     
+    def test_profile_defers_expensive_fields(self, mock_psutil):
+        """Test GPU and tool detection only run when those fields are read."""
+        profiler = SystemProfiler()
+        with patch.object(profiler, '_get_gpu_info', return_value=("Apple M4", "Apple", False, True)) as mock_gpu, \
+             patch.object(profiler, '_detect_package_managers', return_value=["brew"]) as mock_managers:
+            
+            system_info = profiler.profile()
+            mock_gpu.assert_not_called()
+            mock_managers.assert_not_called()
+            
+            assert system_info.gpu_name == "Apple M4"
+            assert system_info.metal_available is True
+            assert system_info.package_managers == ["brew"]
+            mock_gpu.assert_called_once()
+            mock_managers.assert_called_once()
+    
+    def test_profile_cache_reuses_stable_fields(self, mock_psutil, tmp_path):
+        """Test profile(use_cache=True) skips OS/CPU/GPU probes on a fresh cache."""
+        with patch('pathlib.Path.home', return_value=tmp_path):
+            first = SystemProfiler()
+            with patch.object(first, '_get_gpu_info', return_value=("Apple M4", "Apple", False, True)):
+                system_info = first.profile(use_cache=True)
+                assert system_info.gpu_name == "Apple M4"
+            
+            assert (tmp_path / ".he2plus" / "cache" / "sysinfo.json").exists()
+            
+            second = SystemProfiler()
+            with patch.object(second, '_get_basic_info') as mock_basic, \
+                 patch.object(second, '_get_cpu_info') as mock_cpu, \
+                 patch.object(second, '_get_gpu_info') as mock_gpu:
+                cached = second.profile(use_cache=True)
+                
+                assert cached.os_name == system_info.os_name
+                assert cached.cpu_name == system_info.cpu_name
+                assert cached.gpu_name == "Apple M4"
+                assert cached.metal_available is True
+                assert cached.ram_total_gb == 16.0  # Always re-probed
+                mock_basic.assert_not_called()
+                mock_cpu.assert_not_called()
+                mock_gpu.assert_not_called()
+    
     def test_get_cpu_info_macos(self, mock_psutil):
         """Test CPU info detection on macOS."""
-        with patch('platform.system') as mock_system, \
+        with patch('he2plus.core.system._SYSTEM', "darwin"), \
              patch('platform.processor') as mock_processor, \
              patch('subprocess.run') as mock_run:
-            
-            mock_system.return_value = "Darwin"
             mock_processor.return_value = "unknown"
             mock_run.return_value.stdout = "Apple M4\n"
             mock_run.return_value.returncode = 0
@@ -85,17 +117,15 @@ class TestSystemProfiler:
     
     def test_get_cpu_info_linux(self, mock_psutil):
         """Test CPU info detection on Linux."""
-        with patch('platform.system') as mock_system, \
+        with patch('he2plus.core.system._SYSTEM', "linux"), \
              patch('platform.processor') as mock_processor, \
-             patch('builtins.open', create=True) as mock_open:
-            
-            mock_system.return_value = "Linux"
+             patch('he2plus.core.system._read_small') as mock_read:
             mock_processor.return_value = "unknown"
             
             # Mock /proc/cpuinfo
-            mock_open.return_value.__enter__.return_value = [
-                'model name\t: Intel Core i7-12700K\n'
-            ]
+            mock_read.return_value = (
+                b'processor\t: 0\nmodel name\t: Intel Core i7-12700K\nflags\t\t: fpu\n'
+            )
             
             profiler = SystemProfiler()
             cpu_name, cpu_cores = profiler._get_cpu_info()
@@ -111,21 +141,44 @@ class TestSystemProfiler:
         assert total_gb == 16.0
         assert available_gb == 8.0
     
-    def test_get_disk_info(self, mock_psutil):
+    def test_get_memory_info_linux_meminfo(self):
+        """Test memory info on Linux is read from /proc/meminfo."""
+        meminfo = (
+            b"MemTotal:       32768000 kB\n"
+            b"MemFree:         1024000 kB\n"
+            b"MemAvailable:   16384000 kB\n"
+        )
+        with patch('he2plus.core.system._SYSTEM', "linux"), \
+             patch('he2plus.core._system_impl._read_small', return_value=meminfo), \
+             patch('psutil.virtual_memory') as mock_memory:
+            
+            profiler = SystemProfiler()
+            total_gb, available_gb = profiler._get_memory_info()
+            
+            assert total_gb == 31.2
+            assert available_gb == 15.6
+            mock_memory.assert_not_called()
+    
+    def test_get_disk_info(self):
         """Test disk info detection."""
-        profiler = SystemProfiler()
-        total_gb, free_gb = profiler._get_disk_info()
+        with patch('os.statvfs') as mock_statvfs:
+            mock_statvfs.return_value = Mock(
+                f_frsize=4096,
+                f_blocks=1000 * 1024**3 // 4096,
+                f_bavail=900 * 1024**3 // 4096,
+            )
+            
+            profiler = SystemProfiler()
+            total_gb, free_gb = profiler._get_disk_info()
         
         assert total_gb == 1000.0
         assert free_gb == 900.0
     
     def test_get_gpu_info_macos(self, mock_psutil):
         """Test GPU info detection on macOS."""
-        with patch('platform.system') as mock_system, \
+        with patch('he2plus.core.system._SYSTEM', "darwin"), \
              patch('subprocess.run') as mock_run:
             
-            mock_system.return_value = "darwin"
-            
             # Mock system_profiler output
             mock_run.return_value.stdout = '{"SPDisplaysDataType": [{"_name": "Apple M4", "sppci_model": "Apple"}]}'
             mock_run.return_value.returncode = 0
@@ -140,11 +193,9 @@ class TestSystemProfiler:
     
     def test_get_gpu_info_linux_nvidia(self, mock_psutil):
         """Test GPU info detection on Linux with NVIDIA."""
-        with patch('platform.system') as mock_system, \
+        with patch('he2plus.core.system._SYSTEM', "linux"), \
              patch('subprocess.run') as mock_run:
             
-            mock_system.return_value = "linux"
-            
             # Mock nvidia-smi output
             mock_run.return_value.stdout = "NVIDIA GeForce RTX 3080\n"
             mock_run.return_value.returncode = 0
@@ -157,6 +208,46 @@ class TestSystemProfiler:
             assert cuda_available is True
             assert metal_available is False
     
+    def test_get_gpu_info_linux_nvml(self, mock_psutil):
+        """Test GPU info detection on Linux through NVML skips nvidia-smi."""
+        with patch('he2plus.core.system._SYSTEM', "linux"), \
+             patch('he2plus.core.system._nvml_gpu_name', return_value="NVIDIA A100"), \
+             patch('subprocess.run') as mock_run:
+            
+            profiler = SystemProfiler()
+            gpu_name, gpu_vendor, cuda_available, metal_available = profiler._get_gpu_info()
+            
+            assert gpu_name == "NVIDIA A100"
+            assert gpu_vendor == "NVIDIA"
+            assert cuda_available is True
+            mock_run.assert_not_called()
+    
+    def test_get_gpu_info_linux_sysfs_vendor(self, mock_psutil):
+        """Test GPU vendor detection on Linux from sysfs when nvidia-smi is missing."""
+        with patch('he2plus.core.system._SYSTEM', "linux"), \
+             patch('subprocess.run', side_effect=FileNotFoundError), \
+             patch('glob.glob', return_value=["/sys/class/drm/card0/device/vendor"]), \
+             patch('he2plus.core._system_impl._read_small', return_value=b"0x1002\n"):
+            
+            profiler = SystemProfiler()
+            gpu_name, gpu_vendor, cuda_available, metal_available = profiler._get_gpu_info()
+            
+            assert gpu_name is None
+            assert gpu_vendor == "AMD"
+            assert cuda_available is False
+    
+    def test_get_gpu_info_windows_vendor_match(self, mock_psutil):
+        """Test GPU vendor matching on Windows adapter names."""
+        with patch('he2plus.core.system._SYSTEM', "windows"), \
+             patch('he2plus.core.system._windows_gpu_name', return_value="AMD Radeon RX 6800"):
+            
+            profiler = SystemProfiler()
+            gpu_name, gpu_vendor, cuda_available, metal_available = profiler._get_gpu_info()
+            
+            assert gpu_name == "AMD Radeon RX 6800"
+            assert gpu_vendor == "AMD"
+            assert cuda_available is False
+    
     def test_detect_package_managers(self, mock_shutil):
         """Test package manager detection."""
         # Mock shutil.which to return True for some package managers
@@ -214,9 +305,7 @@ class TestSystemProfiler:
         
         mock_shutil.side_effect = mock_which
         
-        with patch('platform.system') as mock_system:
-            mock_system.return_value = "darwin"
-            
+        with patch('he2plus.core.system._SYSTEM', "darwin"):
             profiler = SystemProfiler()
             methods = profiler.get_install_methods()
             
@@ -232,9 +321,7 @@ class TestSystemProfiler:
         
         mock_shutil.side_effect = mock_which
         
-        with patch('platform.system') as mock_system:
-            mock_system.return_value = "linux"
-            
+        with patch('he2plus.core.system._SYSTEM', "linux"):
             profiler = SystemProfiler()
             methods = profiler.get_install_methods()
             
@@ -250,9 +337,7 @@ class TestSystemProfiler:
         
         mock_shutil.side_effect = mock_which
         
-        with patch('platform.system') as mock_system:
-            mock_system.return_value = "windows"
-            
+        with patch('he2plus.core.system._SYSTEM', "windows"):
             profiler = SystemProfiler()
             methods = profiler.get_install_methods()
             
@@ -336,3 +421,41 @@ class TestSystemInfo:
         
         assert system_info.package_managers == ["brew", "pip", "npm"]
         assert system_info.languages == {"python": "3.13.7", "node": "v24.9.0"}
+
+
+class TestGetSystemInfo:
+    """Test system_profiler.get_system_info on top of the shared profile."""
+    
+    @pytest.fixture
+    def profiler(self):
+        """Shared profiler whose memory and disk usage change between calls."""
+        profiler = Mock()
+        profiler._get_memory_info.side_effect = [(16.0, 8.0), (16.0, 4.0)]
+        profiler._get_disk_info.side_effect = [(1000.0, 900.0), (1000.0, 700.0)]
+        profiler._detect_package_managers.return_value = ["apt", "pip"]
+        profile = SystemInfo(
+            os_name="Linux", os_version="Ubuntu 24.04", arch="x86_64", platform="Linux-Ubuntu 24.04-x86_64",
+            cpu_name="Test CPU", cpu_cores=8, ram_total_gb=16.0, ram_available_gb=12.0,
+            disk_total_gb=1000.0, disk_free_gb=950.0, profiler=profiler,
+        )
+        with patch('he2plus.core.system_profiler._shared_profiler', return_value=profiler), \
+             patch('he2plus.core.system_profiler._shared_profile', return_value=profile):
+            yield profiler
+    
+    def test_memory_and_disk_read_on_every_call(self, profiler):
+        """Test that free memory and disk space aren't frozen at the first call."""
+        first = get_system_info(include_languages=False, include_gpu=False)
+        second = get_system_info(include_languages=False, include_gpu=False)
+        
+        assert (first.ram_available_gb, first.disk_free_gb) == (8.0, 900.0)
+        assert (second.ram_available_gb, second.disk_free_gb) == (4.0, 700.0)
+    
+    def test_skipped_details_are_not_probed(self, profiler):
+        """Test that GPU and package manager probes only run when asked for."""
+        info = get_system_info(include_languages=False, include_gpu=False,
+                               include_package_managers=False)
+        
+        assert info.gpu_name is None
+        assert info.package_managers == []
+        profiler._resolve_gpu_info.assert_not_called()
+        profiler._detect_package_managers.assert_not_called()
@@ -1,8 +1,14 @@
 """Unit tests for resource validation module."""
 
+from dataclasses import asdict, fields, replace
+
 import pytest
+from unittest.mock import Mock, patch
 
-from he2plus.core.validator import SystemValidator, ProfileRequirements, ValidationResult
+from he2plus.core.system import SystemInfo
+from he2plus.core.validator import (
+    SystemValidator, ProfileRequirements, ValidationResult, _GPU_VENDOR_BITS, _estimate_install_time,
+)
 
 
 class TestProfileRequirements:
@@ -20,7 +26,7 @@ class TestProfileRequirements:
         assert req.cuda_required is False
         assert req.metal_required is False
         assert req.min_os_version is None
-        assert req.supported_archs == ["x86_64", "arm64", "arm"]
+        assert req.supported_archs == frozenset({"x86_64", "arm64", "arm"})
         assert req.internet_required is True
         assert req.download_size_mb == 0.0
     
@@ -111,6 +117,37 @@ class TestSystemValidator:
         assert "Insufficient CPU cores" in result.blocking_issues[0]
         assert result.cpu_sufficient is False
     
+    def test_validate_fast_path_stops_at_first_block(self, mock_system_info, mock_profile_requirements):
+        """Test that fast_path returns after the first blocking issue."""
+        mock_system_info.ram_total_gb = 2.0
+        mock_system_info.cpu_cores = 1
+        
+        validator = SystemValidator(mock_system_info)
+        result = validator.validate(mock_profile_requirements, fast_path=True)
+        
+        assert result.safe_to_install is False
+        assert len(result.blocking_issues) == 1
+        assert "Insufficient RAM" in result.blocking_issues[0]
+        assert result.recommendations == []
+        assert result.estimated_install_time_minutes == 0
+    
+    def test_validate_fast_path_leaves_lazy_fields_unread(self):
+        """Test that fast_path checks don't probe the GPU or package managers they never reach."""
+        profiler = Mock()
+        system = SystemInfo(
+            os_name="Linux", os_version="6.8.0", arch="x86_64", platform="Linux-6.8.0-x86_64",
+            cpu_name="Test CPU", cpu_cores=8, ram_total_gb=8.0, ram_available_gb=4.0,
+            disk_total_gb=500.0, disk_free_gb=400.0, profiler=profiler,
+        )
+        validator = SystemValidator(system)
+        
+        result = validator.validate(ProfileRequirements(ram_gb=64.0, gpu_required=True), fast_path=True)
+        assert result.safe_to_install is False
+        assert validator.validate_multiple_profiles_fast([ProfileRequirements()]) == [True]
+        
+        profiler._resolve_gpu_info.assert_not_called()
+        profiler._detect_package_managers.assert_not_called()
+    
     def test_validate_gpu_required_missing(self, mock_system_info, mock_profile_requirements_gpu):
         """Test validation with GPU required but not available."""
         # Create system without GPU
@@ -145,6 +182,31 @@ class TestSystemValidator:
         assert "Wrong GPU vendor" in result.blocking_issues[0]
         assert result.gpu_sufficient is False
     
+    def test_validate_gpu_unlisted_vendor(self, mock_system_info):
+        """Test vendor matching for vendors outside the known list."""
+        mock_system_info.gpu_name = "Qualcomm Adreno 690"
+        mock_system_info.gpu_vendor = "Qualcomm"
+        validator = SystemValidator(mock_system_info)
+        
+        matching = validator.validate(ProfileRequirements(gpu_required=True, gpu_vendor="Qualcomm"))
+        assert matching.gpu_sufficient is True
+        
+        other = validator.validate(ProfileRequirements(gpu_required=True, gpu_vendor="Moore Threads"))
+        assert other.gpu_sufficient is False
+        assert "Wrong GPU vendor: Qualcomm detected" in other.blocking_issues[0]
+    
+    def test_validate_gpu_vendor_table_is_fixed(self, mock_system_info):
+        """Test that unlisted vendors never get a bit, so they can't collide with each other."""
+        known = dict(_GPU_VENDOR_BITS)
+        mock_system_info.gpu_name = "Some GPU"
+        for detected, required in [("Vendor A", "Vendor B"), ("Vendor B", "Vendor A")]:
+            mock_system_info.gpu_vendor = detected
+            validator = SystemValidator(mock_system_info)
+            result = validator.validate(ProfileRequirements(gpu_required=True, gpu_vendor=required))
+            assert result.gpu_sufficient is False
+        
+        assert _GPU_VENDOR_BITS == known
+    
     def test_validate_cuda_required_missing(self, mock_system_info, mock_profile_requirements_gpu):
         """Test validation with CUDA required but not available."""
         # Create system with NVIDIA GPU but no CUDA
@@ -209,6 +271,27 @@ class TestSystemValidator:
         assert len(result.blocking_issues) > 0
         assert "Unsupported architecture" in result.blocking_issues[0]
     
+    def test_validate_min_os_version(self, mock_system_info):
+        """Test validation against a minimum macOS version."""
+        validator = SystemValidator(mock_system_info)
+        
+        too_new = validator.validate(ProfileRequirements(min_os_version="16.0"))
+        assert too_new.safe_to_install is False
+        assert "OS version too old" in too_new.blocking_issues[0]
+        
+        supported = validator.validate(ProfileRequirements(min_os_version="14.2"))
+        assert supported.safe_to_install is True
+    
+    def test_validate_unparsable_os_version_warning(self, mock_system_info):
+        """Test that an unparsable OS version only produces a warning."""
+        mock_system_info.os_version = "Sequoia"
+        
+        validator = SystemValidator(mock_system_info)
+        result = validator.validate(ProfileRequirements(min_os_version="14.0"))
+        
+        assert result.safe_to_install is True
+        assert "Could not parse OS version for comparison" in result.warnings
+    
     def test_validate_low_available_ram_warning(self, mock_system_info, mock_profile_requirements):
         """Test validation with low available RAM warning."""
         # Create system with low available RAM
@@ -259,6 +342,95 @@ class TestSystemValidator:
         assert combined_result.estimated_download_mb == 7.0  # 5 + 0 + 2
         assert combined_result.disk_space_after_gb == 883.0  # 900 - 17
     
+    def test_validate_multiple_profiles_combined_totals(self, mock_system_info):
+        """Test that the combined result checks the summed RAM and disk needs."""
+        validator = SystemValidator(mock_system_info)
+        
+        requirements_list = [
+            ProfileRequirements(ram_gb=10.0, disk_gb=100.0),
+            ProfileRequirements(ram_gb=10.0, disk_gb=100.0),
+        ]
+        
+        results = validator.validate_multiple_profiles(requirements_list)
+        
+        assert results["profile_0"].safe_to_install is True
+        assert results["profile_1"].safe_to_install is True
+        combined_result = results["combined"]
+        assert combined_result.safe_to_install is False
+        assert combined_result.ram_sufficient is False
+        assert combined_result.disk_sufficient is True
+        assert "Insufficient RAM" in combined_result.blocking_issues[0]
+        assert combined_result.disk_space_after_gb == 700.0
+    
+    def test_validate_multiple_profiles_combined_keeps_profile_issues(self, mock_system_info):
+        """Test that the combined result reports why a failing profile is blocked."""
+        validator = SystemValidator(mock_system_info)
+        
+        requirements_list = [
+            ProfileRequirements(cpu_cores=32),
+            ProfileRequirements(cpu_cores=32),
+            ProfileRequirements(ram_gb=1.0),
+        ]
+        
+        results = validator.validate_multiple_profiles(requirements_list)
+        
+        assert results["profile_0"].safe_to_install is False
+        combined_result = results["combined"]
+        assert combined_result.safe_to_install is False
+        assert combined_result.cpu_sufficient is False
+        assert len(combined_result.blocking_issues) == 1
+        assert combined_result.blocking_issues == results["profile_0"].blocking_issues
+    
+    def test_validate_multiple_profiles_fast(self, mock_system_info, mock_profile_requirements):
+        """Test batch pass/fail validation of multiple profiles."""
+        validator = SystemValidator(mock_system_info)
+        
+        requirements_list = [
+            mock_profile_requirements,
+            ProfileRequirements(ram_gb=64.0),
+            ProfileRequirements(disk_gb=2000.0),
+            ProfileRequirements(cpu_cores=32),
+            ProfileRequirements(supported_archs=["x86_64"]),
+        ]
+        
+        assert validator.validate_multiple_profiles_fast(requirements_list) == [
+            True, False, False, False, False
+        ]
+        assert validator.validate_multiple_profiles_fast([]) == []
+    
+    def test_validate_recommendations_are_a_field(self, mock_system_info, mock_profile_requirements):
+        """Test that recommendations are kept by fields(), asdict() and equality."""
+        mock_system_info.package_managers = []
+        validator = SystemValidator(mock_system_info)
+        
+        with patch('he2plus.core.validator._generate_recommendations',
+                   return_value=["Install a package manager"]):
+            result = validator.validate(mock_profile_requirements)
+        
+        assert [f.name for f in fields(ValidationResult)][:4] == [
+            "safe_to_install", "blocking_issues", "warnings", "recommendations"
+        ]
+        assert asdict(result)["recommendations"] == ["Install a package manager"]
+        assert result != replace(result, recommendations=[])
+    
+    def test_validate_fast_path_skips_recommendations(self, mock_system_info, mock_profile_requirements):
+        """Test that fast_path leaves recommendations to get_recommendations()."""
+        mock_system_info.package_managers = []
+        validator = SystemValidator(mock_system_info)
+        
+        with patch('he2plus.core.validator._generate_recommendations') as mock_generate:
+            result = validator.validate(mock_profile_requirements, fast_path=True)
+        
+        assert result.safe_to_install is True
+        assert result.recommendations == []
+        mock_generate.assert_not_called()
+        assert validator.get_recommendations(mock_profile_requirements) == (
+            validator.validate(mock_profile_requirements).recommendations
+        )
+        assert "Install a package manager (brew, apt, choco) for easier setup" in (
+            validator.get_recommendations(mock_profile_requirements)
+        )
+    
     def test_get_optimization_suggestions(self, mock_system_info):
         """Test optimization suggestions."""
         validator = SystemValidator(mock_system_info)
@@ -284,6 +456,12 @@ class TestSystemValidator:
         # GPU requirements should add more time
         assert result.estimated_install_time_minutes > 10
         assert isinstance(result.estimated_install_time_minutes, int)
+    
+    def test_estimate_install_time_values(self):
+        """Test the installation time estimate for known inputs."""
+        assert _estimate_install_time(0.0, 1.0, False, False) == 5
+        assert _estimate_install_time(600.0, 10.0, False, False) == 11
+        assert _estimate_install_time(600.0, 10.0, True, False) == 21
 
 
 class TestValidationResult: